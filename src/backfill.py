@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+게시판 전체 보관 수집(backfill)
+RSS 피드는 최근 게시글만 보여 주므로, 게시판 목록 페이지(selectNttList.do)를 처음부터 끝까지
+넘기면서 과거 게시글을 data/archive/<저장소 키>.json에 보관하는 모듈입니다.
+(기본 학교는 notices.json, 다른 학교는 <학교 id>/notices.json처럼 school_registry의 학교별 키 사용)
+
+- 한 번에 BACKFILL_CONCURRENCY개 페이지만 동시에 요청하고, 묶음 사이에 쉬어
+  학교 서버에 부하가 몰리지 않게 합니다.
+- 완료한 페이지를 체크포인트에 기록하므로 중단된 뒤 다시 실행하면 이어서 수집합니다.
+- 게시글은 crawl_state와 같은 식별자(nttSn)로 구분하며, 증분 크롤링 상태나 보관소에
+  이미 있는 게시글은 다시 저장하지 않습니다.
+- 새로 보관한 게시글은 수집 데이터 저장소(content_store)에도 넣어 RSS 피드 등에서 함께 조회합니다.
+
+사용법:
+    cd src
+    python backfill.py notice              # 공지사항 전체 수집 (이어서)
+    python backfill.py letter --max-pages 50
+    python backfill.py notice --restart    # 체크포인트를 무시하고 처음부터
+    python backfill.py notice --school dongsan-m   # 등록된 다른 학교
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import time
+import content_store
+import crawl_state
+import date_utils
+import http_client
+from bs4 import BeautifulSoup
+from board_crawler import BOARDS
+from concurrent_fetch import run_concurrently
+from school_registry import get_school, source_key
+
+ARCHIVE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'archive')
+
+# 게시판 목록/본문 페이지 URL 형식
+LIST_PAGE_PATH = "/{site_id}/na/ntt/selectNttList.do"
+VIEW_PAGE_PATH = "/{site_id}/na/ntt/selectNttInfo.do?mi={mi}&bbsId={bbsId}&nttSn={nttSn}"
+
+# 동시 요청 페이지 수와 묶음 사이 대기 시간 (초) - 환경변수로 조정 가능
+BACKFILL_CONCURRENCY = int(os.getenv("BACKFILL_CONCURRENCY", "3"))
+BACKFILL_DELAY = float(os.getenv("BACKFILL_DELAY", "1.0"))
+# 목록 페이지 하나의 제한 시간 (초)
+PAGE_TIMEOUT = 60
+
+# 목록의 링크/onclick에서 게시글 번호(nttSn) 추출
+NTT_SN_PATTERN = re.compile(r'nttSn=(\d+)')
+DATE_TEXT_PATTERN = re.compile(r'^\d{4}[-./]\d{1,2}[-./]\d{1,2}')
+
+
+def _site_parts(site_url):
+    base, site_id = site_url.rstrip('/').rsplit('/', 1)
+    return base, site_id
+
+
+def _archive_paths(key):
+    # 학교별 키("dongsan-m/notices")는 학교 디렉터리 아래에 저장
+    path = os.path.join(ARCHIVE_DIR, *key.split('/'))
+    return f"{path}.json", f"{path}.checkpoint.json"
+
+
+def _load_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _save_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def load_archive(key):
+    """
+    보관된 게시글을 읽습니다. (게시글 식별자 -> 게시글)
+
+    Args:
+        key (str): 학교별 저장소 키 (source_key(school, "notices") 등)
+    """
+    return _load_json(_archive_paths(key)[0], {})
+
+
+def _find_ntt_sn(anchor):
+    # onclick 인자 중 아무 숫자나 잡으면 mi/bbsId를 게시글 번호로 오인하므로 명시된 값만 사용
+    for name in ("data-ntt-sn", "data-id"):
+        value = str(anchor.get(name, "")).strip()
+        if value.isdigit():
+            return value
+    match = NTT_SN_PATTERN.search(" ".join(str(anchor.get(name, "")) for name in ("href", "onclick")))
+    return match.group(1) if match else None
+
+
+def parse_list_page(html, board, site_url):
+    """
+    게시판 목록 페이지 HTML에서 게시글 목록을 추출합니다.
+
+    Args:
+        html (str): 목록 페이지 HTML
+        board (dict): BOARDS의 게시판 설정
+        site_url (str): 학교 홈페이지 주소
+
+    Returns:
+        list: 게시글 정보 목록 (board_crawler와 같은 형식)
+    """
+    base, site_id = _site_parts(site_url)
+    source = f"archive:{board['items_key']}"
+    soup = BeautifulSoup(html, 'html.parser')
+    items = []
+
+    for row in soup.select('tbody tr'):
+        anchor = row.find('a')
+        if anchor is None:
+            continue
+        title = anchor.get_text(" ", strip=True)
+        if not title:
+            continue
+
+        ntt_sn = _find_ntt_sn(anchor)
+        if not ntt_sn:
+            # 게시글 번호가 없으면 RSS와 같은 식별자를 만들 수 없으므로 건너뜀
+            logging.warning(f"{board['label']} 목록에서 게시글 번호를 찾지 못함: {title}")
+            continue
+        url = base + VIEW_PAGE_PATH.format(site_id=site_id, mi=board["mi"], bbsId=board["bbsId"], nttSn=ntt_sn)
+
+        cell_elements = row.find_all('td')
+        cells = [cell.get_text(" ", strip=True) for cell in cell_elements]
+        title_cell = anchor.find_parent('td')
+        title_index = next((i for i, cell in enumerate(cell_elements) if cell is title_cell), -1)
+        date_text = next((text for text in cells if DATE_TEXT_PATTERN.match(text)), "")
+        writer_cell = row.find('td', class_=re.compile('writer|author'))
+        if writer_cell is not None:
+            author = writer_cell.get_text(" ", strip=True)
+        elif 0 <= title_index < len(cells) - 1 and not DATE_TEXT_PATTERN.match(cells[title_index + 1]):
+            author = cells[title_index + 1]
+        else:
+            author = ""
+        views = cells[-1] if cells and cells[-1].isdigit() else "0"
+
+        published = date_utils.parse_date(date_text, source)
+        item = {
+            "id": crawl_state.item_identity(url, title),
+            "number": cells[0] if cells else "",
+            "title": title,
+            "author": author,
+            "date": published.strftime('%Y-%m-%d') if published else date_text,
+            "published": published.isoformat() if published else "",
+            "views": views,
+            "url": url
+        }
+        item.update(board.get("extra_fields", {}))
+        items.append(item)
+
+    return items
+
+
+def fetch_list_page(board, page, site_url):
+    """
+    게시판 목록 페이지 하나를 가져와 게시글 목록을 반환합니다.
+
+    Raises:
+        requests.RequestException: 요청 실패 또는 오류 응답
+    """
+    base, site_id = _site_parts(site_url)
+    params = {"mi": board["mi"], "bbsId": board["bbsId"], "currPage": page}
+    response = http_client.get(base + LIST_PAGE_PATH.format(site_id=site_id), params=params)
+    response.raise_for_status()
+    return parse_list_page(response.text, board, site_url)
+
+
+def backfill_board(board_key, school=None, max_pages=None, concurrency=BACKFILL_CONCURRENCY,
+                   delay=BACKFILL_DELAY, restart=False):
+    """
+    게시판 목록 페이지를 모두 넘기면서 과거 게시글을 보관소에 저장합니다.
+
+    Args:
+        board_key (str): BOARDS의 게시판 키 (예: "notice")
+        school (dict, optional): school_registry의 학교 정보, 없으면 기본 학교
+        max_pages (int, optional): 최대 페이지 번호
+        concurrency (int): 동시에 요청할 페이지 수
+        delay (float): 페이지 묶음 사이 대기 시간 (초)
+        restart (bool): 체크포인트를 무시하고 처음부터 수집
+
+    Returns:
+        dict: {"pages": 수집한 페이지 수, "added": 새로 보관한 게시글 수,
+               "skipped": 중복으로 건너뛴 게시글 수, "failed_pages": 실패한 페이지 목록,
+               "finished": 마지막 페이지까지 수집했는지 여부}
+    """
+    board = BOARDS[board_key]
+    school = school or get_school()
+    site_url = school["site_url"]
+    # 증분 크롤러와 같은 학교별 키로 보관소, 상태, 저장소를 구분
+    key = source_key(school, board["items_key"])
+    archive_path, checkpoint_path = _archive_paths(key)
+
+    archive = load_archive(key)
+    checkpoint = {} if restart else _load_json(checkpoint_path, {})
+    completed = set(checkpoint.get("completed_pages", []))
+    end_page = checkpoint.get("end_page")
+    # 증분 크롤링이 이미 가지고 있는 게시글
+    known = crawl_state.known_hashes(key)
+
+    stats = {"pages": 0, "added": 0, "skipped": 0, "failed_pages": [], "finished": False}
+    if end_page is not None and all(page in completed for page in range(1, end_page + 1)):
+        print(f"{board['label']}: 이미 마지막 페이지({end_page})까지 수집했습니다. (--restart로 다시 수집)")
+        stats["finished"] = True
+        return stats
+
+    page = 1
+    while True:
+        last = end_page or max_pages
+        batch = []
+        while len(batch) < concurrency and (last is None or page <= last):
+            if page not in completed:
+                batch.append(page)
+            page += 1
+        if not batch:
+            stats["finished"] = end_page is not None
+            break
+
+        results = run_concurrently({
+            p: ((lambda p=p: fetch_list_page(board, p, site_url)), PAGE_TIMEOUT) for p in batch
+        })
+
+        if all(results[p] is None for p in batch):
+            logging.error(f"{board['label']} 목록 페이지 {batch} 요청이 모두 실패하여 중단합니다.")
+            stats["failed_pages"].extend(batch)
+            break
+
+        new_items = []
+        for p in batch:
+            items = results[p]
+            if items is None:
+                stats["failed_pages"].append(p)
+                continue
+            completed.add(p)
+            stats["pages"] += 1
+            if not items:
+                # 게시글이 없는 페이지 = 게시판의 끝
+                end_page = p - 1 if end_page is None else min(end_page, p - 1)
+                continue
+            for item in items:
+                if item["id"] in archive or item["id"] in known:
+                    stats["skipped"] += 1
+                    continue
+                archive[item["id"]] = item
+                new_items.append(item)
+                stats["added"] += 1
+
+        # 묶음마다 보관소와 체크포인트 저장 (중단되어도 이어서 수집)
+        _save_json(archive_path, archive)
+        _save_json(checkpoint_path, {"completed_pages": sorted(completed), "end_page": end_page})
+        content_store.upsert_items(key, new_items)
+        logging.info(f"{board['label']} 보관 수집: {batch[0]}~{batch[-1]} 페이지, 누적 {len(archive)}개")
+        print(f"{board['label']} {batch[0]}~{batch[-1]} 페이지 완료 (새 게시글 {stats['added']}개)")
+
+        if end_page is not None and page > end_page:
+            stats["finished"] = not stats["failed_pages"]
+            break
+        time.sleep(delay)
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시판 과거 게시글 보관 수집")
+    parser.add_argument("board", choices=sorted(BOARDS), help="게시판 (notice: 공지사항, letter: 가정통신문)")
+    parser.add_argument("--school", default=None, help="학교 id (없으면 기본 학교)")
+    parser.add_argument("--max-pages", type=int, default=None, help="최대 페이지 번호")
+    parser.add_argument("--concurrency", type=int, default=BACKFILL_CONCURRENCY, help="동시에 요청할 페이지 수")
+    parser.add_argument("--delay", type=float, default=BACKFILL_DELAY, help="페이지 묶음 사이 대기 시간 (초)")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 수집")
+    args = parser.parse_args()
+
+    stats = backfill_board(args.board, get_school(args.school), max_pages=args.max_pages, concurrency=args.concurrency,
+                           delay=args.delay, restart=args.restart)
+    print(f"수집 페이지 {stats['pages']}개, 새 게시글 {stats['added']}개, 중복 {stats['skipped']}개")
+    if stats["failed_pages"]:
+        print(f"실패한 페이지 (다시 실행하면 이어서 수집): {stats['failed_pages']}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
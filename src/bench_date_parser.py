@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+날짜 파싱 성능 비교
+이전 strptime 연쇄 시도 방식과 date_utils의 소스별 형식 캐시 방식을 비교하는 스크립트입니다.
+
+사용법:
+    cd src
+    python bench_date_parser.py [항목 수]
+"""
+
+import sys
+import timeit
+from datetime import datetime
+import date_utils
+
+# 피드별 샘플 날짜 (실제 RSS/게시판에서 볼 수 있는 형식)
+SAMPLES = {
+    "rss_gmt": "Wed, 02 Jul 2025 23:17:42 GMT",
+    "rss_offset": "Mon, 24 Jun 2025 10:30:00 +0900",
+    "iso": "2025-09-25T19:16:27",
+    "ymd_time": "2025-06-24 16:03:22",
+}
+
+# rss_feed_generator의 이전 형식 목록
+LEGACY_FEED_FORMATS = [
+    '%Y-%m-%d',
+    '%Y.%m.%d',
+    '%Y/%m/%d',
+    '%Y-%m-%d %H:%M',
+    '%Y.%m.%d %H:%M',
+    '%Y/%m/%d %H:%M',
+    '%Y-%m-%d %H:%M:%S',
+]
+
+
+def legacy_format_date(date_text):
+    """board_crawler.format_date의 이전 구현 (strptime 연쇄 시도)"""
+    try:
+        if 'GMT' in date_text:
+            date_obj = datetime.strptime(date_text, "%a, %d %b %Y %H:%M:%S GMT")
+        elif 'T' in date_text:
+            date_obj = datetime.strptime(date_text.split('T')[0], "%Y-%m-%d")
+        else:
+            try:
+                date_obj = datetime.strptime(date_text, "%a, %d %b %Y %H:%M:%S %z")
+            except ValueError:
+                date_obj = datetime.strptime(date_text, "%Y-%m-%d %H:%M:%S")
+        return date_obj.strftime('%Y-%m-%d')
+    except ValueError:
+        if 'T' in date_text:
+            return date_text.split('T')[0]
+        return date_text
+
+
+def legacy_feed_date(date_text):
+    """rss_feed_generator의 이전 구현 (7개 형식 순차 시도)"""
+    for fmt in LEGACY_FEED_FORMATS:
+        try:
+            return datetime.strptime(date_text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def run(count=5000, repeat=5):
+    print(f"항목 {count}개 x {repeat}회 중 최솟값 (초)")
+    print(f"{'형식':<12} {'이전 방식':>10} {'date_utils':>11} {'배율':>6}")
+    for name, text in SAMPLES.items():
+        items = [text] * count
+        legacy = min(timeit.repeat(lambda: [legacy_format_date(t) for t in items], number=1, repeat=repeat))
+        fast = min(timeit.repeat(lambda: [date_utils.normalize_date(t, name) for t in items], number=1, repeat=repeat))
+        print(f"{name:<12} {legacy:>10.4f} {fast:>11.4f} {legacy / fast:>5.1f}x")
+
+    # 피드 생성기: 정규화된 YYYY-MM-DD 날짜 (목록의 끝쪽 형식일수록 이전 방식이 느림)
+    for text in ("2025-06-24", "2025-06-24 16:03:22"):
+        items = [text] * count
+        legacy = min(timeit.repeat(lambda: [legacy_feed_date(t) for t in items], number=1, repeat=repeat))
+        fast = min(timeit.repeat(lambda: [date_utils.parse_date(t, "feed") for t in items], number=1, repeat=repeat))
+        label = f"feed:{len(text)}"
+        print(f"{label:<12} {legacy:>10.4f} {fast:>11.4f} {legacy / fast:>5.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
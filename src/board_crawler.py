@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+학교 홈페이지 게시판 RSS 크롤러 엔진
+공지사항, 가정통신문 등 selectRssFeed.do 기반 게시판을 하나의 파서로 크롤링하는 모듈입니다.
+게시판을 추가하려면 BOARDS에 mi/bbsId 설정만 추가하면 됩니다.
+"""
+
+import content_store
+import crawl_state
+import date_utils
+import http_cache
+import logging
+import re
+import requests
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from urllib.parse import urljoin
+
+# 게시판 RSS 피드 URL 형식
+RSS_FEED_PATH = "/{site_id}/na/ntt/selectRssFeed.do?mi={mi}&bbsId={bbsId}"
+
+# 게시판 설정 (mi/bbsId로 게시판을 구분)
+BOARDS = {
+    "notice": {
+        "label": "공지사항",
+        "mi": "10151",
+        "bbsId": "6774",
+        "items_key": "notices",
+        "extra_fields": {}
+    },
+    "letter": {
+        "label": "가정통신문",
+        "mi": "10153",
+        "bbsId": "6776",
+        "items_key": "letters",
+        "extra_fields": {"has_attachment": False}
+    },
+}
+
+SITE_NAME_PATTERN = re.compile(r'https?://(?:www\.)?([^/]+)')
+BASE_URL_PATTERN = re.compile(r'https?://[^/]+')
+
+# 항목 태그 (RSS 2.0, Atom, RSS 1.0) - 네임스페이스를 제외한 태그명
+ITEM_TAGS = frozenset(["item", "entry"])
+
+
+def _local_name(tag):
+    """네임스페이스를 제외한 태그명을 반환합니다."""
+    return tag.rsplit('}', 1)[-1] if tag[:1] == '{' else tag
+
+
+def _strip_cdata(text):
+    """이스케이프되어 문자열로 남은 CDATA 태그를 제거합니다."""
+    if text and text.startswith('<![CDATA['):
+        return text[9:-3]
+    return text or ""
+
+
+def _text_extractor(elem):
+    return _strip_cdata(elem.text)
+
+
+def _link_extractor(elem):
+    # Atom 형식은 href 속성에 링크가 있음
+    return _strip_cdata(elem.text) or elem.get('href', "")
+
+
+# 필드 추출기 (태그명 -> (필드명, 추출 함수)), 모듈 로드 시 한 번만 구성
+FIELD_EXTRACTORS = {
+    "title": ("title", _text_extractor),
+    "link": ("link", _link_extractor),
+    "pubDate": ("date", _text_extractor),
+    "updated": ("date", _text_extractor),
+    "published": ("date", _text_extractor),
+    "date": ("date", _text_extractor),
+    "author": ("author", _text_extractor),
+    "creator": ("author", _text_extractor),
+}
+
+
+def format_date(date_text, source=None):
+    """
+    RSS 날짜 문자열을 YYYY-MM-DD 형식으로 변환합니다.
+
+    Args:
+        date_text (str): RSS 피드의 날짜 문자열
+        source (str, optional): 날짜 형식을 기억할 소스 이름 (피드 URL)
+
+    Returns:
+        str: 변환된 날짜 (변환 실패 시 원본 문자열)
+    """
+    parsed = date_utils.parse_date(date_text, source)
+    if parsed:
+        return parsed.strftime('%Y-%m-%d')
+    # 형식을 알 수 없는 ISO 형식 (예: 2025-06-24T16:03)
+    if date_text and 'T' in date_text:
+        return date_text.split('T')[0]
+    return date_text or ""
+
+
+def board_rss_url(site_url, board):
+    """
+    학교 홈페이지 주소와 게시판 설정으로 RSS 피드 URL을 만듭니다.
+
+    Args:
+        site_url (str): 학교 홈페이지 주소 (예: https://yulgok-m.goepj.kr/yulgok-m)
+        board (dict): BOARDS의 게시판 설정
+
+    Returns:
+        str: 게시판 RSS 피드 URL
+    """
+    base, site_id = site_url.rstrip('/').rsplit('/', 1)
+    return base + RSS_FEED_PATH.format(site_id=site_id, mi=board["mi"], bbsId=board["bbsId"])
+
+
+def _base_url(url):
+    base_match = BASE_URL_PATTERN.search(url)
+    return base_match.group(0) if base_match else None
+
+
+def _parse_item(elem, base_url, extra_fields, number, source=None):
+    """
+    게시글 요소 하나에서 게시글 정보를 추출합니다. 실패하면 None을 반환합니다.
+    date는 YYYY-MM-DD, published는 시간대를 유지한 ISO 8601 작성 시각입니다.
+    """
+    try:
+        fields = {"title": "", "link": "", "date": "", "author": ""}
+        for child in elem:
+            if not isinstance(child.tag, str):
+                continue
+            extractor = FIELD_EXTRACTORS.get(_local_name(child.tag))
+            # 같은 필드가 여러 번 나오면 첫 번째 값을 사용
+            if extractor and not fields[extractor[0]]:
+                fields[extractor[0]] = extractor[1](child)
+
+        # 상대 경로인 경우 절대 경로로 변환
+        link = fields["link"]
+        if link and not link.startswith('http') and base_url:
+            link = urljoin(base_url, link)
+
+        published = date_utils.parse_date(fields["date"], source)
+        item_data = {
+            "id": crawl_state.item_identity(link, fields["title"]),
+            "number": str(number),
+            "title": fields["title"],
+            "author": fields["author"],
+            "date": published.strftime('%Y-%m-%d') if published else format_date(fields["date"]),
+            "published": published.isoformat() if published else "",
+            "views": "0",
+            "url": link
+        }
+        item_data.update(extra_fields)
+        return item_data
+    except Exception as e:
+        logging.error(f"RSS 항목 파싱 중 오류 발생: {e}")
+        return None
+
+
+def parse_board_items(root, board, url):
+    """
+    RSS XML 트리를 한 번 순회하면서 게시글 목록을 추출합니다.
+
+    Args:
+        root (Element): RSS XML 루트 요소
+        board (dict): BOARDS의 게시판 설정
+        url (str): RSS 피드 URL (상대 경로 링크 변환용)
+
+    Returns:
+        list: 게시글 정보 목록
+    """
+    base_url = _base_url(url)
+    extra_fields = board.get("extra_fields", {})
+    items = []
+
+    for elem in root.iter():
+        if not isinstance(elem.tag, str) or _local_name(elem.tag) not in ITEM_TAGS:
+            continue
+        item_data = _parse_item(elem, base_url, extra_fields, len(items) + 1, source=url)
+        if item_data is not None:
+            items.append(item_data)
+
+    return items
+
+
+def iter_board_items(chunks, board, url, limit=None, known=None):
+    """
+    RSS 본문 조각을 받는 대로 파싱하면서 게시글을 하나씩 돌려줍니다.
+    처리한 게시글 요소는 바로 메모리에서 제거하고, limit개를 채우거나
+    이미 수집한(내용이 같은) 게시글을 만나면 남은 본문을 읽지 않고 멈춥니다.
+
+    Args:
+        chunks (iterable): 응답 본문 조각(bytes) 반복자
+        board (dict): BOARDS의 게시판 설정
+        url (str): RSS 피드 URL (상대 경로 링크 변환용)
+        limit (int, optional): 최대 게시글 수
+        known (dict, optional): 게시글 식별자 -> 내용 해시 (crawl_state.known_hashes())
+
+    Yields:
+        dict: 게시글 정보
+
+    Raises:
+        xml.etree.ElementTree.ParseError: XML 형식 오류
+    """
+    base_url = _base_url(url)
+    extra_fields = board.get("extra_fields", {})
+    parser = ET.XMLPullParser(events=("start", "end"))
+    # 현재 열려 있는 요소 (게시글 요소의 부모를 찾기 위함)
+    open_elements = []
+    count = 0
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                open_elements.append(elem)
+                continue
+            open_elements.pop()
+            if not isinstance(elem.tag, str) or _local_name(elem.tag) not in ITEM_TAGS:
+                continue
+
+            item_data = _parse_item(elem, base_url, extra_fields, count + 1, source=url)
+            elem.clear()
+            if open_elements:
+                open_elements[-1].remove(elem)
+            if item_data is None:
+                continue
+            if known is not None and known.get(item_data["id"]) == crawl_state.item_hash(item_data):
+                return
+            yield item_data
+            count += 1
+            if limit and count >= limit:
+                return
+    parser.close()
+
+
+def _removed_ids(changes, items):
+    """
+    원본 게시판에서 삭제된 게시글 식별자를 반환합니다.
+    지금 읽은 가장 오래된 게시글보다 날짜가 늦은 게시글만 삭제로 봅니다. (나머지는 새 게시글에 밀려난 것)
+    전체를 읽은 경우 crawl_state가 같은 기준으로 removed를 고르고,
+    앞부분만 읽은 경우 표시 범위에서 빠진 게시글(dropped)에 이 기준을 적용합니다.
+    """
+    if "dropped" not in changes:
+        return [record["id"] for record in changes["removed"]]
+    oldest = min((item["date"] for item in items if item.get("date")), default=None)
+    if oldest is None:
+        return []
+    return [record["id"] for record in changes["dropped"] if record.get("date", "") > oldest]
+
+
+def _not_modified_result(board, url, site_name):
+    return {
+        board["items_key"]: [],
+        "meta": {
+            "total_count": 0,
+            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "source": site_name,
+            "url": url,
+            "not_modified": True
+        }
+    }
+
+
+def _error_result(board, url, site_name, error):
+    return {
+        board["items_key"]: [],
+        "meta": {
+            "total_count": 0,
+            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "source": site_name,
+            "url": url,
+            "error": error
+        }
+    }
+
+
+def crawl_board(url, board, site_name=None, skip_unchanged=False, state_key=None,
+                limit=None, stop_at_known=False):
+    """
+    학교 홈페이지 게시판을 RSS 피드로 크롤링합니다.
+    limit이나 stop_at_known을 지정하면 피드를 스트리밍으로 읽어 필요한 앞부분만 받습니다.
+
+    Args:
+        url (str): 게시판 RSS 피드 URL
+        board (dict): BOARDS의 게시판 설정
+        site_name (str, optional): 사이트 이름, 없으면 URL에서 추출
+        skip_unchanged (bool): 피드나 게시글 목록이 이전 실행과 같으면
+            빈 목록과 meta["not_modified"] = True를 반환
+        state_key (str, optional): 크롤링 상태 저장 키, 없으면 board["items_key"]
+        limit (int, optional): 최대 게시글 수 (화면에 표시할 개수)
+        stop_at_known (bool): 이미 수집한 게시글을 만나면 멈춤 (새 게시글만 반환)
+
+    Returns:
+        dict: 크롤링된 게시글 정보 (board["items_key"], meta, changes 키)
+    """
+    if not site_name:
+        # URL에서 도메인 추출하여 사이트 이름으로 사용
+        match = SITE_NAME_PATTERN.search(url)
+        site_name = match.group(1) if match else "unknown_site"
+
+    label = board["label"]
+    logging.info(f"{site_name} {label} RSS 크롤러 시작...")
+
+    state_key = state_key or board["items_key"]
+    streaming = bool(limit or stop_at_known)
+
+    try:
+        if streaming:
+            # 필요한 게시글까지만 읽고 연결을 닫음
+            known = crawl_state.known_hashes(state_key) if stop_at_known else None
+            with http_cache.conditional_stream(url) as response:
+                if skip_unchanged and response["not_modified"]:
+                    logging.info(f"{label} RSS 변경 없음, 파싱 생략")
+                    return _not_modified_result(board, url, site_name)
+                items = list(iter_board_items(response["chunks"], board, url, limit=limit, known=known))
+        else:
+            response = http_cache.conditional_get(url)
+            if skip_unchanged and not response["changed"]:
+                logging.info(f"{label} RSS 변경 없음, 파싱 생략")
+                return _not_modified_result(board, url, site_name)
+            items = parse_board_items(ET.fromstring(response["content"]), board, url)
+    except requests.RequestException as e:
+        logging.error(f"요청 중 오류 발생: {e}")
+        return _error_result(board, url, site_name, str(e))
+    except ET.ParseError as e:
+        logging.error(f"RSS XML 파싱 오류: {e}")
+        return _error_result(board, url, site_name, f"RSS XML 파싱 오류: {str(e)}")
+
+    logging.info(f"{label} RSS 크롤링 완료: {len(items)}개")
+
+    # 이전 실행과 비교하여 추가/변경/삭제된 게시글 확인 (앞부분만 읽었으면 읽은 범위만 비교)
+    changes = crawl_state.update_crawl_state(state_key, items, complete=not streaming)
+    logging.info(f"{label} 변경 내역: 추가 {len(changes['added'])}개, "
+                 f"변경 {len(changes['changed'])}개, 삭제 {len(changes['removed'])}개")
+
+    # 저장소에 반영 (HTML/RSS 생성기는 저장소에서 읽음)
+    content_store.upsert_items(state_key, items)
+    # 이미 수집한 게시글에서 멈췄으면 그 뒤는 읽지 않았으므로 삭제 여부를 판단하지 않음
+    if not stop_at_known:
+        content_store.mark_removed(state_key, _removed_ids(changes, items))
+    if skip_unchanged and not crawl_state.has_changes(changes):
+        return _not_modified_result(board, url, site_name)
+
+    return {
+        board["items_key"]: items,
+        "meta": {
+            "total_count": len(items),
+            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "source": site_name,
+            "url": url
+        },
+        "changes": changes
+    }
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+증분 빌드 그래프
+수집 데이터 -> 정규화된 데이터 -> 생성물(HTML 페이지, JSON 문서, RSS 피드, 폰트 서브셋)의 관계를
+노드로 기록하고, 노드의 입력 해시가 이전 실행과 같으면 생성을 건너뛰는 make 방식의 모듈입니다.
+
+- 노드 키는 입력(데이터, 템플릿 지문, 학교 설정, 앞 노드의 키)의 SHA-256입니다.
+- 입력이 같고 산출물 파일이 모두 있으면 이전 산출물을 그대로 사용합니다.
+- 다른 노드의 키를 입력으로 넣으면(node_key) 앞 노드가 다시 만들어졌을 때만 뒤 노드도 다시 만듭니다.
+  (예: 페이지 노드 -> 폰트 서브셋 노드)
+그래프는 data/build_graph.json에 저장합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GRAPH_FILE = os.path.join(ROOT_DIR, 'data', 'build_graph.json')
+
+# 빌드 그래프 형식 버전 (바뀌면 모든 노드를 다시 생성)
+GRAPH_VERSION = 1
+
+_graph = None
+_graph_dirty = False
+_rebuild_all = os.getenv("FORCE_REBUILD", "") not in ("", "0", "false")
+_graph_lock = threading.RLock()
+_stats = {"built": 0, "reused": 0}
+
+
+def fingerprint(*inputs):
+    """
+    입력 값의 해시를 만듭니다. (dict 키 순서와 관계없이 같은 값이면 같은 해시)
+
+    Returns:
+        str: SHA-256 16진 문자열
+    """
+    payload = json.dumps(inputs, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _load():
+    global _graph
+    if _graph is None:
+        try:
+            with open(GRAPH_FILE, 'r', encoding='utf-8') as f:
+                _graph = json.load(f)
+        except (OSError, ValueError):
+            _graph = {}
+        if _graph.get("version") != GRAPH_VERSION:
+            _graph = {"version": GRAPH_VERSION, "nodes": {}}
+    return _graph
+
+
+def rebuild_all(enabled=True):
+    """이번 실행에서 입력 해시와 관계없이 모든 노드를 다시 생성합니다. (템플릿 외 코드가 바뀐 경우 등)"""
+    global _rebuild_all
+    _rebuild_all = enabled
+
+
+def node_key(name):
+    """
+    노드의 현재 키를 반환합니다. 뒤 노드의 입력으로 사용합니다.
+
+    Returns:
+        str: 노드 키, 아직 만든 적 없는 노드면 None
+    """
+    with _graph_lock:
+        entry = _load()["nodes"].get(name)
+        return entry["key"] if entry else None
+
+
+def node_keys(prefix="", suffix=""):
+    """이름이 prefix로 시작하고 suffix로 끝나는 노드의 {이름: 키}를 반환합니다."""
+    with _graph_lock:
+        return {name: entry["key"] for name, entry in sorted(_load()["nodes"].items())
+                if name.startswith(prefix) and name.endswith(suffix)}
+
+
+def build(name, inputs, outputs, action):
+    """
+    노드의 입력 해시가 바뀌었거나 산출물이 없을 때만 action을 실행합니다.
+
+    Args:
+        name (str): 노드 이름 (예: "yulgok-m/meal_info.html")
+        inputs (list): 노드 입력 (JSON으로 바꿀 수 있는 값)
+        outputs (list): action이 만드는 파일 경로
+        action (callable): 산출물을 만드는 함수 (예외가 나면 노드를 갱신하지 않음)
+
+    Returns:
+        bool: action을 실행했는지 여부
+    """
+    key = fingerprint(inputs)
+    with _graph_lock:
+        entry = _load()["nodes"].get(name)
+    if (not _rebuild_all and entry and entry["key"] == key
+            and all(os.path.exists(path) for path in outputs)):
+        with _graph_lock:
+            _stats["reused"] += 1
+        return False
+
+    action()
+    global _graph_dirty
+    with _graph_lock:
+        _load()["nodes"][name] = {
+            "key": key,
+            "outputs": [os.path.relpath(path, ROOT_DIR).replace(os.sep, '/') for path in outputs],
+            "built_at": datetime.now().isoformat(timespec="seconds")
+        }
+        _graph_dirty = True
+        _stats["built"] += 1
+    return True
+
+
+def save_graph():
+    """
+    바뀐 노드가 있으면 그래프를 저장합니다.
+    배포 대상 파일이 아니므로 write_if_changed를 쓰지 않습니다. (바뀐 파일 목록에 넣지 않음)
+    """
+    global _graph_dirty
+    with _graph_lock:
+        logging.info(f"빌드 그래프: 생성 {_stats['built']}개, 재사용 {_stats['reused']}개")
+        if not _graph_dirty:
+            return
+        os.makedirs(os.path.dirname(GRAPH_FILE), exist_ok=True)
+        tmp_path = f"{GRAPH_FILE}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(_graph, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, GRAPH_FILE)
+        _graph_dirty = False
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+동시 수집 모듈
+여러 데이터 소스(게시판 RSS, NEIS API 등)를 스레드 풀에서 동시에 가져오는 모듈입니다.
+전체 소요 시간은 가장 느린 소스 하나의 시간과 같아집니다.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+# 소스별 기본 제한 시간 (초)
+DEFAULT_SOURCE_TIMEOUT = 30
+
+
+def run_concurrently(tasks, default=None):
+    """
+    여러 수집 작업을 동시에 실행하고 소스별 제한 시간 안에 끝난 결과를 모읍니다.
+
+    제한 시간은 기다리기만 멈추는 느슨한 제한입니다. 스레드는 강제로 멈출 수 없으므로 시간을 넘긴 작업은
+    백그라운드에서 끝까지 실행되며(파일/저장소 쓰기 포함), 실제 작업 시간은 http_client의 연결/읽기
+    제한 시간(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)과 재시도 횟수로 제한됩니다.
+    같은 작업을 반복 실행하는 쪽(데몬)은 이전 작업이 끝났는지 확인해야 합니다. (main_crawler.busy_sources)
+
+    Args:
+        tasks (dict): 소스 이름 -> (호출 함수, 제한 시간(초)) 또는 호출 함수
+        default: 실패하거나 제한 시간을 넘긴 소스에 사용할 값
+
+    Returns:
+        dict: 소스 이름 -> 결과 (실패/시간 초과 시 default)
+    """
+    if not tasks:
+        return {}
+
+    results = {}
+    executor = ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="fetch")
+    started = time.monotonic()
+    futures = {}
+    for name, task in tasks.items():
+        func, timeout = task if isinstance(task, tuple) else (task, DEFAULT_SOURCE_TIMEOUT)
+        futures[name] = (executor.submit(func), timeout)
+
+    try:
+        for name, (future, timeout) in futures.items():
+            # 모든 작업이 동시에 시작했으므로 남은 시간만큼만 기다림
+            remaining = max(0.0, started + timeout - time.monotonic())
+            try:
+                results[name] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                logging.error(f"{name} 수집 시간 초과 ({timeout}초)")
+                results[name] = default
+            except Exception as e:
+                logging.error(f"{name} 수집 중 오류 발생: {e}")
+                results[name] = default
+    finally:
+        # 시간 초과된 작업은 기다리지 않음 (작업은 계속 실행되고 끝나면 스레드가 정리됨)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    logging.info(f"동시 수집 완료: {len(tasks)}개 소스, {time.monotonic() - started:.2f}초")
+    return results
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+수집 데이터 저장소 (SQLite)
+공지사항, 가정통신문, 급식, 학사일정 수집 결과를 data/content.db 하나에 모아 두는 모듈입니다.
+모든 크롤러는 upsert_items()로 쓰고, HTML 생성기와 RSS 피드 생성기는
+query_items()의 날짜 범위 조회로 읽으므로 학교 서버나 NEIS API를 다시 요청하지 않습니다.
+
+- WAL 모드를 사용하므로 여러 크롤러 스레드가 동시에 쓰고 읽을 수 있습니다.
+- 항목은 (소스, 항목 식별자)로 구분하고 (소스, 날짜) 인덱스로 범위를 조회합니다.
+- 내용이 같은 항목은 다시 쓰지 않으므로 변경이 없으면 DB 파일도 바뀌지 않습니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+import date_utils
+
+DB_PATH = os.getenv(
+    "CONTENT_DB",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'content.db')
+)
+
+# 쓰기 잠금을 기다리는 최대 시간 (초)
+BUSY_TIMEOUT = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    source TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    date TEXT NOT NULL DEFAULT '',
+    published TEXT NOT NULL DEFAULT '',
+    content_hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    removed INTEGER NOT NULL DEFAULT 0,
+    first_seen TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (source, item_id)
+);
+CREATE INDEX IF NOT EXISTS idx_items_source_date ON items (source, removed, date, published);
+"""
+
+# 내용이 바뀌었거나 삭제 표시된 항목만 갱신 (first_seen은 유지)
+UPSERT_SQL = """
+INSERT INTO items (source, item_id, date, published, content_hash, data, removed, first_seen, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?)
+ON CONFLICT (source, item_id) DO UPDATE SET
+    date = excluded.date,
+    published = excluded.published,
+    content_hash = excluded.content_hash,
+    data = excluded.data,
+    removed = 0,
+    updated_at = excluded.updated_at
+WHERE items.content_hash != excluded.content_hash OR items.removed != 0
+"""
+
+
+def _board_fields(item):
+    return item["id"], item.get("date", ""), item.get("published", "")
+
+
+def _meal_fields(row):
+    # 같은 날의 조식/중식/석식은 식사 코드로 구분
+    date = date_utils.normalize_date(row.get("MLSV_YMD", ""), "neis")
+    return f"{row.get('MLSV_YMD', '')}:{row.get('MMEAL_SC_CODE', '')}", date, ""
+
+
+def _schedule_fields(row):
+    date = date_utils.normalize_date(row.get("AA_YMD", ""), "neis")
+    return f"{row.get('AA_YMD', '')}:{row.get('EVENT_NM', '')}", date, ""
+
+
+# 데이터 종류 -> (항목 식별자, 날짜(YYYY-MM-DD), 작성 시각) 추출 함수
+# 학교별 키("dongsan-m/meals")는 마지막 부분으로 찾고, 등록되지 않은 종류는 게시판 형식(id/date/published 키)으로 처리
+SOURCE_FIELDS = {
+    "meals": _meal_fields,
+    "schedules": _schedule_fields,
+}
+
+_schema_lock = threading.Lock()
+_schema_ready = set()
+
+
+def connect(db_path=None):
+    """
+    저장소에 연결합니다. 처음 연결할 때 WAL 모드와 테이블/인덱스를 준비합니다.
+    연결은 스레드 사이에 공유하지 말고 작업마다 새로 여는 것을 권장합니다.
+
+    Returns:
+        sqlite3.Connection: 연결 (row_factory = sqlite3.Row)
+    """
+    db_path = db_path or DB_PATH
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT)
+    conn.row_factory = sqlite3.Row
+    with _schema_lock:
+        if db_path not in _schema_ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            _schema_ready.add(db_path)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _content_hash(item):
+    payload = json.dumps(item, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def upsert_items(source, items, replace_range=None, db_path=None):
+    """
+    수집한 항목을 저장소에 추가하거나 갱신합니다.
+
+    Args:
+        source (str): 소스 이름 ("notices", "letters", "meals", "schedules", 학교별 키 "dongsan-m/meals" 등)
+        items (list): 항목 목록 (게시글 dict 또는 NEIS API 행)
+        replace_range (tuple, optional): (시작일, 종료일) YYYY-MM-DD
+            API가 이 기간 전체를 돌려준 경우에 지정하면, 기간 안에서 이번에 받지 못한
+            항목(취소된 일정 등)을 삭제로 표시합니다.
+        db_path (str, optional): DB 파일 경로
+
+    Returns:
+        int: 추가/갱신/삭제 표시된 항목 수, 저장에 실패하면 None
+    """
+    fields = SOURCE_FIELDS.get(source.rsplit('/', 1)[-1], _board_fields)
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    rows = {}
+    for item in items:
+        item_id, date, published = fields(item)
+        rows[item_id] = (source, item_id, date, published, _content_hash(item),
+                         json.dumps(item, ensure_ascii=False), timestamp, timestamp)
+
+    try:
+        with closing(connect(db_path)) as conn, conn:
+            before = conn.total_changes
+            conn.executemany(UPSERT_SQL, rows.values())
+            if replace_range:
+                start, end = replace_range
+                stale = [(timestamp, source, row["item_id"]) for row in conn.execute(
+                    "SELECT item_id FROM items WHERE source = ? AND removed = 0 AND date BETWEEN ? AND ?",
+                    (source, start, end)
+                ) if row["item_id"] not in rows]
+                conn.executemany(
+                    "UPDATE items SET removed = 1, updated_at = ? WHERE source = ? AND item_id = ?", stale
+                )
+            return conn.total_changes - before
+    except sqlite3.Error as e:
+        logging.error(f"{source} 저장소 저장 실패: {e}")
+        return None
+
+
+def mark_removed(source, item_ids, db_path=None):
+    """
+    원본에서 삭제된 항목을 삭제로 표시합니다. (조회 결과에서 제외)
+
+    Returns:
+        int: 삭제 표시된 항목 수, 저장에 실패하면 None
+    """
+    item_ids = list(item_ids)
+    if not item_ids:
+        return 0
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        with closing(connect(db_path)) as conn, conn:
+            before = conn.total_changes
+            conn.executemany(
+                "UPDATE items SET removed = 1, updated_at = ? WHERE source = ? AND item_id = ? AND removed = 0",
+                [(timestamp, source, item_id) for item_id in item_ids]
+            )
+            return conn.total_changes - before
+    except sqlite3.Error as e:
+        logging.error(f"{source} 삭제 표시 실패: {e}")
+        return None
+
+
+def query_items(source, start=None, end=None, limit=None, newest_first=True, db_path=None):
+    """
+    저장된 항목을 날짜 범위로 조회합니다. 삭제 표시된 항목은 제외합니다.
+
+    Args:
+        source (str): 소스 이름
+        start (str, optional): 시작일 YYYY-MM-DD (포함)
+        end (str, optional): 종료일 YYYY-MM-DD (포함)
+        limit (int, optional): 최대 항목 수
+        newest_first (bool): 최신 항목부터 정렬 (False이면 날짜 오름차순)
+        db_path (str, optional): DB 파일 경로
+
+    Returns:
+        list: 저장한 그대로의 항목 목록, 조회에 실패하면 빈 목록
+    """
+    sql = "SELECT data FROM items WHERE source = ? AND removed = 0"
+    params = [source]
+    if start:
+        sql += " AND date >= ?"
+        params.append(start)
+    if end:
+        sql += " AND date <= ?"
+        params.append(end)
+    order = "DESC" if newest_first else "ASC"
+    sql += f" ORDER BY date {order}, published {order}, item_id {order}"
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    try:
+        with closing(connect(db_path)) as conn:
+            return [json.loads(row["data"]) for row in conn.execute(sql, params)]
+    except sqlite3.Error as e:
+        logging.error(f"{source} 저장소 조회 실패: {e}")
+        return []
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+증분 크롤링 상태 저장소
+게시글을 고정된 식별자(nttSn 또는 링크+제목 해시)로 기억하고, 처음/마지막으로 본 시각과
+내용 해시를 data/crawl_state.json에 저장합니다.
+실행마다 추가/변경/삭제된 게시글만 돌려주어 이후 단계가 변경이 없을 때 작업을 생략할 수 있습니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime
+
+STATE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'crawl_state.json')
+
+NTT_SN_PATTERN = re.compile(r'[?&]nttSn=(\d+)')
+
+# 내용 해시에 포함할 필드
+HASHED_FIELDS = ("title", "author", "date", "url")
+
+# 앞부분만 읽은 실행(스트리밍 모드)에서 마지막으로 읽은 게시글 순서를 저장하는 키
+HEADS_KEY = "_heads"
+
+_state_lock = threading.Lock()
+
+
+def item_identity(url, title=""):
+    """
+    게시글의 고정 식별자를 만듭니다.
+    링크에 nttSn이 있으면 그 값을, 없으면 링크+제목의 해시를 사용합니다.
+
+    Args:
+        url (str): 게시글 링크
+        title (str): 게시글 제목
+
+    Returns:
+        str: 게시글 식별자 (예: "ntt:123456")
+    """
+    match = NTT_SN_PATTERN.search(url or "")
+    if match:
+        return f"ntt:{match.group(1)}"
+    digest = hashlib.sha1(f"{url}\n{title}".encode('utf-8')).hexdigest()[:16]
+    return f"hash:{digest}"
+
+
+def item_hash(item):
+    """게시글 내용 해시를 만듭니다."""
+    payload = "\n".join(str(item.get(field, "")) for field in HASHED_FIELDS)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def load_state(state_file=STATE_FILE):
+    """저장된 크롤링 상태를 읽습니다. 없으면 빈 상태를 반환합니다."""
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state, state_file=STATE_FILE):
+    """크롤링 상태를 저장합니다."""
+    os.makedirs(os.path.dirname(state_file), exist_ok=True)
+    tmp_file = f"{state_file}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_file, state_file)
+
+
+def known_hashes(source, state_file=STATE_FILE):
+    """
+    이미 수집한 게시글의 내용 해시를 반환합니다.
+
+    Returns:
+        dict: 게시글 식별자 -> 내용 해시
+    """
+    with _state_lock:
+        records = load_state(state_file).get(source, {})
+    return {item_id: record.get("content_hash") for item_id, record in records.items()}
+
+
+def update_crawl_state(source, items, now=None, state_file=STATE_FILE, complete=True):
+    """
+    이번 실행에서 수집한 게시글로 크롤링 상태를 갱신하고 변경 내역을 반환합니다.
+
+    Args:
+        source (str): 소스 이름 (예: "notices")
+        items (list): 게시글 목록 (각 항목에 "id" 키 필요)
+        now (datetime, optional): 기준 시각, 없으면 현재 시각
+        state_file (str): 상태 파일 경로
+        complete (bool): 피드 전체를 읽었는지 여부
+            True이면 피드에 없는 게시글 중 피드의 가장 오래된 게시글보다 날짜가 늦은 것만 삭제(removed)로 보고,
+            나머지(새 게시글에 밀려 피드 범위를 벗어난 게시글)는 상태에 그대로 둡니다.
+            False이면 읽지 않은 게시글은 삭제로 보지 않고 그대로 유지하며,
+            이전 실행에서 읽은 앞부분에서 빠진 게시글을 "dropped"로 돌려줍니다.
+
+    Returns:
+        dict: {"added": [...], "changed": [...], "removed": [...]}
+              (complete=False이면 "dropped" 포함)
+              added/changed는 게시글, removed/dropped는 이전 상태 기록 목록
+    """
+    now = now or datetime.now()
+    timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+    changes = {"added": [], "changed": [], "removed": []}
+
+    with _state_lock:
+        state = load_state(state_file)
+        previous = state.get(source, {})
+        current = {}
+        # 마지막으로 본 날짜만 바뀐 경우에는 하루 한 번만 저장 (저장소 변경 최소화)
+        dirty = False
+
+        for item in items:
+            item_id = item["id"]
+            if item_id in current:
+                continue
+            content_hash = item_hash(item)
+            record = previous.get(item_id)
+            if record is None:
+                changes["added"].append(item)
+                record = {"first_seen": timestamp}
+            elif record.get("content_hash") != content_hash:
+                changes["changed"].append(item)
+            if record.get("last_seen", "")[:10] != timestamp[:10]:
+                dirty = True
+            record.update({
+                "last_seen": timestamp,
+                "content_hash": content_hash,
+                "title": item.get("title", ""),
+                "date": item.get("date", ""),
+                "url": item.get("url", "")
+            })
+            current[item_id] = record
+
+        if complete:
+            # RSS는 최근 게시글만 보여 주므로 범위를 벗어난 오래된 게시글은 삭제가 아님
+            oldest = min((record["date"] for record in current.values() if record.get("date")), default=None)
+            for item_id, record in previous.items():
+                if item_id in current:
+                    continue
+                if oldest is not None and record.get("date", "") > oldest:
+                    changes["removed"].append(dict(record, id=item_id))
+                else:
+                    current[item_id] = record
+        else:
+            # 앞부분만 읽은 경우: 읽지 않은 게시글은 유지하고, 표시 범위에서 빠진 게시글만 확인
+            heads = state.setdefault(HEADS_KEY, {})
+            head = list(current)
+            changes["dropped"] = [dict(previous[item_id], id=item_id)
+                                  for item_id in heads.get(source, [])
+                                  if item_id not in current and item_id in previous]
+            if heads.get(source) != head:
+                heads[source] = head
+                dirty = True
+            current = dict(previous, **current)
+
+        if dirty or any(changes.values()):
+            state[source] = current
+            save_state(state, state_file)
+
+    return changes
+
+
+def has_changes(changes):
+    """변경 내역에 추가/변경/삭제된 게시글이 있는지 확인합니다."""
+    return bool(changes and any(changes.values()))
@@ -7,649 +7,136 @@
 """
 
 import os
-import requests
+import build_graph
+import content_store
+import data_api
+from concurrent_fetch import run_concurrently
+from static_assets import finalize_assets
+from output_writer import write_if_changed, report_changes
+from template_engine import render_page, template_fingerprint
+from school_registry import get_school, source_key
 from notice_crawler import crawl_school_notices
 from family_letter_crawler import crawl_school_letters
+from weather_collector import collect_weather, publish_weather
 from datetime import datetime
 from dotenv import load_dotenv
 
 # .env 파일 로드
 load_dotenv()
 
-def generate_html_base(title, items, school_name, item_type):
-    css_style = """
-        @font-face {
-            font-family: 'SeoulAlrim';
-            src: url('font/SeoulAlrimTTF-Medium.ttf') format('truetype');
-            font-weight: normal;
-            font-style: normal;
-        }
-
-        body {
-            background: #008b8b;
-            font-family: 'SeoulAlrim', sans-serif;
-            margin: 0; 
-            padding: 0;
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-        }
-
-        .page-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            background: linear-gradient(90deg, #008b8b, #006666);
-            padding: 30px 90px;
-            box-shadow: 0 8px 32px rgba(0, 139, 139, 0.18);
-            flex-shrink: 0;
-        }
-
-        .header-left {
-            display: flex;
-            align-items: center;
-            gap: 30px;
-        }
-
-        .header-main-title {
-            font-size: 5.8rem;
-            font-weight: 900; 
-            color: #FFFFFF;
-            letter-spacing: -2px;
-            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.1);
-            margin: 0;
-        }
-
-        .header-right {
-            display: flex;
-            align-items: center;
-            gap: 60px;
-        }
-
-        .page-header .weather, 
-        .page-header .date-time {
-            font-size: 2.2rem;
-            color: #FFFFFF;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.1);
-        }
-
-        .page-header .date-time {
-            line-height: 1.3;
-            text-align: right;
-            font-size: 1.8rem;
-        }
-
-        .page-header .weather {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-
-        .page-header .weather-content {
-            display: flex;
-            flex-direction: column;
-            align-items: flex-start;
-            gap: 5px;
-        }
-
-        .page-header .weather-icon {
-            width: 45px;
-            height: 45px;
-            flex-shrink: 0;
-        }
-
-        .page-header .weather-temp {
-            font-size: 2.2rem;
-        }
-
-        .page-header .school-name {
-            font-size: 2.2rem;
-            color: #FFFFFF;
-            font-weight: 700;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.1);
-            white-space: nowrap;
-        }
-
-        @media (max-width: 1380px) {
-            .page-header {
-                flex-direction: column;
-                padding: 25px;
-                gap: 20px;
-            }
-            .header-left, .header-right {
-                width: 100%;
-                justify-content: center;
-                gap: 40px;
-            }
-            .header-main-title {
-                font-size: 5rem;
-            }
-            .page-header .school-name {
-                font-size: 2.2rem;
-            }
-        }
-
-        @media (max-width: 768px) {
-            .page-header {
-                padding: 20px;
-            }
-            .header-main-title {
-                font-size: 4rem;
-            }
-            .header-left, .header-right {
-                flex-direction: column;
-                gap: 30px;
-            }
-            .page-header .school-name {
-                font-size: 2rem;
-            }
-        }
-
-        .main-content {
-            display: flex; 
-            justify-content: center; 
-            align-items: stretch;
-            margin: 40px auto;
-            background: #FFFFFF;
-            border-radius: 20px;
-            box-shadow: 0 8px 40px rgba(0, 139, 139, 0.18);
-            gap: 0;
-            width: 95%;
-            max-width: 2000px;
-            flex: 1;
-        }
-
-        .content-box {
-            background: #fff;
-            padding: 30px 60px 30px 80px;
-            box-shadow: 0 10px 40px rgba(0, 139, 139, 0.18);
-            border-radius: 20px 0 0 20px;
-            flex: 1;
-            min-width: 0;
-            display: flex;
-            align-items: stretch;
-        }
-
-        .content-list {
-            width: 100%;
-            border-collapse: collapse;
-            height: 100%;
-            table-layout: fixed;
-        }
-
-        .content-list tr {
-            border-bottom: 1px solid #E5E5E5;
-            height: calc(100% / 7);  /* 7개의 항목이 동일한 높이를 가지도록 설정 */
-        }
-
-        .content-list td {
-            font-size: 2.2rem;
-            padding: 0 20px;
-            border-bottom: 1px solid #ccc;
-            vertical-align: middle;
-        }
-
-        .content-list td:first-child {
-            width: 80%;  /* 첫 번째 열(내용)의 너비를 80%로 설정 */
-        }
-
-        .content-list td:last-child {
-            width: 20%;  /* 두 번째 열(날짜)의 너비를 20%로 설정 */
-            text-align: right;
-            color: #666666;
-            font-size: 1.8rem;
-            white-space: nowrap;  /* 날짜가 한 줄로 표시되도록 설정 */
-        }
-
-        .school-img {
-            width: 800px;
-            height: calc(100% - 60px);  /* 상하 패딩 30px을 고려하여 계산 */
-            border-radius: 0 20px 20px 0;
-            object-fit: cover; 
-            box-shadow: 0 10px 40px rgba(0, 139, 139, 0.18);
-            flex-shrink: 0;
-            align-self: center;
-            opacity: 1;
-            transition: opacity 1s ease-in-out;
-        }
-
-        .school-img.fade-out {
-            opacity: 0;
-        }
-
-        @media (max-width: 1380px) { 
-            .main-content {
-                flex-wrap: wrap; 
-                justify-content: center;
-                gap: 20px;
-                margin: 60px auto;
-            }
-            .school-img {
-                width: 100%;
-                height: 400px;
-                margin: 0;
-            }
-        }
-
-        @media (max-width: 768px) { 
-            .main-content { 
-                flex-direction: column; 
-                align-items: stretch; 
-                margin: 40px auto;
-                width: 95%;
-                gap: 20px;
-            }
-            .school-img { 
-                height: 300px;
-            }
-            .content-box { 
-                min-width: auto; 
-            }
-        }
-    """
-
-    js_code = """
-        // 날씨 캐시 설정
-        const WEATHER_CACHE_KEY = 'headerWeatherData_v2';
-        const WEATHER_TIMESTAMP_KEY = 'headerWeatherTimestamp_v2';
-        const WEATHER_UPDATE_INTERVAL = 60 * 60 * 1000; // 1시간 (밀리초)
-
-        function updateDateTime() {
-            const now = new Date();
-            const year = now.getFullYear();
-            const month = String(now.getMonth() + 1).padStart(2, '0');
-            const day = String(now.getDate()).padStart(2, '0');
-            const weekDays = ['일', '월', '화', '수', '목', '금', '토'];
-            const weekDay = weekDays[now.getDay()];
-
-            let hours = now.getHours();
-            const ampm = hours >= 12 ? '오후' : '오전';
-            hours = hours % 12;
-            hours = hours ? hours : 12; 
-            const displayHours = String(hours).padStart(2, '0');
-            const minutes = String(now.getMinutes()).padStart(2, '0');
-
-            const dateString = `${year}.${month}.${day} ${weekDay}요일`;
-            const timeString = `${ampm} ${displayHours}:${minutes}`;
-
-            document.getElementById('date-time').innerHTML = `${dateString}<br>${timeString}`;
-        }
-
-        // 캐시에서 날씨 데이터 가져오기
-        function getCachedWeatherData() {
-            try {
-                const cachedData = localStorage.getItem(WEATHER_CACHE_KEY);
-                const timestamp = localStorage.getItem(WEATHER_TIMESTAMP_KEY);
-                
-                if (cachedData && timestamp) {
-                    const data = JSON.parse(cachedData);
-                    const lastUpdate = parseInt(timestamp);
-                    const now = Date.now();
-                    
-                    // 1시간이 지나지 않았다면 캐시된 데이터 사용
-                    if (now - lastUpdate < WEATHER_UPDATE_INTERVAL) {
-                        console.log('캐시된 헤더 날씨 데이터 사용 중...');
-                        return data;
-                    }
-                }
-            } catch (error) {
-                console.error('날씨 캐시 데이터 읽기 실패:', error);
-            }
-            return null;
-        }
-
-        // 날씨 데이터를 캐시에 저장하기
-        function saveWeatherDataToCache(data) {
-            try {
-                localStorage.setItem(WEATHER_CACHE_KEY, JSON.stringify(data));
-                localStorage.setItem(WEATHER_TIMESTAMP_KEY, Date.now().toString());
-                console.log('헤더 날씨 데이터가 캐시에 저장되었습니다.');
-            } catch (error) {
-                console.error('날씨 캐시 저장 실패:', error);
-            }
-        }
-
-        // 날씨 데이터를 화면에 표시하는 함수
-        function displayWeatherData(weatherData) {
-            const temp = Math.round(weatherData.main.temp);
-            const weatherInfo = getWeatherInfo(
-                weatherData.weather[0].main, 
-                weatherData.weather[0].description, 
-                weatherData.isDay
-            );
-            document.querySelector('.weather').innerHTML =
-                `<img class='weather-icon' src='images/${weatherInfo.icon}' alt='날씨아이콘'>
-                 <div class='weather-content'>
-                    <div>${weatherInfo.text}</div>
-                    <div class='weather-temp'>${temp}℃</div>
-                 </div>`;
-        }
-
-        // OpenWeatherMap API 2.5와 커스텀 날씨 아이콘 매핑
-        function getWeatherInfo(weatherMain, weatherDescription, isDay = true) {
-            // 메인 날씨 조건별 매핑
-            const mainWeatherMap = {
-                'Clear': { 
-                    text: '맑음', 
-                    icon: 'weather/1.png' // 태양 아이콘
-                },
-                'Clouds': {
-                    text: '구름',
-                    icon: getCloudIcon(weatherDescription) // 구름 정도에 따라 다른 아이콘
-                },
-                'Rain': {
-                    text: '비',
-                    icon: getRainIcon(weatherDescription) // 비의 강도에 따라 다른 아이콘
-                },
-                'Drizzle': {
-                    text: '이슬비',
-                    icon: 'weather/14.png' // 물방울 아이콘
-                },
-                'Thunderstorm': {
-                    text: '뇌우',
-                    icon: 'weather/7.png' // 번개 아이콘
-                },
-                'Snow': {
-                    text: '눈',
-                    icon: 'weather/5.png' // 눈송이 아이콘
-                },
-                'Mist': {
-                    text: '안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Fog': {
-                    text: '짙은 안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Smoke': {
-                    text: '연기',
-                    icon: 'weather/16.png' // 안개 아이콘 (비슷한 시야 제한)
-                },
-                'Haze': {
-                    text: '실안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Dust': {
-                    text: '먼지',
-                    icon: 'weather/11.png' // 바람 아이콘
-                },
-                'Sand': {
-                    text: '모래바람',
-                    icon: 'weather/11.png' // 바람 아이콘
-                },
-                'Ash': {
-                    text: '화산재',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Squall': {
-                    text: '돌풍',
-                    icon: 'weather/11.png' // 바람 아이콘
-                },
-                'Tornado': {
-                    text: '토네이도',
-                    icon: 'weather/11.png' // 바람 아이콘
-                }
-            };
-
-            // 구름 상태에 따른 아이콘 선택
-            function getCloudIcon(description) {
-                const desc = description.toLowerCase();
-                if (desc.includes('few clouds')) {
-                    return 'weather/3.png'; // 부분적으로 구름 낀 맑은 날씨
-                } else if (desc.includes('scattered clouds') || desc.includes('broken clouds')) {
-                    return 'weather/2.png'; // 구름 많음
-                } else if (desc.includes('overcast')) {
-                    return 'weather/8.png'; // 완전히 흐림
-                }
-                return 'weather/2.png'; // 기본 구름 아이콘
-            }
-
-            // 비의 강도에 따른 아이콘 선택
-            function getRainIcon(description) {
-                const desc = description.toLowerCase();
-                if (desc.includes('light rain') || desc.includes('drizzle')) {
-                    return 'weather/14.png'; // 가벼운 비 (물방울)
-                } else if (desc.includes('heavy rain') || desc.includes('extreme rain')) {
-                    return 'weather/6.png'; // 폭우
-                } else if (desc.includes('thunderstorm')) {
-                    return 'weather/10.png'; // 천둥번개를 동반한 비
-                }
-                return 'weather/4.png'; // 기본 비 아이콘
-            }
-
-            // 야간 모드 처리 (달 아이콘 사용)
-            function getNightIcon(weatherMain) {
-                if (weatherMain === 'Clear') {
-                    return 'weather/15.png'; // 달과 별 아이콘
-                }
-                // 다른 날씨는 동일한 아이콘 사용
-                return mainWeatherMap[weatherMain]?.icon || 'weather/1.png';
-            }
-
-            // 메인 날씨 정보 가져오기
-            let weatherInfo = mainWeatherMap[weatherMain] || { 
-                text: weatherMain, 
-                icon: 'weather/1.png' 
-            };
-
-            // 야간인 경우 아이콘 변경
-            if (!isDay && weatherMain === 'Clear') {
-                weatherInfo.icon = getNightIcon(weatherMain);
-            }
-
-            return weatherInfo;
-        }
-
-        // 초기 날씨 데이터 로드 함수
-        async function loadInitialWeather() {
-            // 먼저 캐시에서 데이터 확인
-            const cachedData = getCachedWeatherData();
-            if (cachedData) {
-                console.log('캐시된 헤더 날씨 데이터로 초기 로드 중...');
-                displayWeatherData(cachedData);
-                return;
-            }
-            
-            // 캐시에 데이터가 없거나 만료된 경우에만 API 호출
-            console.log('헤더 날씨 데이터 초기 로드 중...');
-            await fetchWeather();
-        }
-
-        // 날씨 정보 업데이트 함수 (1시간마다)
-        async function updateWeatherIfNeeded() {
-            // 먼저 캐시에서 데이터 확인
-            const cachedData = getCachedWeatherData();
-            if (cachedData) {
-                // 캐시가 유효하면 표시 함수 호출하지 않음 (이미 표시되어 있음)
-                console.log('캐시된 헤더 날씨 데이터가 유효합니다.');
-                return;
-            }
-            
-            // 캐시에 데이터가 없거나 만료된 경우에만 API 호출
-            console.log('헤더 날씨 정보 업데이트 중...');
-            await fetchWeather();
-        }
-
-        async function fetchWeather() {
-            const apiKey = '""" + os.getenv("OPENWEATHER_API_KEY", "") + """';
-            const lat = 35.9568;
-            const lon = 126.9689;
-            const url = `https://api.openweathermap.org/data/2.5/weather?lat=${lat}&lon=${lon}&appid=${apiKey}&units=metric`;
-            
-            try {
-                const res = await fetch(url);
-                const data = await res.json();
-                
-                if (!data.weather || !data.weather[0]) throw new Error('Invalid weather data');
-                
-                // 현재 시간을 기준으로 낮/밤 판단
-                const now = new Date();
-                const currentHour = now.getHours();
-                const isDay = currentHour >= 6 && currentHour < 18; // 6시~18시는 낮
-                
-                // isDay 정보를 데이터에 추가
-                data.isDay = isDay;
-                
-                // 데이터를 화면에 표시
-                displayWeatherData(data);
-                
-                // 성공적으로 데이터를 가져왔다면 캐시에 저장
-                saveWeatherDataToCache(data);
-                
-            } catch (e) {
-                console.error("Weather fetch error: ", e);
-                document.querySelector('.weather').textContent = '날씨 정보를 불러올 수 없습니다';
-            }
-        }
-
-        // 계절별 이미지 슬라이드 기능
-        function getSeasonalImages() {
-            // 율곡중학교 이미지 경로
-            return [
-                'images/율곡중학교.jpg'
-            ];
-        }
-
-        let currentImageIndex = 0;
-        let seasonalImages = [];
+# 학교 정보 (schools.json의 기본 학교)
+SCHOOL_INFO = get_school()
+
+# 화면에 표시할 게시글 수
+DISPLAY_COUNT = 7
+
+def generate_html_base(title, items, school_name, item_type, school_info=SCHOOL_INFO):
+    rows = "".join(f"<tr><td>{item['title']}</td><td>{item['date']}</td></tr>" for item in items)
+    return render_page(
+        "board.html",
+        school_name,
+        page_title=f"{school_name} {title}",
+        header_title=title,
+        rows=rows,
+        school_image=school_info["school_image"],
+        dataset="notices" if item_type == "notice" else "letters",
+        school=school_info
+    )
 
-        function updateSchoolImage() {
-            const imgElement = document.querySelector('.school-img');
-            if (!imgElement) return;
+def generate_notice_html(notices, school_name, school_info=SCHOOL_INFO):
+    return generate_html_base("공지사항", notices, school_name, "notice", school_info)
 
-            // 현재 계절의 이미지 목록 가져오기
-            seasonalImages = getSeasonalImages();
-            
-            // 페이드 아웃 효과
-            imgElement.classList.add('fade-out');
-            
-            setTimeout(() => {
-                // 이미지 변경
-                imgElement.src = seasonalImages[currentImageIndex];
-                
-                // 다음 이미지 인덱스로 이동
-                currentImageIndex = (currentImageIndex + 1) % seasonalImages.length;
-                
-                // 페이드 인 효과
-                imgElement.classList.remove('fade-out');
-            }, 500);
-        }
+def generate_letter_html(letters, school_name, school_info=SCHOOL_INFO):
+    return generate_html_base("가정통신문", letters, school_name, "letter", school_info)
 
-        // 초기 로드 및 주기적 업데이트 설정
-        setInterval(updateDateTime, 1000);
-        updateDateTime();
-        loadInitialWeather();
-        
-        // 페이지 로드 시 현재 계절에 맞는 초기 이미지 설정
-        window.addEventListener('load', function() {
-            const seasonalImages = getSeasonalImages();
-            const imgElement = document.querySelector('.school-img');
-            if (imgElement && seasonalImages.length > 0) {
-                imgElement.src = seasonalImages[0];
-            }
-        });
-        
-        // 5분마다 날씨 업데이트 체크
-        setInterval(updateWeatherIfNeeded, 5 * 60 * 1000);
-        
-        // 10초마다 학교 이미지 슬라이드
-        setInterval(updateSchoolImage, 10 * 1000);
-        
-        // 페이지가 포커스를 받았을 때 업데이트 체크
-        window.addEventListener('focus', function() {
-            updateWeatherIfNeeded();
-        });
-        
-        // 페이지가 보이게 될 때 업데이트 체크 (탭 전환 시)
-        document.addEventListener('visibilitychange', function() {
-            if (!document.hidden) {
-                updateWeatherIfNeeded();
-            }
-        });
+def fetch_notices(school_info=SCHOOL_INFO, skip_unchanged=True):
     """
-
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="ko">
-    <head>
-        <meta charset="UTF-8">
-        <title>{school_name} {title}</title>
-        <style>{css_style}</style>
-        <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;700;900&display=swap" rel="stylesheet">
-    </head>
-    <body>
-        <header class="page-header">
-            <div class="header-left">
-                <div class="header-main-title">{title}</div>
-            </div>
-            <div class="header-right">
-                <div class="weather">날씨 정보를 불러오는 중...</div>
-                <div class="date-time" id="date-time"></div>
-                <div class="school-name">{school_name}</div>
-            </div>
-        </header>
-        <div class="main-content">
-            <div class="content-box">
-                <table class="content-list">
-                    { "".join(f"<tr><td>{item['title']}</td><td>{item['date']}</td></tr>" for item in items) }
-                </table>
-            </div>
-            <img class="school-img" src="images/율곡중학교.jpg" alt="학교 전경">
-        </div>
-        <script>{js_code}</script>
-    </body>
-    </html>
+    공지사항을 화면에 표시할 개수만큼만 읽어 반환합니다.
+    skip_unchanged가 True이고 RSS 피드가 바뀌지 않았으면 None을 반환합니다.
     """
-    return html_content
-
-def generate_notice_html(notices, school_name):
-    return generate_html_base("공지사항", notices, school_name, "notice")
-
-def generate_letter_html(letters, school_name):
-    return generate_html_base("가정통신문", letters, school_name, "letter")
-
-def main():
-    # 학교 정보
-    school_info = {
-        "name": "율곡중학교",
-        "notice_url": "http://yulgok-m.goepj.kr/yulgok-m/na/ntt/selectRssFeed.do?mi=10151&bbsId=6774",
-        "letter_url": "https://yulgok-m.goepj.kr/yulgok-m/na/ntt/selectRssFeed.do?mi=10153&bbsId=6776"  # 가정통신문 RSS 피드
-    }
-    
-    # 공지사항 크롤링
     print(f"{school_info['name']} 공지사항 크롤링 시작...")
     notices_result = crawl_school_notices(
         school_info["notice_url"],
-        school_info["name"]
+        school_info["name"],
+        skip_unchanged,
+        limit=DISPLAY_COUNT,
+        state_key=source_key(school_info, "notices"),
+        # 페이지는 저장소에서 읽으므로 변경 확인 때는 새 게시글까지만 받으면 됨
+        stop_at_known=skip_unchanged
     )
+    if notices_result['meta'].get('not_modified'):
+        print("공지사항 변경 없음")
+        return None
     if 'notices' in notices_result and notices_result['notices']:
-        notices_result['notices'] = notices_result['notices'][:7]
+        notices_result['notices'] = notices_result['notices'][:DISPLAY_COUNT]
     print(f"공지사항 크롤링 완료: {len(notices_result.get('notices', []))}개")
-    
-    # 가정통신문 크롤링
+    return notices_result
+
+def fetch_letters(school_info=SCHOOL_INFO, skip_unchanged=True):
+    """
+    가정통신문을 화면에 표시할 개수만큼만 읽어 반환합니다.
+    skip_unchanged가 True이고 RSS 피드가 바뀌지 않았으면 None을 반환합니다.
+    """
     print(f"{school_info['name']} 가정통신문 크롤링 시작...")
     letters_result = crawl_school_letters(
         school_info["letter_url"],
-        school_info["name"]
+        school_info["name"],
+        skip_unchanged,
+        limit=DISPLAY_COUNT,
+        state_key=source_key(school_info, "letters"),
+        # 페이지는 저장소에서 읽으므로 변경 확인 때는 새 게시글까지만 받으면 됨
+        stop_at_known=skip_unchanged
     )
+    if letters_result['meta'].get('not_modified'):
+        print("가정통신문 변경 없음")
+        return None
     if 'letters' in letters_result and letters_result['letters']:
-        letters_result['letters'] = letters_result['letters'][:7]
+        letters_result['letters'] = letters_result['letters'][:DISPLAY_COUNT]
     print(f"가정통신문 크롤링 완료: {len(letters_result.get('letters', []))}개")
+    return letters_result
+
+def save_board_html(notices_result, letters_result, school_info=SCHOOL_INFO):
+    """
+    공지사항, 가정통신문 HTML 파일과 JSON 문서(api/notices.json, api/letters.json)를 저장합니다.
+    결과가 None인 페이지(변경 없음 또는 시간 초과)는 기존 파일을 유지합니다.
+    게시글은 저장소에서 최신순으로 읽고, 저장소를 읽을 수 없으면 크롤링 결과를 사용합니다.
+    """
+    if notices_result is not None:
+        notices = (content_store.query_items(source_key(school_info, "notices"), limit=DISPLAY_COUNT)
+                   or notices_result.get('notices', []))
+        _build_board_page(school_info, "digital_signage.html", notices, generate_notice_html, "공지사항")
+        data_api.publish_board(school_info, "notices", notices)
+    if letters_result is not None:
+        letters = (content_store.query_items(source_key(school_info, "letters"), limit=DISPLAY_COUNT)
+                   or letters_result.get('letters', []))
+        _build_board_page(school_info, "family_letters.html", letters, generate_letter_html, "가정통신문")
+        data_api.publish_board(school_info, "letters", letters)
+
+def _build_board_page(school_info, filename, items, generate, label):
+    # 빌드 그래프: 표시할 게시글, 템플릿, 학교 설정이 그대로면 페이지를 다시 만들지 않음
+    path = os.path.join(school_info["output_path"], filename)
+
+    def render():
+        if write_if_changed(path, generate(items, school_info['name'], school_info)):
+            print(f"{label} HTML 파일이 생성되었습니다.")
+
+    build_graph.build(f"{school_info['id']}/{filename}", [items, template_fingerprint("board.html"), school_info],
+                      [path], render)
+
+def main():
+    # 공지사항, 가정통신문, 날씨를 동시에 수집
+    results = run_concurrently({
+        "notice": fetch_notices,
+        "letter": fetch_letters,
+        "weather": collect_weather
+    })
     
-    # HTML 파일 생성
-    notice_html = generate_notice_html(notices_result.get('notices', []), school_info['name'])
-    letter_html = generate_letter_html(letters_result.get('letters', []), school_info['name'])
-    
-    # HTML 파일 저장
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    with open(os.path.join(parent_dir, "digital_signage.html"), "w", encoding="utf-8") as f:
-        f.write(notice_html)
-    with open(os.path.join(parent_dir, "family_letters.html"), "w", encoding="utf-8") as f:
-        f.write(letter_html)
-    print("HTML 파일들이 생성되었습니다.")
+    # HTML 파일 생성 및 저장 (내용이 바뀐 파일만)
+    save_board_html(results["notice"], results["letter"])
+    if results["weather"] is not None:
+        publish_weather(results["weather"])
+    finalize_assets()
+    report_changes()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
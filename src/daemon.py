@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤러 데몬
+교내 사이니지 서버에서 크롤러를 계속 실행하는 모드입니다. GitHub Actions 예약 실행처럼 매번 새 프로세스를
+띄우지 않으므로 모듈 로드, HTTP 세션 풀(keep-alive 연결), 템플릿/자산/빌드 그래프 캐시가 주기 사이에 유지됩니다.
+
+- 내부 스케줄러가 소스별 주기(DAEMON_INTERVALS)에 무작위 지연(JITTER)을 더해 다음 수집 시각을 정합니다.
+- 같은 시각에 수집할 소스는 모아서 main_crawler.run_cycle()로 한 번에 수집하고,
+  바뀐 데이터의 페이지만 다시 생성합니다. (RSS 조건부 요청, NEIS 캐시, 빌드 그래프)
+- --serve로 실행하면 같은 프로세스에서 signage_server를 띄우고, 주기마다 바뀐 페이지/날씨 스냅샷을
+  /events 채널에 change 이벤트로 보냅니다. (화면은 폴링하지 않고 바뀐 영역만 다시 받음)
+- 제한 시간을 넘긴 이전 작업이 아직 실행 중인 학교/소스는 그 주기에서 건너뜁니다.
+  (같은 HTML, 상태 파일, 저장소에 두 작업이 동시에 쓰지 않도록)
+- SIGTERM/SIGINT를 받으면 진행 중인 수집을 마치고 수집 기록과 빌드 그래프를 저장한 뒤 종료합니다.
+
+사용법:
+    cd src
+    python daemon.py                # 등록된 모든 학교
+    python daemon.py yulgok-m       # 지정한 학교만
+    python daemon.py --serve        # 사이니지 서버와 변경 알림도 함께 실행
+"""
+
+import argparse
+import heapq
+import logging
+import os
+import random
+import signal
+import threading
+import time
+from datetime import datetime
+from main_crawler import SOURCE_POLICIES, busy_sources, run_cycle
+import signage_server
+from output_writer import display_path, reset_changes
+from school_registry import get_school, load_schools
+
+# 소스별 수집 주기 (초) - 환경변수 DAEMON_<소스>_MINUTES로 조정 가능
+DAEMON_INTERVALS = {
+    name: int(os.getenv(f"DAEMON_{name.upper()}_MINUTES", default)) * 60
+    for name, default in {
+        "notice": "5",
+        "letter": "10",
+        "meal": "60",       # NEIS 캐시가 유효한 달은 요청하지 않음
+        "schedule": "360",
+        "weather": "10",    # weather_collector가 스냅샷 갱신 주기(WEATHER_REFRESH_MINUTES)를 다시 확인
+    }.items()
+}
+
+# 주기에 더할 무작위 지연 비율 (여러 서버가 같은 시각에 학교 서버를 요청하지 않도록)
+JITTER = 0.1
+
+# 이 시간(초) 안에 수집 시각이 되는 소스는 같은 주기에 함께 수집
+BATCH_WINDOW = 5
+
+_stop = threading.Event()
+
+
+def _next_run(name, now):
+    interval = DAEMON_INTERVALS[name]
+    return now + interval + random.uniform(0, interval * JITTER)
+
+
+def _handle_signal(signum, frame):
+    logging.info(f"종료 신호 {signal.Signals(signum).name} 수신: 진행 중인 수집을 마치고 종료합니다.")
+    _stop.set()
+
+
+def stop():
+    """데몬 루프를 멈춥니다. (진행 중인 수집은 끝까지 실행)"""
+    _stop.set()
+
+
+def run_daemon(schools, on_changes=None):
+    """
+    종료 신호를 받을 때까지 소스별 주기에 맞춰 수집합니다. 시작하자마자 모든 소스를 한 번 수집합니다.
+
+    Args:
+        schools (list): school_registry의 학교 정보 목록
+        on_changes (callable, optional): 주기마다 바뀐 파일 목록을 받아 호출할 함수
+    """
+    started = time.monotonic()
+    queue = [(started, name) for name in SOURCE_POLICIES]
+    heapq.heapify(queue)
+
+    while not _stop.is_set():
+        # 다음 수집 시각까지 대기 (종료 신호를 받으면 즉시 깨어남)
+        if _stop.wait(max(0.0, queue[0][0] - time.monotonic())):
+            break
+
+        now = time.monotonic()
+        sources = set()
+        while queue and queue[0][0] <= now + BATCH_WINDOW:
+            sources.add(heapq.heappop(queue)[1])
+
+        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] 수집: {', '.join(sorted(sources))}")
+        due = {}
+        for school in schools:
+            busy = busy_sources(school["id"]) & sources
+            if busy:
+                logging.warning(f"{school['id']} 이전 수집이 아직 실행 중이라 건너뜀: {', '.join(sorted(busy))}")
+            due[school["id"]] = sources - busy
+        try:
+            run_cycle(schools, due)
+        except Exception as e:
+            # 한 주기가 실패해도 데몬은 계속 실행
+            logging.error(f"수집 주기 실패: {e}")
+        changed = reset_changes()
+        if changed:
+            print(f"변경된 파일 {len(changed)}개: {', '.join(display_path(path) for path in changed)}")
+            if on_changes:
+                on_changes(changed)
+
+        finished = time.monotonic()
+        for name in sources:
+            heapq.heappush(queue, (_next_run(name, finished), name))
+
+    print("크롤러 데몬을 종료합니다.")
+
+
+def publish_changes(changed):
+    """바뀐 파일 목록을 /events 채널의 change 이벤트로 보냅니다."""
+    for event in signage_server.change_events(changed, load_schools()):
+        logging.info(f"변경 알림: {event['school']} {event['dataset']} {event['hash'][:8]}")
+        signage_server.publish_event(event)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 데몬 (소스별 주기로 계속 수집)")
+    parser.add_argument("schools", nargs="*", help="수집할 학교 id (없으면 등록된 모든 학교)")
+    parser.add_argument("--serve", action="store_true", help="사이니지 서버와 변경 알림(/events)도 함께 실행")
+    parser.add_argument("--host", default=signage_server.SERVER_HOST, help="--serve 주소")
+    parser.add_argument("--port", type=int, default=signage_server.SERVER_PORT, help="--serve 포트")
+    args = parser.parse_args()
+    schools = [get_school(school_id) for school_id in args.schools] if args.schools else load_schools()
+
+    on_changes = None
+    if args.serve:
+        signage_server.start_in_thread(args.host, args.port)
+        on_changes = publish_changes
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+    intervals = ", ".join(f"{name} {seconds // 60}분" for name, seconds in DAEMON_INTERVALS.items())
+    print(f"크롤러 데몬 시작: 학교 {len(schools)}곳, 주기 {intervals}")
+    run_daemon(schools, on_changes)
+
+
+if __name__ == "__main__":
+    main()
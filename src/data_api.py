@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+JSON 데이터 API
+HTML 페이지를 만들 때 쓴 데이터를 학교 출력 디렉터리의 api/ 아래에 작은 JSON 문서로도 저장하는 모듈입니다.
+모바일 앱, 다른 화면 레이아웃, 모니터링이 페이지를 긁지 않고 이 문서를 읽을 수 있습니다.
+
+    api/notices.json              공지사항
+    api/letters.json              가정통신문
+    api/meals/<YYYY-Www>.json     주간 급식 (ISO 주, 메뉴/알레르기/원산지는 menu_parser로 나눈 값)
+    api/schedule/<YYYY-MM>.json   월간 학사일정
+    api/manifest.json             문서별 ETag, SHA-256, 크기, 미리 압축한 파일 목록
+
+- 모든 문서는 {"version": API_VERSION, "school": ..., "items": [...]} 형식이며 생성 시각을 넣지 않으므로
+  데이터가 같으면 파일도 같습니다. (write_if_changed로 바뀐 파일만 저장)
+- 문서마다 .gz(항상)와 .br(brotli가 설치된 경우) 파일을 함께 저장합니다.
+- 클라이언트는 manifest.json 하나만 주기적으로 받아 ETag가 바뀐 문서만 다시 받으면 됩니다.
+- 문서마다 빌드 그래프 노드가 있어 내용이 이전 실행과 같으면 압축과 매니페스트 갱신을 건너뜁니다.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+import build_graph
+import menu_parser
+from output_writer import write_if_changed
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+# 문서 형식 버전 (호환되지 않게 바뀌면 올림)
+API_VERSION = 1
+
+API_DIR_NAME = "api"
+MANIFEST_NAME = "manifest.json"
+
+# 게시글 문서에 넣을 필드 (number/views는 화면용 값이라 제외)
+BOARD_FIELDS = ("id", "title", "author", "date", "published", "url")
+
+# 매니페스트 읽기-수정-쓰기를 학교(디렉터리)별로 직렬화
+_manifest_locks = {}
+_manifest_locks_lock = threading.Lock()
+
+
+def _api_dir(school):
+    return os.path.join(school["output_path"], API_DIR_NAME)
+
+
+def _encode(document):
+    return (json.dumps(document, ensure_ascii=False, separators=(',', ':'), sort_keys=True) + "\n").encode('utf-8')
+
+
+def _etag(data):
+    return f'"{hashlib.sha256(data).hexdigest()[:16]}"'
+
+
+def _write_encoded(path, data):
+    """
+    JSON 문서와 미리 압축한 파일을 저장합니다.
+
+    Returns:
+        tuple: (원본이 새로 저장되었는지 여부, 저장한 압축 형식 목록)
+    """
+    changed = write_if_changed(path, data)
+    # mtime=0으로 고정해 내용이 같으면 압축 파일도 같게 만듦
+    write_if_changed(f"{path}.gz", gzip.compress(data, compresslevel=9, mtime=0))
+    encodings = ["gzip"]
+    if brotli is not None:
+        write_if_changed(f"{path}.br", brotli.compress(data, quality=11))
+        encodings.append("br")
+    return changed, encodings
+
+
+def _manifest_lock(directory):
+    with _manifest_locks_lock:
+        return _manifest_locks.setdefault(directory, threading.Lock())
+
+
+def _update_manifest(school, name, data, encodings):
+    """매니페스트에서 문서 하나의 항목을 갱신합니다."""
+    directory = _api_dir(school)
+    path = os.path.join(directory, MANIFEST_NAME)
+    with _manifest_lock(directory):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        if manifest.get("version") != API_VERSION:
+            manifest = {"version": API_VERSION, "school": school["id"], "files": {}}
+        manifest["files"][name] = {
+            "etag": _etag(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "size": len(data),
+            "encodings": encodings
+        }
+        _write_encoded(path, _encode(manifest))
+
+
+def publish_document(school, name, items, **fields):
+    """
+    문서 하나를 api/<name>으로 저장하고 매니페스트를 갱신합니다.
+
+    Args:
+        school (dict): school_registry의 학교 정보
+        name (str): api/ 기준 경로 (예: "meals/2025-W38.json")
+        items (list): 문서 항목
+        **fields: 문서에 함께 넣을 값 (예: week="2025-W38")
+
+    Returns:
+        bool: 문서가 새로 저장되었는지 여부 (저장에 실패하면 False)
+    """
+    document = {"version": API_VERSION, "school": {"id": school["id"], "name": school["name"]}, "items": items}
+    document.update(fields)
+    data = _encode(document)
+    path = os.path.join(_api_dir(school), *name.split('/'))
+    changed = []
+
+    def publish():
+        written, encodings = _write_encoded(path, data)
+        _update_manifest(school, name, data, encodings)
+        changed.append(written)
+
+    try:
+        build_graph.build(f"{school['id']}/{API_DIR_NAME}/{name}", [hashlib.sha256(data).hexdigest()],
+                          [path, os.path.join(_api_dir(school), MANIFEST_NAME)], publish)
+    except OSError as e:
+        logging.error(f"{school['id']} {name} 저장 실패: {e}")
+        return False
+    return any(changed)
+
+
+def publish_board(school, source, items):
+    """
+    게시글 목록을 api/<source>.json으로 저장합니다. (source: "notices" 또는 "letters")
+    """
+    return publish_document(school, f"{source}.json",
+                            [{field: item.get(field, "") for field in BOARD_FIELDS} for item in items])
+
+
+def _iso_date(ymd):
+    return f"{ymd[:4]}-{ymd[4:6]}-{ymd[6:8]}"
+
+
+def publish_meals(school, meals):
+    """
+    한 주의 급식을 api/meals/<YYYY-Www>.json으로 저장합니다. (주는 첫 급식 날짜로 정함)
+    """
+    if not meals:
+        return False
+    year, week, _ = datetime.strptime(meals[0]["MLSV_YMD"], "%Y%m%d").isocalendar()
+    week_key = f"{year}-W{week:02d}"
+    items = []
+    for meal in meals:
+        parsed = menu_parser.parse_meal(meal)
+        items.append({
+            "date": _iso_date(parsed["date"]),
+            "meal_code": parsed["meal_code"],
+            "meal_name": meal.get("MMEAL_SC_NM", ""),
+            "dishes": [{"name": dish["name"], "allergens": list(dish["allergens"])} for dish in parsed["dishes"]],
+            "allergens": list(parsed["allergens"]),
+            "origins": [list(origin) for origin in parsed["origins"]],
+            "calorie": parsed["calorie"]
+        })
+    return publish_document(school, f"meals/{week_key}.json", items, week=week_key)
+
+
+def publish_schedule(school, year, month, schedules):
+    """
+    한 달의 학사일정을 api/schedule/<YYYY-MM>.json으로 저장합니다.
+    """
+    month_key = f"{year}-{month:02d}"
+    items = [{
+        "date": _iso_date(row["AA_YMD"]),
+        "event": row.get("EVENT_NM", ""),
+        "day_type": row.get("SBTR_DD_SC_NM", "")  # 수업일/휴업일 등
+    } for row in sorted(schedules, key=lambda row: row["AA_YMD"])]
+    return publish_document(school, f"schedule/{month_key}.json", items, month=month_key)
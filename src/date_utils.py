@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+날짜 정규화 모듈
+RSS 피드, NEIS API 등에서 받은 날짜 문자열을 미리 컴파일한 정규식과 fromisoformat으로
+빠르게 파싱하는 모듈입니다. 소스(피드)마다 처음 성공한 형식을 기억해 두고
+다음 항목부터는 그 형식을 먼저 시도하므로, 예외를 이용한 strptime 연쇄 시도를 하지 않습니다.
+시간대 정보가 있으면 그대로 유지합니다.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+# 학교 데이터의 기본 시간대 (시간대 표시가 없는 날짜에 사용)
+KST = timezone(timedelta(hours=9), "KST")
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+}
+
+NAMED_ZONES = {
+    "GMT": timezone.utc,
+    "UT": timezone.utc,
+    "UTC": timezone.utc,
+    "Z": timezone.utc,
+    "KST": KST,
+}
+
+# RFC 822 (예: Wed, 02 Jul 2025 23:17:42 GMT / Mon, 24 Jun 2025 10:30:00 +0900)
+RFC822_PATTERN = re.compile(
+    r'^(?:[A-Za-z]{3},\s*)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})\s+'
+    r'(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([A-Za-z]+|[+-]\d{4})?$'
+)
+# ISO 8601 (예: 2025-09-25T19:16:27, 2025-09-25T19:16:27+09:00)
+ISO_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}T')
+# 구분자가 있는 날짜 (예: 2023-01-15, 2023.01.15, 2023/01/15 14:30, 2023-01-15 14:30:45)
+YMD_PATTERN = re.compile(
+    r'^(\d{4})[-./](\d{1,2})[-./](\d{1,2})\.?(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?)?$'
+)
+# 구분자가 없는 날짜 (예: NEIS 20250915)
+COMPACT_PATTERN = re.compile(r'^(\d{4})(\d{2})(\d{2})$')
+
+# 소스별로 마지막으로 성공한 형식 이름
+_source_formats = {}
+
+
+def _zone(token):
+    if not token:
+        return None
+    if token[0] in "+-":
+        sign = -1 if token[0] == "-" else 1
+        return timezone(sign * timedelta(hours=int(token[1:3]), minutes=int(token[3:5])))
+    return NAMED_ZONES.get(token.upper())
+
+
+def _parse_rfc822(text):
+    match = RFC822_PATTERN.match(text)
+    if not match:
+        return None
+    day, month_name, year, hour, minute, second, zone = match.groups()
+    month = MONTHS.get(month_name.lower())
+    if month is None:
+        return None
+    return datetime(int(year), month, int(day), int(hour), int(minute), int(second or 0), tzinfo=_zone(zone))
+
+
+def _parse_iso(text):
+    if not ISO_PATTERN.match(text):
+        return None
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def _parse_ymd(text):
+    match = YMD_PATTERN.match(text)
+    if not match:
+        return None
+    year, month, day, hour, minute, second = match.groups()
+    return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0))
+
+
+def _parse_compact(text):
+    match = COMPACT_PATTERN.match(text)
+    if not match:
+        return None
+    year, month, day = match.groups()
+    return datetime(int(year), int(month), int(day))
+
+
+# 형식 이름 -> 파싱 함수 (자주 쓰이는 순서)
+PARSERS = {
+    "rfc822": _parse_rfc822,
+    "iso": _parse_iso,
+    "ymd": _parse_ymd,
+    "compact": _parse_compact,
+}
+
+
+def parse_date(text, source=None):
+    """
+    날짜 문자열을 datetime으로 변환합니다.
+    source를 지정하면 그 소스에서 마지막으로 성공한 형식을 먼저 시도합니다.
+
+    Args:
+        text (str): 날짜 문자열
+        source (str, optional): 형식을 기억할 소스 이름 (예: 피드 URL)
+
+    Returns:
+        datetime: 변환된 날짜 (시간대가 있으면 aware), 변환할 수 없으면 None
+    """
+    text = (text or "").strip()
+    if not text:
+        return None
+
+    cached = _source_formats.get(source)
+    if cached is not None:
+        try:
+            result = PARSERS[cached](text)
+        except ValueError:  # 날짜 범위 오류 (예: 2월 30일)
+            result = None
+        if result is not None:
+            return result
+
+    for name, parser in PARSERS.items():
+        if name == cached:
+            continue
+        try:
+            result = parser(text)
+        except ValueError:
+            continue
+        if result is not None:
+            if source is not None:
+                _source_formats[source] = name
+            return result
+    return None
+
+
+def normalize_date(text, source=None):
+    """
+    날짜 문자열을 YYYY-MM-DD 형식으로 변환합니다.
+    날짜는 문자열에 적힌 시간대 기준입니다.
+
+    Args:
+        text (str): 날짜 문자열
+        source (str, optional): 형식을 기억할 소스 이름 (예: 피드 URL)
+
+    Returns:
+        str: 변환된 날짜 (변환 실패 시 원본 문자열)
+    """
+    parsed = parse_date(text, source)
+    return parsed.strftime('%Y-%m-%d') if parsed else (text or "")
+
+
+def to_isoformat(text, source=None):
+    """
+    날짜 문자열을 시간대 정보를 유지한 ISO 8601 문자열로 변환합니다.
+
+    Returns:
+        str: ISO 8601 문자열, 변환 실패 시 빈 문자열
+    """
+    parsed = parse_date(text, source)
+    return parsed.isoformat() if parsed else ""
+
+
+def ensure_aware(value, tz=KST):
+    """시간대 정보가 없는 datetime에 기본 시간대(KST)를 붙입니다."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=tz)
+
+
+def detected_format(source):
+    """소스에 대해 기억하고 있는 날짜 형식 이름을 반환합니다."""
+    return _source_formats.get(source)
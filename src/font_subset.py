@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+폰트 서브셋 생성 모듈
+생성된 페이지와 공통 스크립트에 실제로 쓰인 글자만 모아 SeoulAlrim 폰트의 WOFF2 서브셋을
+만들고, 서브셋을 가리키는 @font-face 규칙(assets/fonts.css)을 저장하는 모듈입니다.
+새 글자가 나타나면 다음 크롤링에서 서브셋이 다시 만들어집니다.
+
+fontTools(및 WOFF2 압축용 brotli)가 없으면 원본 TTF를 그대로 사용합니다.
+"""
+
+import glob
+import hashlib
+import html
+import logging
+import os
+import re
+from output_writer import write_if_changed
+
+try:
+    from fontTools import subset
+except ImportError:  # 선택 의존성
+    subset = None
+
+try:
+    import brotli  # noqa: F401 - WOFF2 압축에 필요
+    SUBSET_FLAVOR = "woff2"
+except ImportError:
+    SUBSET_FLAVOR = "woff"
+
+# fontTools의 글리프 단위 INFO 로그는 출력하지 않음
+logging.getLogger("fontTools").setLevel(logging.WARNING)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+FONT_DIR = os.path.join(ROOT_DIR, 'font')
+SUBSET_DIR = os.path.join(FONT_DIR, 'subset')
+FONT_CSS_PATH = os.path.join(ROOT_DIR, 'assets', 'fonts.css')
+
+FONT_FAMILY = "SeoulAlrim"
+SOURCE_FONT = "SeoulAlrimTTF-Medium.ttf"
+
+# 글자를 수집할 생성 페이지
+GENERATED_PAGES = (
+    "digital_signage.html",
+    "family_letters.html",
+    "meal_info.html",
+    "school_schedule.html",
+)
+
+# 학교별 출력 디렉터리의 상위 디렉터리 (schools.json의 기본 output_dir)
+SITES_DIR = "sites"
+
+# 항상 포함할 글자: ASCII(영문, 숫자, 기호)와 자주 쓰는 기호
+BASE_CHARACTERS = frozenset(chr(c) for c in range(0x20, 0x7F)) | frozenset("℃·~…")
+
+SCRIPT_STYLE_PATTERN = re.compile(r'<(script|style)\b[^>]*>.*?</\1>', re.S | re.I)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+FONT_FACE_TEMPLATE = """@font-face{{font-family:'{family}';src:url('{url}') format('{format}');font-weight:normal;font-style:normal;font-display:swap}}
+"""
+
+
+def collect_text_glyphs(html_text):
+    """HTML에서 화면에 표시되는 텍스트의 글자를 모읍니다."""
+    text = SCRIPT_STYLE_PATTERN.sub(' ', html_text)
+    text = TAG_PATTERN.sub(' ', text)
+    return set(html.unescape(text))
+
+
+def collect_glyphs(root_dir=ROOT_DIR):
+    """
+    생성된 페이지의 텍스트와 공통 스크립트(날씨, 시계 문구)에 쓰인 글자를 모읍니다.
+
+    Returns:
+        set: 글자 집합
+    """
+    glyphs = set(BASE_CHARACTERS)
+    # 루트와 학교별 출력 디렉터리(sites/<id>/)의 페이지
+    page_dirs = [root_dir] + sorted(glob.glob(os.path.join(root_dir, SITES_DIR, '*')))
+    for page_dir in page_dirs:
+        for page in GENERATED_PAGES:
+            try:
+                with open(os.path.join(page_dir, page), 'r', encoding='utf-8') as f:
+                    glyphs |= collect_text_glyphs(f.read())
+            except OSError:
+                continue
+    # 스크립트가 화면에 넣는 문구 (요일, 오전/오후, 날씨 설명 등)
+    for script in glob.glob(os.path.join(TEMPLATE_DIR, '*.js')):
+        with open(script, 'r', encoding='utf-8') as f:
+            glyphs |= {ch for ch in f.read() if ord(ch) > 0x7F}
+    return {ch for ch in glyphs if ch.isprintable()}
+
+
+def build_subset(glyphs, source_path, output_path):
+    """
+    글자 집합으로 폰트 서브셋 파일을 만듭니다.
+
+    Args:
+        glyphs (set): 포함할 글자
+        source_path (str): 원본 TTF 경로
+        output_path (str): 저장할 서브셋 경로
+    """
+    options = subset.Options()
+    options.flavor = SUBSET_FLAVOR
+    options.notdef_outline = True
+    font = subset.load_font(source_path, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=sorted(ord(ch) for ch in glyphs))
+    subsetter.subset(font)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    tmp_path = f"{output_path}.tmp"
+    subset.save_font(font, tmp_path, options)
+    font.close()
+    os.replace(tmp_path, output_path)
+
+
+def update_font_subset(root_dir=ROOT_DIR):
+    """
+    페이지에 쓰인 글자로 폰트 서브셋을 갱신하고 assets/fonts.css를 저장합니다.
+    글자 집합이 같으면 기존 서브셋을 그대로 사용합니다.
+
+    Returns:
+        str: @font-face가 가리키는 폰트 경로 (assets/ 기준)
+    """
+    source_path = os.path.join(FONT_DIR, SOURCE_FONT)
+    font_url, font_format = f"../font/{SOURCE_FONT}", "truetype"
+
+    if subset is None:
+        logging.warning("fontTools가 설치되지 않아 원본 폰트를 사용합니다.")
+    else:
+        glyphs = collect_glyphs(root_dir)
+        digest = hashlib.sha256("".join(sorted(glyphs)).encode('utf-8')).hexdigest()[:10]
+        stem = os.path.splitext(SOURCE_FONT)[0]
+        subset_name = f"{stem}.{digest}.{SUBSET_FLAVOR}"
+        subset_path = os.path.join(SUBSET_DIR, subset_name)
+        try:
+            if not os.path.exists(subset_path):
+                build_subset(glyphs, source_path, subset_path)
+                logging.info(f"폰트 서브셋 생성: {subset_name} ({len(glyphs)}자, {os.path.getsize(subset_path)} bytes)")
+            font_url, font_format = f"../font/subset/{subset_name}", SUBSET_FLAVOR
+            # 이전 서브셋 정리
+            for path in glob.glob(os.path.join(SUBSET_DIR, f"{stem}.*")):
+                if os.path.basename(path) != subset_name:
+                    os.remove(path)
+        except Exception as e:
+            logging.error(f"폰트 서브셋 생성 실패, 원본 폰트 사용: {e}")
+
+    write_if_changed(FONT_CSS_PATH, FONT_FACE_TEMPLATE.format(family=FONT_FAMILY, url=font_url, format=font_format))
+    return font_url
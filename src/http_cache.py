@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+조건부 요청(ETag / Last-Modified) 응답 캐시
+URL별 검증자와 응답 본문을 data/http_cache에 저장하고, 다음 요청에서
+If-None-Match / If-Modified-Since를 보내 변경이 없으면 304 응답으로 처리하는 모듈입니다.
+서버가 검증자를 주지 않으면 본문 해시로 변경 여부를 판단합니다.
+conditional_stream()은 본문을 필요한 만큼만 읽는 스트리밍 요청을 제공합니다.
+"""
+
+import hashlib
+import http_client
+import json
+import logging
+import os
+from contextlib import contextmanager
+from urllib.parse import urlencode
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'http_cache')
+
+# 캐시 키와 저장 파일에서 제외할 파라미터 (API 키)
+SECRET_PARAMS = frozenset(["KEY", "serviceKey", "appid"])
+
+# 설정 시 검증자를 보내지 않고 항상 변경된 것으로 처리 (템플릿 변경 후 강제 재생성 등)
+FORCE_REFRESH = os.getenv("FORCE_REFRESH", "") not in ("", "0", "false")
+
+# 스트리밍 요청에서 한 번에 읽을 크기 (바이트)
+STREAM_CHUNK_SIZE = 8192
+
+
+def _public_url(url, params):
+    """API 키를 제외한 요청 URL을 만듭니다."""
+    if not params:
+        return url
+    public = sorted((k, v) for k, v in params.items() if k not in SECRET_PARAMS)
+    return f"{url}?{urlencode(public)}" if public else url
+
+
+def cache_key(url, params=None):
+    """요청 URL과 파라미터로 캐시 키를 만듭니다. (API 키 제외)"""
+    return hashlib.sha1(_public_url(url, params).encode('utf-8')).hexdigest()
+
+
+def _cache_paths(key):
+    return os.path.join(CACHE_DIR, f"{key}.json"), os.path.join(CACHE_DIR, f"{key}.body")
+
+
+def _conditional_headers(entry, headers=None):
+    """캐시된 검증자로 조건부 요청 헤더를 만듭니다."""
+    headers = dict(headers or {})
+    if entry and not FORCE_REFRESH:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def _load_entry(key):
+    meta_path, body_path = _cache_paths(key)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        return entry, body
+    except (OSError, ValueError):
+        return None, None
+
+
+def _write_file(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _save_entry(key, entry, body=None):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    meta_path, body_path = _cache_paths(key)
+    if body is not None:
+        _write_file(body_path, body)
+    _write_file(meta_path, json.dumps(entry, ensure_ascii=False, indent=2, sort_keys=True).encode('utf-8'))
+
+
+def conditional_get(url, params=None, **kwargs):
+    """
+    캐시된 검증자로 조건부 GET 요청을 보냅니다.
+
+    Args:
+        url (str): 요청 URL
+        params (dict, optional): 쿼리 파라미터
+        **kwargs: http_client.get()에 전달할 추가 인자
+
+    Returns:
+        dict: {"content": 응답 본문(bytes), "changed": 이전 응답과 달라졌는지 여부,
+               "not_modified": 304 응답 여부}
+
+    Raises:
+        requests.RequestException: 요청 실패 또는 오류 응답
+    """
+    key = cache_key(url, params)
+    entry, cached_body = _load_entry(key)
+    # 스트리밍 요청으로 앞부분만 저장된 캐시는 전체 본문 대신 쓸 수 없음
+    if entry and entry.get('partial'):
+        entry = None
+
+    headers = _conditional_headers(entry, kwargs.pop('headers', None))
+    response = http_client.get(url, params=params, headers=headers, **kwargs)
+
+    if response.status_code == 304 and entry:
+        logging.info(f"변경 없음 (304): {entry.get('url', url)}")
+        return {"content": cached_body, "changed": False, "not_modified": True}
+
+    response.raise_for_status()
+    content = response.content
+    content_hash = hashlib.sha256(content).hexdigest()
+    changed = FORCE_REFRESH or not entry or entry.get('content_hash') != content_hash
+
+    new_entry = {
+        "url": _public_url(url, params),
+        "etag": response.headers.get('ETag'),
+        "last_modified": response.headers.get('Last-Modified'),
+        "content_hash": content_hash
+    }
+    # 내용이나 검증자가 바뀐 경우에만 캐시 파일을 갱신 (저장소 변경 최소화)
+    if changed or new_entry != entry:
+        _save_entry(key, new_entry, content if changed or cached_body is None else None)
+
+    if not changed:
+        logging.info(f"변경 없음 (본문 해시 동일): {new_entry['url']}")
+    return {"content": content, "changed": changed, "not_modified": False}
+
+
+def _full_chunks(url, params, headers, chunk_size, kwargs):
+    """검증자 없이 요청해 전체 본문을 조각 단위로 돌려줍니다. (캐시는 갱신하지 않음)"""
+    response = http_client.get(url, params=params, headers=_conditional_headers(None, headers), stream=True,
+                               **kwargs)
+    try:
+        response.raise_for_status()
+        yield from response.iter_content(chunk_size)
+    finally:
+        response.close()
+
+
+@contextmanager
+def conditional_stream(url, params=None, chunk_size=STREAM_CHUNK_SIZE, **kwargs):
+    """
+    캐시된 검증자로 조건부 GET 요청을 보내고 본문을 조각 단위로 읽습니다.
+    호출한 쪽이 필요한 만큼만 읽고 with 블록을 빠져나가면 연결을 닫으므로
+    나머지 본문은 받지 않습니다. 캐시에는 실제로 읽은 부분만 저장합니다.
+
+    사용 예:
+        with conditional_stream(url) as response:
+            for chunk in response["chunks"]:
+                ...
+
+    Args:
+        url (str): 요청 URL
+        params (dict, optional): 쿼리 파라미터
+        chunk_size (int): 한 번에 읽을 크기 (바이트)
+        **kwargs: http_client.get()에 전달할 추가 인자
+
+    Yields:
+        dict: {"chunks": 본문 조각(bytes) 반복자, "not_modified": 304 응답 여부}
+              304 응답이면 chunks는 캐시된 본문을 돌려줍니다. 캐시에 앞부분만 있으면(partial)
+              chunks를 읽을 때 검증자 없이 다시 요청해 전체 본문을 돌려줍니다.
+
+    Raises:
+        requests.RequestException: 요청 실패 또는 오류 응답
+    """
+    key = cache_key(url, params)
+    entry, cached_body = _load_entry(key)
+    request_headers = kwargs.pop('headers', None)
+
+    headers = _conditional_headers(entry, request_headers)
+    response = http_client.get(url, params=params, headers=headers, stream=True, **kwargs)
+    try:
+        if response.status_code == 304 and entry:
+            logging.info(f"변경 없음 (304): {entry.get('url', url)}")
+            if entry.get('partial'):
+                # 캐시된 본문은 잘린 앞부분이므로 본문이 필요할 때만 전체를 다시 받음
+                # (변경 없음만 확인하고 끝내는 호출은 추가 요청 없음)
+                chunks = _full_chunks(url, params, request_headers, chunk_size, kwargs)
+            else:
+                chunks = iter([cached_body])
+            yield {"chunks": chunks, "not_modified": True}
+            return
+
+        response.raise_for_status()
+        consumed = []
+        finished = []
+
+        def read_chunks():
+            for chunk in response.iter_content(chunk_size):
+                consumed.append(chunk)
+                yield chunk
+            finished.append(True)
+
+        yield {"chunks": read_chunks(), "not_modified": False}
+
+        # 읽은 부분만으로 캐시 갱신 (전체를 읽지 않았으면 partial로 표시)
+        body = b"".join(consumed)
+        content_hash = hashlib.sha256(body).hexdigest()
+        changed = not entry or entry.get('content_hash') != content_hash
+        new_entry = {
+            "url": _public_url(url, params),
+            "etag": response.headers.get('ETag'),
+            "last_modified": response.headers.get('Last-Modified'),
+            "content_hash": content_hash,
+            "partial": not finished
+        }
+        if changed or new_entry != entry:
+            _save_entry(key, new_entry, body if changed or cached_body is None else None)
+    finally:
+        response.close()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+공용 HTTP 클라이언트
+호스트별로 연결을 재사용하는 세션 풀, 연결/읽기 제한 시간, 지수 백오프 재시도,
+전체 동시 요청 수 제한을 제공하는 모듈입니다.
+모든 크롤러(게시판 RSS, NEIS 급식/학사일정, 날씨)는 이 모듈을 통해 요청합니다.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+
+# 제한 시간 (초) - 환경변수로 조정 가능
+CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "20"))
+
+# 재시도 설정
+MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+BACKOFF_BASE = 0.5   # 첫 재시도 최대 대기 시간 (초)
+BACKOFF_MAX = 8.0    # 재시도 대기 시간 상한 (초)
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+# 전체 동시 요청 수 제한
+MAX_CONCURRENCY = int(os.getenv("HTTP_MAX_CONCURRENCY", "8"))
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+_concurrency = threading.BoundedSemaphore(MAX_CONCURRENCY)
+
+
+def get_session(url):
+    """
+    URL의 호스트에 해당하는 공용 세션을 반환합니다. (keep-alive 연결 재사용)
+
+    Args:
+        url (str): 요청할 URL
+
+    Returns:
+        requests.Session: 호스트별 세션
+    """
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}"
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            # 재시도는 request()에서 직접 처리
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENCY, max_retries=0)
+            session.mount(key, adapter)
+            _sessions[key] = session
+        return session
+
+
+def close_sessions():
+    """열려 있는 모든 세션을 닫습니다."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def _backoff_delay(attempt):
+    # Full jitter: 0 ~ min(상한, 기본값 * 2^attempt) 사이의 임의 시간
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def request(method, url, params=None, headers=None, timeout=None, retries=None, stream=False):
+    """
+    공용 세션으로 HTTP 요청을 보냅니다.
+    연결 오류, 시간 초과, 5xx/429 응답은 지수 백오프로 재시도합니다.
+
+    Args:
+        method (str): HTTP 메서드
+        url (str): 요청 URL
+        params (dict, optional): 쿼리 파라미터
+        headers (dict, optional): 추가 요청 헤더
+        timeout (tuple, optional): (연결, 읽기) 제한 시간, 없으면 기본값 사용
+        retries (int, optional): 최대 재시도 횟수, 없으면 기본값 사용
+        stream (bool): 응답 본문을 스트리밍으로 읽을지 여부
+
+    Returns:
+        requests.Response: 응답 (재시도 후에도 5xx이면 마지막 응답)
+
+    Raises:
+        requests.RequestException: 재시도 후에도 연결/시간 초과 오류가 계속되는 경우
+    """
+    if timeout is None:
+        timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+    if retries is None:
+        retries = MAX_RETRIES
+
+    session = get_session(url)
+    attempt = 0
+    while True:
+        try:
+            with _concurrency:
+                response = session.request(method, url, params=params, headers=headers,
+                                           timeout=timeout, stream=stream)
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= retries:
+                return response
+            logging.warning(f"HTTP {response.status_code} 응답, 재시도 {attempt + 1}/{retries}: {url}")
+            response.close()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt >= retries:
+                raise
+            logging.warning(f"요청 실패 ({e.__class__.__name__}), 재시도 {attempt + 1}/{retries}: {url}")
+        time.sleep(_backoff_delay(attempt))
+        attempt += 1
+
+
+def get(url, **kwargs):
+    """GET 요청을 보냅니다. 인자는 request()와 같습니다."""
+    return request("GET", url, **kwargs)
@@ -0,0 +1,343 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+통합 크롤러 (오케스트레이터)
+공지사항, 가정통신문 RSS와 NEIS 급식/학사일정 API, 날씨/대기질을 한 번에 동시 수집하고
+모든 페이지와 날씨 스냅샷을 생성하는 메인 스크립트입니다.
+schools.json에 등록된 모든 학교를 동시에 수집하고, 학교마다 자신의 출력 디렉터리에 페이지를 만듭니다.
+HTTP 세션 풀, NEIS 캐시, 템플릿 캐시는 모든 학교가 함께 씁니다.
+같은 교육청 학교가 NEIS_BATCH_MIN_SCHOOLS곳 이상이면 급식/학사일정을 교육청 단위로 한 번에 가져와
+학교별로 나눕니다. (교육청 전체 페이지 수가 학교 수보다 적을 때만)
+
+소스마다 갱신 정책(SOURCE_POLICIES)이 있어 실행할 때마다 갱신 시점이 된 소스만 수집합니다.
+(공지사항/가정통신문 하루 두 번, 급식 매주, 학사일정 매월, 날씨는 weather_collector의 갱신 주기)
+따라서 자주(매시) 실행해도 대부분의 실행은 할 일이 없고, 바뀐 파일은 한 번에 보고합니다.
+마지막 수집 시각은 data/source_runs.json에 저장합니다.
+
+사용법:
+    cd src
+    python main_crawler.py                         # 등록된 모든 학교, 갱신 시점이 된 소스만
+    python main_crawler.py yulgok-m                # 지정한 학교만
+    python main_crawler.py --force                 # 정책과 관계없이 모든 소스 수집 및 페이지 재생성
+    python main_crawler.py --sources notice,meal   # 지정한 소스만 (정책과 관계없이)
+"""
+
+import argparse
+import build_graph
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from concurrent_fetch import run_concurrently
+from crawler import fetch_notices, fetch_letters, save_board_html
+from static_assets import finalize_assets
+from output_writer import report_changes
+from meal_crawler import (fetch_semester_meals, fetch_office_semester_meals, get_target_week, load_week_meals,
+                          save_meal_html)
+from school_schedule_crawler import (fetch_school_year_schedule, fetch_office_school_year_schedule,
+                                     load_month_schedule, save_schedule_html)
+from school_registry import get_school, load_schools
+from weather_collector import collect_weather, publish_weather
+
+# 소스별 제한 시간 (초) - 학교 서버는 응답이 느린 경우가 많음
+SOURCE_TIMEOUTS = {
+    "notice": 40,
+    "letter": 40,
+    "meal": 30,
+    "schedule": 30,
+    "weather": 30
+}
+
+# 학교 하나의 전체 제한 시간 (초) - 소스는 동시에 수집하므로 가장 긴 소스 제한 시간 + 페이지 생성 여유
+SCHOOL_TIMEOUT = max(SOURCE_TIMEOUTS.values()) + 20
+
+# 교육청 단위 일괄 조회를 검토할 최소 학교 수 (그보다 적으면 행 수 확인 요청도 하지 않음)
+BATCH_MIN_SCHOOLS = int(os.getenv("NEIS_BATCH_MIN_SCHOOLS", "10"))
+
+# 교육청 단위 일괄 조회 제한 시간 (초) - 교육청 전체 페이지를 받으므로 학교 하나보다 길게
+OFFICE_TIMEOUT = 120
+
+# 소스별 갱신 정책
+# - max_age: 마지막 수집 후 이 시간이 지나면 수집
+# - period: 기준 시각의 주기 키 (오전/오후, 표시할 주, 달), 마지막 수집 때와 다르면 시간과 관계없이 수집
+# 정책이 None인 소스는 매번 실행 (스스로 갱신 주기를 확인)
+SOURCE_POLICIES = {
+    "notice": {"max_age": timedelta(hours=12), "period": lambda now: f"{now:%Y-%m-%d}-{now.hour // 12}"},
+    "letter": {"max_age": timedelta(hours=12), "period": lambda now: f"{now:%Y-%m-%d}-{now.hour // 12}"},
+    # 토요일부터는 다음 주를 표시하므로 표시할 주가 바뀌면 수집
+    "meal": {"max_age": timedelta(days=7), "period": lambda now: f"{get_target_week(now)[0]:%Y-%m-%d}"},
+    "schedule": {"max_age": timedelta(days=31), "period": lambda now: f"{now:%Y-%m}"},
+    "weather": None,  # weather_collector가 스냅샷 갱신 주기(WEATHER_REFRESH_MINUTES)를 확인
+}
+
+# 예약 실행 시각이 조금씩 밀려도 주기를 건너뛰지 않도록 max_age에서 빼는 여유
+POLICY_GRACE = timedelta(minutes=10)
+
+# 학교/소스별 마지막 수집 기록
+RUNS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'source_runs.json')
+
+# 수집 실패/시간 초과 표시 (변경 없음을 뜻하는 None과 구분)
+FAILED = object()
+
+_runs_lock = threading.Lock()
+
+# 아직 실행 중인 수집 작업 {(학교 id, 소스)} - 소스가 None이면 학교 전체 (페이지 생성 포함)
+# run_concurrently의 제한 시간은 기다리기만 멈추므로, 시간 초과된 작업이 끝날 때까지 여기에 남음
+_running = set()
+_running_lock = threading.Lock()
+
+def _tracked(keys, func):
+    """keys를 실행 중으로 표시하고, func가 끝나면(시간 초과 뒤라도) 표시를 지우는 함수를 반환합니다."""
+    keys = set(keys)
+    with _running_lock:
+        _running.update(keys)
+
+    def run():
+        try:
+            return func()
+        finally:
+            with _running_lock:
+                _running.difference_update(keys)
+    return run
+
+def busy_sources(school_id):
+    """
+    이전 수집에서 아직 끝나지 않은 소스를 반환합니다. (데몬이 같은 소스를 겹쳐 실행하지 않도록 사용)
+
+    Returns:
+        set: 소스 이름 집합 (학교 전체 작업이 실행 중이면 모든 소스)
+    """
+    with _running_lock:
+        names = {name for running_id, name in _running if running_id == school_id}
+    return set(SOURCE_POLICIES) if None in names else names
+
+def load_runs(path=RUNS_FILE):
+    """마지막 수집 기록을 읽습니다. ({학교 id: {소스: {"at": ISO 시각, "period": 주기 키}}})"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_runs(runs, path=RUNS_FILE):
+    """
+    마지막 수집 기록을 저장합니다.
+    배포 대상 파일이 아니므로 write_if_changed를 쓰지 않습니다. (바뀐 파일 목록에 넣지 않음)
+    """
+    with _runs_lock:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(runs, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+
+def is_due(name, last_run, now):
+    """
+    소스가 갱신 시점이 되었는지 확인합니다.
+
+    Args:
+        name (str): 소스 이름 (SOURCE_POLICIES의 키)
+        last_run (dict): 마지막 수집 기록 {"at", "period"}, 없으면 None
+        now (datetime): 기준 시각
+
+    Returns:
+        bool: 수집해야 하면 True
+    """
+    policy = SOURCE_POLICIES[name]
+    if policy is None or not last_run:
+        return True
+    if last_run.get("period") != policy["period"](now):
+        return True
+    try:
+        age = now - datetime.fromisoformat(last_run["at"])
+    except (KeyError, ValueError):
+        return True
+    return age >= policy["max_age"] - POLICY_GRACE
+
+def due_sources(school, runs, now, only=None, force=False):
+    """
+    학교 하나에서 이번에 수집할 소스 목록을 반환합니다.
+    only가 있으면 그 소스만, force가 True이면 정책과 관계없이 모두 수집합니다.
+    """
+    names = only or list(SOURCE_POLICIES)
+    if force or only:
+        return set(names)
+    school_runs = runs.get(school["id"], {})
+    return {name for name in names if is_due(name, school_runs.get(name), now)}
+
+def fetch_office_batches(schools, now=None, due=None):
+    """
+    같은 교육청 학교가 BATCH_MIN_SCHOOLS곳 이상이면 급식/학사일정을 교육청 단위로 한 번에 가져옵니다.
+    due가 있으면 해당 소스를 수집할 학교만 묶습니다. (학교 id -> 수집할 소스 집합)
+
+    Returns:
+        dict: 학교 id -> {"meal": 급식 목록, "schedule": 일정 목록} (일괄 조회한 소스만)
+    """
+    batch_fetchers = {"meal": fetch_office_semester_meals, "schedule": fetch_office_school_year_schedule}
+    offices = {}
+    for school in schools:
+        for name in batch_fetchers:
+            if due is None or name in due[school["id"]]:
+                offices.setdefault((school["atpt_code"], name), []).append(school)
+    tasks = {}
+    for (atpt_code, name), office_schools in offices.items():
+        if len(office_schools) < BATCH_MIN_SCHOOLS:
+            continue
+        tasks[f"{atpt_code}:{name}"] = (
+            _tracked([(school["id"], name) for school in office_schools],
+                     lambda office_schools=office_schools, fetch=batch_fetchers[name]: fetch(office_schools, now)),
+            OFFICE_TIMEOUT)
+    if not tasks:
+        return {}
+
+    batches = {}
+    for key, rows_by_school in run_concurrently(tasks).items():
+        name = key.split(":")[1]
+        for school_id, rows in (rows_by_school or {}).items():
+            batches.setdefault(school_id, {})[name] = rows
+    return batches
+
+def crawl_school(school, now=None, prefetched=None, sources=None, force=False):
+    """
+    학교 하나의 소스를 동시에 수집하고, 수집한 소스의 페이지와 날씨 스냅샷을 생성합니다.
+
+    Args:
+        school (dict): school_registry의 학교 정보
+        now (datetime, optional): 기준 시각, 없으면 현재 시각
+        prefetched (dict, optional): 교육청 단위로 이미 가져온 소스 ({"meal": ..., "schedule": ...})
+        sources (set, optional): 수집할 소스 이름, 없으면 모든 소스
+        force (bool): RSS가 바뀌지 않았어도 게시판 페이지를 다시 생성할지 여부
+
+    Returns:
+        set: 수집에 성공한 소스 이름
+    """
+    now = now or datetime.now()
+    sources = set(SOURCE_TIMEOUTS) if sources is None else set(sources)
+    prefetched = {name: rows for name, rows in (prefetched or {}).items() if name in sources}
+
+    # 수집할 소스를 동시에 수집 (교육청 단위로 이미 가져온 소스는 그 결과 사용)
+    tasks = {
+        "notice": (lambda: fetch_notices(school, skip_unchanged=not force), SOURCE_TIMEOUTS["notice"]),
+        "letter": (lambda: fetch_letters(school, skip_unchanged=not force), SOURCE_TIMEOUTS["letter"]),
+        # 급식은 학기 전체, 학사일정은 학년도 전체를 저장소에 넣음 (NEIS 캐시가 유효한 달은 요청 없음)
+        # NEIS 오류는 빈 목록 대신 예외로 받아 실패로 기록
+        "meal": (lambda: fetch_semester_meals(now, school=school, raise_errors=True), SOURCE_TIMEOUTS["meal"]),
+        "schedule": (lambda: fetch_school_year_schedule(now, school=school, raise_errors=True),
+                     SOURCE_TIMEOUTS["schedule"]),
+        "weather": (lambda: collect_weather(now=now, school=school), SOURCE_TIMEOUTS["weather"])
+    }
+    results = run_concurrently({name: (_tracked([(school["id"], name)], func), timeout)
+                                for name, (func, timeout) in tasks.items()
+                                if name in sources and name not in prefetched}, default=FAILED)
+    results.update(prefetched)
+    # 게시판 요청/파싱 오류는 meta.error가 있는 빈 결과로 돌아오므로 실패로 처리 (기존 페이지 유지)
+    for name in ("notice", "letter"):
+        result = results.get(name)
+        if isinstance(result, dict) and result.get("meta", {}).get("error"):
+            logging.error(f"{school['id']} {name} 수집 실패: {result['meta']['error']}")
+            results[name] = FAILED
+    succeeded = {name for name, result in results.items() if result is not FAILED}
+    results = {name: (None if result is FAILED else result) for name, result in results.items()}
+
+    # 공지사항/가정통신문 HTML 생성 (수집하지 않음/변경 없음/시간 초과 시 기존 파일 유지)
+    save_board_html(results.get("notice"), results.get("letter"), school)
+
+    # 급식 정보 HTML 생성 (이번 주를 저장소에서 읽음, 주가 바뀌면 응답이 같아도 다시 생성, 내용이 같으면 저장 생략)
+    if "meal" in sources:
+        week_meals = load_week_meals(now, fallback=results.get("meal"), school=school)
+        if week_meals:
+            save_meal_html(week_meals, school)
+        else:
+            print(f"{school['name']} 급식 정보를 가져오는데 실패했습니다.")
+
+    # 학사일정 HTML 생성 (시간 초과 시 기존 파일 유지)
+    if results.get("schedule") is not None:
+        schedules = load_month_schedule(now.year, now.month, fallback=results["schedule"], school=school)
+        save_schedule_html(schedules, now.year, now.month, school)
+
+    # 날씨 스냅샷 저장 (갱신 주기 안이면 기존 파일 유지)
+    if results.get("weather") is not None:
+        publish_weather(results["weather"], school["weather_path"])
+    return succeeded
+
+def run_cycle(schools, due, now=None, force=False):
+    """
+    학교별로 지정한 소스를 한 번 수집하고 페이지를 생성합니다. (통합 크롤러와 데몬이 함께 사용)
+    성공한 소스는 수집 기록에 남기고, 마지막에 자산 정리와 빌드 그래프 저장을 합니다.
+
+    Args:
+        schools (list): school_registry의 학교 정보 목록
+        due (dict): 학교 id -> 수집할 소스 이름 집합
+        now (datetime, optional): 기준 시각, 없으면 현재 시각
+        force (bool): RSS가 바뀌지 않았어도 게시판 페이지를 다시 생성할지 여부
+
+    Returns:
+        dict: 학교 id -> 수집에 성공한 소스 집합 (학교 전체가 실패하면 False)
+    """
+    now = now or datetime.now()
+
+    # 학교가 많은 교육청은 급식/학사일정을 먼저 교육청 단위로 가져옴
+    batches = fetch_office_batches(schools, now, due)
+
+    # 모든 학교의 갱신 시점이 된 소스를 동시에 수집 (전체 동시 요청 수는 http_client가 제한)
+    results = run_concurrently({
+        school["id"]: (_tracked([(school["id"], None)],
+                                lambda school=school: crawl_school(school, now, batches.get(school["id"]),
+                                                                   due[school["id"]], force)), SCHOOL_TIMEOUT)
+        for school in schools if due[school["id"]]
+    }, default=False)
+    failed = [school_id for school_id, result in results.items() if result is False]
+    if failed:
+        logging.error(f"수집하지 못한 학교: {', '.join(failed)}")
+
+    # 성공한 소스의 수집 기록 갱신 (실패한 소스는 다음 실행에서 다시 수집)
+    # 정책이 없는 소스(매번 수집하는 날씨)는 기록하지 않아 수집 기록이 실행마다 바뀌지 않게 함
+    runs = load_runs()
+    recorded = False
+    for school_id, succeeded in results.items():
+        for name in succeeded or ():
+            policy = SOURCE_POLICIES[name]
+            if policy is None:
+                continue
+            runs.setdefault(school_id, {})[name] = {
+                "at": now.isoformat(timespec="seconds"),
+                "period": policy["period"](now)
+            }
+            recorded = True
+    if recorded:
+        save_runs(runs)
+
+    # 더 이상 참조되지 않는 이전 CSS/JS 파일 정리
+    finalize_assets()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="통합 크롤러 (갱신 시점이 된 소스만 수집)")
+    parser.add_argument("schools", nargs="*", help="수집할 학교 id (없으면 등록된 모든 학교)")
+    parser.add_argument("--force", action="store_true", help="갱신 정책과 관계없이 모든 소스를 수집하고 페이지 재생성")
+    parser.add_argument("--sources", default="", help=f"수집할 소스 (쉼표 구분: {','.join(SOURCE_POLICIES)})")
+    args = parser.parse_args()
+    only = [name for name in args.sources.split(",") if name]
+    unknown = [name for name in only if name not in SOURCE_POLICIES]
+    if unknown:
+        parser.error(f"알 수 없는 소스: {', '.join(unknown)}")
+
+    if args.force:
+        # 템플릿 외 코드가 바뀐 경우에도 반영되도록 모든 생성물을 다시 만듦
+        build_graph.rebuild_all()
+
+    now = datetime.now()
+    schools = [get_school(school_id) for school_id in args.schools] if args.schools else load_schools()
+    runs = load_runs()
+    due = {school["id"]: due_sources(school, runs, now, only, args.force) for school in schools}
+    for school in schools:
+        print(f"{school['name']} 수집 대상: {', '.join(sorted(due[school['id']])) or '없음'}")
+    run_cycle(schools, due, now, args.force)
+
+    # 이번 실행에서 바뀐 모든 파일을 한 번에 출력 (배포 여부 판단용)
+    report_changes()
+
+if __name__ == "__main__":
+    main()
@@ -1,1076 +1,119 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import requests
+import build_graph
+import content_store
+import data_api
+import date_utils
+import math
+import menu_parser
+import neis_client
 from datetime import datetime, timedelta
-import json
 import os
 from dotenv import load_dotenv
+from static_assets import finalize_assets
+from output_writer import write_if_changed, report_changes
+from template_engine import render_page, template_fingerprint
+from school_registry import get_school, source_key
 
 # .env 파일 로드
 load_dotenv()
 
-def get_meal_info(api_key, school_code, start_date, end_date):
+# 학교 및 API 정보
+API_KEY = os.getenv("NEIS_API_KEY", "dafe93db7c0d4c6eb8ba9a8f5aaee96b")  # 환경변수에서 가져오거나 기본값 사용
+SCHOOL = get_school()  # schools.json의 기본 학교
+SCHOOL_CODE = SCHOOL["school_code"]
+SCHOOL_NAME = SCHOOL["name"]
+
+def get_meal_info(api_key, school_code, start_date, end_date, skip_unchanged=False, atpt_code="J10", source="meals",
+                  raise_errors=False):
     """
     NEIS API를 통해 급식 정보를 가져옵니다.
+    기간 길이에 제한이 없으며(학기 전체 등), 페이지가 여러 개면 모두 가져옵니다.
+    skip_unchanged가 True이고 응답이 이전 실행과 같으면 None을 반환합니다.
+    가져온 급식은 저장소의 source 키(학교별 구분)에 넣습니다.
+    실패하면 빈 목록을 반환하고, raise_errors가 True이면 예외를 그대로 전달합니다. (통합 크롤러가 실패로 기록)
     """
-    base_url = "https://open.neis.go.kr/hub/mealServiceDietInfo"
     params = {
         "KEY": api_key,
-        "Type": "json",
-        "ATPT_OFCDC_SC_CODE": "J10",  # 경기도교육청
-        "SD_SCHUL_CODE": school_code,  # 학교코드
-        "MLSV_FROM_YMD": start_date,
-        "MLSV_TO_YMD": end_date
+        "ATPT_OFCDC_SC_CODE": atpt_code,  # 교육청 코드 (J10: 경기도교육청)
+        "SD_SCHUL_CODE": school_code  # 학교코드
     }
     
     try:
-        response = requests.get(base_url, params=params)
-        data = response.json()
-        
-        if 'mealServiceDietInfo' not in data:
-            return []
-            
-        meals = data['mealServiceDietInfo'][1]['row']
+        response = neis_client.fetch_range("mealServiceDietInfo", params, start_date, end_date)
+        if skip_unchanged and not response["changed"]:
+            print("급식 정보 변경 없음")
+            return None
+        # 받은 기간 전체를 저장소에 반영 (기간 안에서 빠진 급식은 삭제로 표시)
+        stored_range = (date_utils.normalize_date(start_date, "neis"), date_utils.normalize_date(end_date, "neis"))
+        meals = response["rows"]
+        content_store.upsert_items(source, meals, replace_range=stored_range)
         return meals
     except Exception as e:
         print(f"급식 정보 가져오기 실패: {str(e)}")
+        if raise_errors:
+            raise
         return []
 
-def generate_meal_html(meals, school_name):
-    """
-    급식 정보를 HTML로 변환합니다.
+def get_office_meal_info(api_key, atpt_code, schools, start_date, end_date):
     """
-    css_style = """
-        @font-face {
-            font-family: 'SeoulAlrim';
-            src: url('font/SeoulAlrimTTF-Medium.ttf') format('truetype');
-            font-weight: normal;
-            font-style: normal;
-        }
-
-        body {
-            background: #008b8b;
-            font-family: 'SeoulAlrim', sans-serif;
-            margin: 0; 
-            padding: 0;
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-        }
-
-        .page-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            background: linear-gradient(90deg, #008b8b, #006666);
-            padding: 25px 70px;
-            box-shadow: 0 8px 32px rgba(0, 139, 139, 0.18);
-            flex-shrink: 0;
-        }
-
-        .header-left {
-            display: flex;
-            align-items: center;
-            gap: 30px;
-        }
-
-        .header-main-title {
-            font-size: 4.8rem;
-            font-weight: 900; 
-            color: #FFFFFF;
-            letter-spacing: -2px;
-            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.1);
-            margin: 0;
-        }
-
-        .header-right {
-            display: flex;
-            align-items: center;
-            gap: 60px;
-        }
-
-        .page-header .weather, 
-        .page-header .date-time {
-            font-size: 1.9rem;
-            color: #FFFFFF;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.1);
-        }
-
-        .page-header .date-time {
-            line-height: 1.3;
-            text-align: right;
-            font-size: 1.6rem;
-        }
-
-        .page-header .weather {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-
-        .page-header .weather-content {
-            display: flex;
-            flex-direction: column;
-            align-items: flex-start;
-            gap: 5px;
-        }
-
-        .page-header .weather-icon {
-            width: 40px;
-            height: 40px;
-            flex-shrink: 0;
-        }
-
-        .page-header .weather-temp {
-            font-size: 1.9rem;
-        }
-
-        .page-header .school-name {
-            font-size: 1.9rem;
-            color: #FFFFFF;
-            font-weight: 700;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.1);
-            white-space: nowrap;
-        }
-
-        @media (max-width: 1380px) {
-            .page-header {
-                flex-direction: column;
-                padding: 25px;
-                gap: 20px;
-            }
-            .header-left, .header-right {
-                width: 100%;
-                justify-content: center;
-                gap: 40px;
-            }
-            .header-main-title {
-                font-size: 4.2rem;
-            }
-            .page-header .school-name {
-                font-size: 1.9rem;
-            }
-        }
-
-        @media (max-width: 768px) {
-            .page-header {
-                padding: 20px;
-            }
-            .header-main-title {
-                font-size: 3.4rem;
-            }
-            .header-left, .header-right {
-                flex-direction: column;
-                gap: 30px;
-            }
-            .page-header .school-name {
-                font-size: 1.7rem;
-            }
-        }
-
-        @media (max-width: 480px) {
-            .page-header {
-                padding: 15px 10px;
-                gap: 15px;
-            }
-            .header-left, .header-right {
-                gap: 20px;
-            }
-            .header-main-title { 
-                font-size: 2.2rem; 
-                text-align: center;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.4rem;
-            }
-            .page-header .weather-icon {
-                width: 35px;
-                height: 35px;
-            }
-            .page-header .weather-temp {
-                font-size: 1.6rem;
-            }
-            .meal-container {
-                margin: 20px auto;
-                padding: 15px;
-                width: 98%;
-                flex-direction: column;
-                flex-wrap: nowrap;
-                max-height: none;
-                overflow-x: visible;
-                gap: 15px;
-            }
-            .meal-day-container {
-                min-width: auto;
-                flex: none;
-                width: 100%;
-            }
-            .meal-date {
-                font-size: 1.5rem;
-                padding: 10px;
-            }
-            .meal-menu {
-                font-size: 1.4rem;
-                line-height: 1.3;
-            }
-            .meal-menu span {
-                margin-bottom: 5px;
-            }
-            .allergen {
-                font-size: 1.2rem;
-                margin-top: 9px;
-                padding-top: 9px;
-            }
-            .calorie {
-                font-size: 1.2rem;
-                margin-top: 9px;
-                padding-top: 9px;
-            }
-            .notice-text {
-                font-size: 1.3rem;
-                margin: 13px auto;
-                padding: 13px;
-                width: 98%;
-            }
-        }
-
-        /* 75% 화면 크기 대응을 위한 새로운 미디어 쿼리 */
-        @media (max-width: 75vw) {
-            .page-header {
-                padding: 20px 30px;
-                gap: 20px;
-            }
-            .header-main-title {
-                font-size: 3.8rem;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.6rem;
-            }
-            .page-header .weather-icon {
-                width: 36px;
-                height: 36px;
-            }
-            .page-header .weather-temp {
-                font-size: 1.6rem;
-            }
-            .meal-container {
-                margin: 15px auto;
-                padding: 12px;
-                gap: 10px;
-            }
-            .meal-date {
-                font-size: 1.5rem;
-                padding: 9px;
-            }
-            .meal-menu {
-                font-size: 1.5rem;
-                line-height: 1.3;
-            }
-            .meal-menu span {
-                margin-bottom: 5px;
-            }
-            .allergen {
-                font-size: 1.3rem;
-                margin-top: 7px;
-                padding-top: 7px;
-            }
-            .notice-text {
-                font-size: 1.2rem;
-                margin: 11px auto;
-                padding: 11px;
-            }
-        }
-
-        /* 16:9 비율 모니터 최적화 (높이 제한, 너비 제한) */
-        @media (max-height: 800px) and (max-width: 1999px) {
-            .page-header {
-                padding: 15px 25px;
-                gap: 15px;
-            }
-            .header-main-title {
-                font-size: 3rem;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.4rem;
-            }
-            .page-header .weather-icon {
-                width: 35px;
-                height: 35px;
-            }
-            .page-header .weather-temp {
-                font-size: 1.6rem;
-            }
-            .meal-container {
-                margin: 10px auto;
-                padding: 10px;
-                gap: 8px;
-            }
-            .meal-date {
-                font-size: 1.4rem;
-                padding: 7px;
-            }
-            .meal-menu {
-                font-size: 1.3rem;
-                line-height: 1.2;
-            }
-            .meal-menu span {
-                margin-bottom: 4px;
-            }
-            .allergen {
-                font-size: 1.2rem;
-                margin-top: 5px;
-                padding-top: 5px;
-            }
-            .calorie {
-                font-size: 1.2rem;
-                margin-top: 5px;
-                padding-top: 5px;
-            }
-            .notice-text {
-                font-size: 1.2rem;
-                margin: 7px auto;
-                padding: 7px;
-            }
-        }
-
-        /* 32:9 비율 모니터 최적화 (높이 제한, 너비 확장) */
-        @media (max-height: 800px) and (min-width: 2000px) {
-            .page-header {
-                padding: 15px 25px;
-                gap: 15px;
-            }
-            .header-main-title {
-                font-size: 2.4rem;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.4rem;
-            }
-            .page-header .weather-icon {
-                width: 35px;
-                height: 35px;
-            }
-            .page-header .weather-temp {
-                font-size: 1.6rem;
-            }
-            .meal-container {
-                margin: 10px auto;
-                padding: 10px;
-                gap: 8px;
-            }
-            .meal-date {
-                font-size: 1.3rem;
-                padding: 7px;
-            }
-            .meal-menu {
-                font-size: 1.2rem;
-                line-height: 1.2;
-            }
-            .meal-menu span {
-                margin-bottom: 3px;
-            }
-            .allergen {
-                font-size: 1.1rem;
-                margin-top: 5px;
-                padding-top: 5px;
-            }
-            .calorie {
-                font-size: 1.1rem;
-                margin-top: 5px;
-                padding-top: 5px;
-            }
-            .notice-text {
-                font-size: 1.1rem;
-                margin: 7px auto;
-                padding: 7px;
-            }
-        }
-
-        /* 매우 작은 화면에서의 추가 최적화 */
-        @media (max-width: 75vw) and (max-height: 600px) {
-            .page-header {
-                padding: 10px 20px;
-                gap: 10px;
-            }
-            .header-main-title {
-                font-size: 3rem;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.4rem;
-            }
-            .page-header .weather-icon {
-                width: 30px;
-                height: 30px;
-            }
-            .page-header .weather-temp {
-                font-size: 1.4rem;
-            }
-            .meal-container {
-                margin: 8px auto;
-                padding: 8px;
-                gap: 6px;
-            }
-            .meal-date {
-                font-size: 1.2rem;
-                padding: 5px;
-            }
-            .meal-menu {
-                font-size: 1.1rem;
-                line-height: 1.1;
-            }
-            .meal-menu span {
-                margin-bottom: 3px;
-            }
-            .allergen {
-                font-size: 1rem;
-                margin-top: 4px;
-                padding-top: 4px;
-            }
-            .calorie {
-                font-size: 1rem;
-                margin-top: 4px;
-                padding-top: 4px;
-            }
-            .notice-text {
-                font-size: 1rem;
-                margin: 5px auto;
-                padding: 5px;
-            }
-        }
-
-        @media (max-height: 600px) {
-            .page-header {
-                padding: 10px 15px;
-                min-height: 50px;
-            }
-            .header-main-title {
-                font-size: 2.6rem;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.4rem;
-            }
-            .page-header .weather-icon {
-                width: 35px;
-                height: 35px;
-            }
-            .meal-container {
-                margin: 10px auto;
-                padding: 10px;
-                flex-direction: column;
-                flex-wrap: nowrap;
-                max-height: none;
-                overflow-x: visible;
-                gap: 10px;
-            }
-            .meal-day-container {
-                min-width: auto;
-                flex: none;
-                width: 100%;
-            }
-            .meal-date {
-                font-size: 1.4rem;
-                padding: 6px;
-            }
-            .meal-menu {
-                font-size: 1.3rem;
-                line-height: 1.2;
-            }
-            .meal-menu span {
-                margin-bottom: 4px;
-            }
-            .allergen {
-                font-size: 1.2rem;
-                margin-top: 6px;
-                padding-top: 6px;
-            }
-            .calorie {
-                font-size: 1.2rem;
-                margin-top: 6px;
-                padding-top: 6px;
-            }
-            .notice-text {
-                font-size: 1.4rem;
-                margin: 8px auto;
-                padding: 8px;
-            }
-        }
-
-        .meal-container {
-            display: flex; 
-            flex-wrap: wrap;
-            gap: 12px;
-            margin: 20px auto;
-            padding: 15px;
-            width: 95%;
-            max-width: 2000px;
-            background: #FFFFFF;
-            border-radius: 20px;
-            box-shadow: 0 8px 40px rgba(0, 139, 139, 0.18);
-            overflow-x: visible;
-            max-height: none;
-        }
-
-        .meal-day-container {
-            display: flex;
-            flex-direction: column;
-            gap: 0;
-            flex: 1 1 300px;
-            min-width: 200px;
-        }
+    같은 교육청 학교들의 급식 정보를 교육청 전체 조회 한 번으로 가져와 학교별로 나눕니다.
+    교육청 전체 페이지 수가 학교 수보다 적을 때만 일괄 조회하고, 아니면 None을 반환합니다.
+    학교별 급식은 각 학교의 저장소 키에 넣습니다.
 
-        .meal-date {
-            background: #E0F7F7;
-            border-radius: 15px 15px 0 0;
-            padding: 10px;
-            font-size: 1.7rem;
-            font-weight: 900;
-            color: #222;
-            text-align: center;
-            text-shadow: 1px 1px 0 rgba(255, 255, 255, 0.5);
-        }
-
-        .meal-card {
-            background: white;
-            border-radius: 0 0 15px 15px;
-            padding: 12px;
-            flex: 1;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-            border: 1px solid #E5E5E5;
-            border-top: none;
-            overflow: visible;
-        }
-
-        .meal-menu {
-            font-size: 1.7rem;
-            line-height: 1.4;
-            color: #333;
-            white-space: pre-line;
-            font-weight: 500;
-            letter-spacing: -0.02em;
-        }
-
-        .meal-menu span {
-            display: block;
-            margin-bottom: 8px;
-            text-shadow: 0 0 1px rgba(0, 0, 0, 0.08);
-        }
-
-        .allergen {
-            font-size: 1.4rem;
-            color: #666;
-            margin-top: 10px;
-            font-weight: 500;
-            border-top: 1px solid #eee;
-            padding-top: 10px;
-        }
-
-        .calorie {
-            font-size: 1.4rem;
-            color: #008b8b;
-            margin-top: 10px;
-            font-weight: 600;
-            border-top: 1px solid #eee;
-            padding-top: 10px;
-        }
-
-        /* 반응형 디자인 수정 */
-        @media (max-width: 1400px) {
-            .meal-container {
-                flex-wrap: wrap;
-                overflow-x: visible;
-                max-height: none;
-            }
-            .meal-day-container {
-                flex: 1 1 280px;
-                min-width: 280px;
-            }
-            .meal-date {
-                font-size: 1.9rem;
-                padding: 9px;
-            }
-            .meal-menu {
-                font-size: 1.9rem;
-                line-height: 1.3;
-            }
-            .meal-menu span {
-                margin-bottom: 7px;
-            }
-            .allergen {
-                font-size: 1.6rem;
-                margin-top: 9px;
-                padding-top: 9px;
-            }
-            .calorie {
-                font-size: 1.6rem;
-                margin-top: 9px;
-                padding-top: 9px;
-            }
-        }
-
-        @media (max-height: 800px) {
-            .meal-container {
-                flex-direction: column;
-                flex-wrap: nowrap;
-                max-height: none;
-                overflow-x: visible;
-                gap: 15px;
-            }
-            .meal-day-container {
-                min-width: auto;
-                flex: none;
-                width: 100%;
-            }
-            .meal-menu {
-                font-size: 1.5rem;
-                line-height: 1.3;
-            }
-            .meal-menu span {
-                margin-bottom: 5px;
-            }
-            .allergen {
-                font-size: 1.3rem;
-                margin-top: 9px;
-                padding-top: 9px;
-            }
-            .calorie {
-                font-size: 1.3rem;
-                margin-top: 9px;
-                padding-top: 9px;
-            }
-            .calorie {
-                font-size: 1.3rem;
-                margin-top: 9px;
-                padding-top: 9px;
-            }
-        }
-
-
-
-        .notice-text {
-            text-align: center;
-            color: #666;
-            font-size: 1.6rem;
-            margin: 15px auto;
-            line-height: 1.4;
-            max-width: 2000px;
-            width: 95%;
-            padding: 15px;
-            background: #FFFFFF;
-            border-radius: 15px;
-            box-shadow: 0 4px 20px rgba(0, 139, 139, 0.1);
-        }
+    Returns:
+        dict: 학교 id -> 급식 목록 (저장에 실패한 학교는 빠짐), 일괄 조회하지 않았거나 실패하면 None
     """
-
-    js_code = """
-        // 날씨 캐시 설정
-        const WEATHER_CACHE_KEY = 'headerWeatherData_v2';
-        const WEATHER_TIMESTAMP_KEY = 'headerWeatherTimestamp_v2';
-        const WEATHER_UPDATE_INTERVAL = 60 * 60 * 1000; // 1시간 (밀리초)
-
-        function updateDateTime() {
-            const now = new Date();
-            const year = now.getFullYear();
-            const month = String(now.getMonth() + 1).padStart(2, '0');
-            const day = String(now.getDate()).padStart(2, '0');
-            const weekDays = ['일', '월', '화', '수', '목', '금', '토'];
-            const weekDay = weekDays[now.getDay()];
-
-            let hours = now.getHours();
-            const ampm = hours >= 12 ? '오후' : '오전';
-            hours = hours % 12;
-            hours = hours ? hours : 12; 
-            const displayHours = String(hours).padStart(2, '0');
-            const minutes = String(now.getMinutes()).padStart(2, '0');
-
-            const dateString = `${year}.${month}.${day} ${weekDay}요일`;
-            const timeString = `${ampm} ${displayHours}:${minutes}`;
-
-            document.getElementById('date-time').innerHTML = `${dateString}<br>${timeString}`;
-        }
-
-        // 캐시에서 날씨 데이터 가져오기
-        function getCachedWeatherData() {
-            try {
-                const cachedData = localStorage.getItem(WEATHER_CACHE_KEY);
-                const timestamp = localStorage.getItem(WEATHER_TIMESTAMP_KEY);
-                
-                if (cachedData && timestamp) {
-                    const data = JSON.parse(cachedData);
-                    const lastUpdate = parseInt(timestamp);
-                    const now = Date.now();
-                    
-                    // 1시간이 지나지 않았다면 캐시된 데이터 사용
-                    if (now - lastUpdate < WEATHER_UPDATE_INTERVAL) {
-                        console.log('캐시된 헤더 날씨 데이터 사용 중...');
-                        return data;
-                    }
-                }
-            } catch (error) {
-                console.error('날씨 캐시 데이터 읽기 실패:', error);
-            }
-            return null;
-        }
-
-        // 날씨 데이터를 캐시에 저장하기
-        function saveWeatherDataToCache(data) {
-            try {
-                localStorage.setItem(WEATHER_CACHE_KEY, JSON.stringify(data));
-                localStorage.setItem(WEATHER_TIMESTAMP_KEY, Date.now().toString());
-                console.log('헤더 날씨 데이터가 캐시에 저장되었습니다.');
-            } catch (error) {
-                console.error('날씨 캐시 저장 실패:', error);
-            }
-        }
-
-        // 날씨 데이터를 화면에 표시하는 함수
-        function displayWeatherData(weatherData) {
-            const temp = Math.round(weatherData.main.temp);
-            const weatherInfo = getWeatherInfo(
-                weatherData.weather[0].main, 
-                weatherData.weather[0].description, 
-                weatherData.isDay
-            );
-            document.querySelector('.weather').innerHTML =
-                `<img class='weather-icon' src='images/${weatherInfo.icon}' alt='날씨아이콘'>
-                 <div class='weather-content'>
-                    <div>${weatherInfo.text}</div>
-                    <div class='weather-temp'>${temp}℃</div>
-                 </div>`;
-        }
-
-        // 초기 날씨 데이터 로드 함수
-        async function loadInitialWeather() {
-            // 먼저 캐시에서 데이터 확인
-            const cachedData = getCachedWeatherData();
-            if (cachedData) {
-                console.log('캐시된 헤더 날씨 데이터로 초기 로드 중...');
-                displayWeatherData(cachedData);
-                return;
-            }
-            
-            // 캐시에 데이터가 없거나 만료된 경우에만 API 호출
-            console.log('헤더 날씨 데이터 초기 로드 중...');
-            await fetchWeather();
-        }
-
-        // 날씨 정보 업데이트 함수 (1시간마다)
-        async function updateWeatherIfNeeded() {
-            // 먼저 캐시에서 데이터 확인
-            const cachedData = getCachedWeatherData();
-            if (cachedData) {
-                // 캐시가 유효하면 표시 함수 호출하지 않음 (이미 표시되어 있음)
-                console.log('캐시된 헤더 날씨 데이터가 유효합니다.');
-                return;
-            }
-            
-            // 캐시에 데이터가 없거나 만료된 경우에만 API 호출
-            console.log('헤더 날씨 정보 업데이트 중...');
-            await fetchWeather();
-        }
-
-        async function fetchWeather() {
-            const apiKey = '""" + os.getenv("OPENWEATHER_API_KEY", "") + """';
-            const lat = 37.7599;
-            const lon = 126.7733;
-            const url = `https://api.openweathermap.org/data/2.5/weather?lat=${lat}&lon=${lon}&appid=${apiKey}&units=metric`;
-            
-            try {
-                const res = await fetch(url);
-                const data = await res.json();
-                
-                if (!data.weather || !data.weather[0]) throw new Error('Invalid weather data');
-                
-                // 현재 시간을 기준으로 낮/밤 판단
-                const now = new Date();
-                const currentHour = now.getHours();
-                const isDay = currentHour >= 6 && currentHour < 18; // 6시~18시는 낮
-                
-                // isDay 정보를 데이터에 추가
-                data.isDay = isDay;
-                
-                // 데이터를 화면에 표시
-                displayWeatherData(data);
-                
-                // 성공적으로 데이터를 가져왔다면 캐시에 저장
-                saveWeatherDataToCache(data);
-                
-            } catch (e) {
-                console.error("Weather fetch error: ", e);
-                document.querySelector('.weather').textContent = '날씨 정보를 불러올 수 없습니다';
-            }
-        }
-
-        // OpenWeatherMap API 2.5와 커스텀 날씨 아이콘 매핑
-        function getWeatherInfo(weatherMain, weatherDescription, isDay = true) {
-            // 메인 날씨 조건별 매핑
-            const mainWeatherMap = {
-                'Clear': { 
-                    text: '맑음', 
-                    icon: 'weather/1.png' // 태양 아이콘
-                },
-                'Clouds': {
-                    text: '구름',
-                    icon: getCloudIcon(weatherDescription) // 구름 정도에 따라 다른 아이콘
-                },
-                'Rain': {
-                    text: '비',
-                    icon: getRainIcon(weatherDescription) // 비의 강도에 따라 다른 아이콘
-                },
-                'Drizzle': {
-                    text: '이슬비',
-                    icon: 'weather/14.png' // 물방울 아이콘
-                },
-                'Thunderstorm': {
-                    text: '뇌우',
-                    icon: 'weather/7.png' // 번개 아이콘
-                },
-                'Snow': {
-                    text: '눈',
-                    icon: 'weather/5.png' // 눈송이 아이콘
-                },
-                'Mist': {
-                    text: '안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Fog': {
-                    text: '짙은 안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Smoke': {
-                    text: '연기',
-                    icon: 'weather/16.png' // 안개 아이콘 (비슷한 시야 제한)
-                },
-                'Haze': {
-                    text: '실안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Dust': {
-                    text: '먼지',
-                    icon: 'weather/11.png' // 바람 아이콘
-                },
-                'Sand': {
-                    text: '모래바람',
-                    icon: 'weather/11.png' // 바람 아이콘
-                },
-                'Ash': {
-                    text: '화산재',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Squall': {
-                    text: '돌풍',
-                    icon: 'weather/11.png' // 바람 아이콘
-                },
-                'Tornado': {
-                    text: '토네이도',
-                    icon: 'weather/11.png' // 바람 아이콘
-                }
-            };
-
-            // 구름 상태에 따른 아이콘 선택
-            function getCloudIcon(description) {
-                const desc = description.toLowerCase();
-                if (desc.includes('few clouds')) {
-                    return 'weather/3.png'; // 부분적으로 구름 낀 맑은 날씨
-                } else if (desc.includes('scattered clouds') || desc.includes('broken clouds')) {
-                    return 'weather/2.png'; // 구름 많음
-                } else if (desc.includes('overcast')) {
-                    return 'weather/8.png'; // 완전히 흐림
-                }
-                return 'weather/2.png'; // 기본 구름 아이콘
-            }
-
-            // 비의 강도에 따른 아이콘 선택
-            function getRainIcon(description) {
-                const desc = description.toLowerCase();
-                if (desc.includes('light rain') || desc.includes('drizzle')) {
-                    return 'weather/14.png'; // 가벼운 비 (물방울)
-                } else if (desc.includes('heavy rain') || desc.includes('extreme rain')) {
-                    return 'weather/6.png'; // 폭우
-                } else if (desc.includes('thunderstorm')) {
-                    return 'weather/10.png'; // 천둥번개를 동반한 비
-                }
-                return 'weather/4.png'; // 기본 비 아이콘
-            }
-
-            // 야간 모드 처리 (달 아이콘 사용)
-            function getNightIcon(weatherMain) {
-                if (weatherMain === 'Clear') {
-                    return 'weather/15.png'; // 달과 별 아이콘
-                }
-                // 다른 날씨는 동일한 아이콘 사용
-                return mainWeatherMap[weatherMain]?.icon || 'weather/1.png';
-            }
-
-            // 메인 날씨 정보 가져오기
-            let weatherInfo = mainWeatherMap[weatherMain] || { 
-                text: weatherMain, 
-                icon: 'weather/1.png' 
-            };
-
-            // 야간인 경우 아이콘 변경
-            if (!isDay && weatherMain === 'Clear') {
-                weatherInfo.icon = getNightIcon(weatherMain);
-            }
-
-            return weatherInfo;
-        }
-
-        // 동적 글씨 크기 조절 함수
-        function adjustFontSizeForScreen() {
-            const viewportHeight = window.innerHeight;
-            const viewportWidth = window.innerWidth;
-            const mealContainer = document.querySelector('.meal-container');
-            const pageHeader = document.querySelector('.page-header');
-            
-            if (!mealContainer || !pageHeader) return;
-            
-            // 화면 높이에 따른 동적 조절
-            if (viewportHeight < 600) {
-                // 매우 작은 화면
-                document.body.style.setProperty('--dynamic-font-scale', '0.8');
-                mealContainer.style.maxHeight = 'calc(100vh - 120px)';
-                mealContainer.style.overflowY = 'auto';
-            } else if (viewportHeight < 800) {
-                // 작은 화면
-                document.body.style.setProperty('--dynamic-font-scale', '0.9');
-                mealContainer.style.maxHeight = 'calc(100vh - 150px)';
-                mealContainer.style.overflowY = 'auto';
-            } else {
-                // 큰 화면
-                document.body.style.setProperty('--dynamic-font-scale', '1');
-                mealContainer.style.maxHeight = 'none';
-                mealContainer.style.overflowY = 'visible';
-            }
-            
-            // 화면 너비가 75% 이하일 때 추가 조절
-            if (viewportWidth < window.screen.width * 0.75) {
-                const currentScale = getComputedStyle(document.body).getPropertyValue('--dynamic-font-scale');
-                const newScale = Math.min(parseFloat(currentScale) * 0.9, 0.8);
-                document.body.style.setProperty('--dynamic-font-scale', newScale.toString());
-            }
-        }
-
-        // CSS 변수를 활용한 동적 스타일 적용
-        function applyDynamicStyles() {
-            const style = document.createElement('style');
-            style.textContent = `
-                :root {
-                    --dynamic-font-scale: 1;
-                }
-                
-                .meal-menu {
-                    font-size: calc(1.7rem * var(--dynamic-font-scale)) !important;
-                }
-                
-                .meal-date {
-                    font-size: calc(1.7rem * var(--dynamic-font-scale)) !important;
-                }
-                
-            .allergen {
-                font-size: calc(1.4rem * var(--dynamic-font-scale)) !important;
-            }
-            
-            .calorie {
-                font-size: calc(1.4rem * var(--dynamic-font-scale)) !important;
-            }
-                
-                .notice-text {
-                    font-size: calc(1.6rem * var(--dynamic-font-scale)) !important;
-                }
-                
-            .header-main-title {
-                font-size: calc(4.8rem * var(--dynamic-font-scale)) !important;
-            }
-            
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: calc(1.9rem * var(--dynamic-font-scale)) !important;
-            }
-            
-            .page-header .weather-temp {
-                font-size: calc(1.9rem * var(--dynamic-font-scale)) !important;
-            }
-            `;
-            document.head.appendChild(style);
-        }
-
-        // 초기 로드 및 주기적 업데이트 설정
-        setInterval(updateDateTime, 1000);
-        updateDateTime();
-        loadInitialWeather();
-        applyDynamicStyles();
-        adjustFontSizeForScreen();
-        
-        // 5분마다 날씨 업데이트 체크
-        setInterval(updateWeatherIfNeeded, 5 * 60 * 1000);
-        
-        // 페이지가 포커스를 받았을 때 업데이트 체크
-        window.addEventListener('focus', function() {
-            updateWeatherIfNeeded();
-        });
-        
-        // 페이지가 보이게 될 때 업데이트 체크 (탭 전환 시)
-        document.addEventListener('visibilitychange', function() {
-            if (!document.hidden) {
-                updateWeatherIfNeeded();
-            }
-        });
-        
-        // 화면 크기 변경 시 동적 조절
-        window.addEventListener('resize', function() {
-            adjustFontSizeForScreen();
-        });
-        
-        // 페이지 로드 완료 후 추가 조절
-        window.addEventListener('load', function() {
-            setTimeout(adjustFontSizeForScreen, 100);
-        });
+    params = {"KEY": api_key, "ATPT_OFCDC_SC_CODE": atpt_code}
+    school_codes = [school["school_code"] for school in schools]
+    try:
+        # 전체 행 수로 교육청 조회가 학교별 조회보다 요청이 적은지 확인 (캐시가 유효하면 요청이 없으므로 생략)
+        if not neis_client.office_range_cached("mealServiceDietInfo", params, school_codes, start_date, end_date):
+            pages = math.ceil(neis_client.count_rows("mealServiceDietInfo", params, start_date, end_date)
+                              / neis_client.MAX_PAGE_SIZE)
+            if pages >= len(schools):
+                print(f"{atpt_code} 급식 일괄 조회 생략: 교육청 {pages}페이지 >= 학교 {len(schools)}곳")
+                return None
+        response = neis_client.fetch_office_range("mealServiceDietInfo", params, school_codes, start_date, end_date)
+    except Exception as e:
+        print(f"{atpt_code} 급식 일괄 조회 실패: {str(e)}")
+        return None
+
+    stored_range = (date_utils.normalize_date(start_date, "neis"), date_utils.normalize_date(end_date, "neis"))
+    results = {}
+    for school in schools:
+        # 저장에 실패한 학교만 결과에서 빼고 학교별 조회로 다시 수집 (일괄 조회 결과는 버리지 않음)
+        try:
+            meals = response["rows_by_school"][school["school_code"]]
+            content_store.upsert_items(source_key(school, "meals"), meals, replace_range=stored_range)
+        except Exception as e:
+            print(f"{school['id']} 급식 일괄 조회 결과 저장 실패: {str(e)}")
+            continue
+        results[school["id"]] = meals
+    print(f"{atpt_code} 급식 일괄 조회: 학교 {len(schools)}곳, 요청 {response['requests']}회")
+    return results
+
+def generate_meal_html(meals, school_name, school=None):
+    """
+    급식 정보를 HTML로 변환합니다.
     """
-
     meal_cards = ""
     for meal in meals:
         date = meal['MLSV_YMD']
         formatted_date = f"{date[4:6]}월 {date[6:8]}일 ({['월', '화', '수', '목', '금', '토', '일'][datetime.strptime(date, '%Y%m%d').weekday()]})"
-        menu_items = meal['DDISH_NM'].split('<br/>')
-        menu_html = ""
-        
-        for item in menu_items:
-            # 알레르기 정보 추출
-            allergens = []
-            item_text = item
-            for i in range(1, 20):
-                if f"({i})" in item:
-                    allergens.append(str(i))
-                    item_text = item_text.replace(f"({i})", "")
-            
-            menu_html += f'<span>{item_text}</span>'
+        # 메뉴/알레르기/칼로리는 menu_parser가 한 번에 나눈 결과를 사용 (날짜별 캐시)
+        parsed = menu_parser.parse_meal(meal)
+        menu_html = "".join(f'<span>{dish["name"]}</span>' for dish in parsed["dishes"])
         
         allergen_text = ""
-        if allergens:
-            allergen_text = f'<div class="allergen">알레르기 유발 식품: {", ".join(allergens)}</div>'
+        if parsed["allergens"]:
+            allergen_text = f'<div class="allergen">알레르기 유발 식품: {", ".join(map(str, parsed["allergens"]))}</div>'
         
-        # 칼로리 정보 추출
+        # 칼로리 정보
         calorie_text = ""
-        if 'CAL_INFO' in meal and meal['CAL_INFO']:
-            calorie_value = meal['CAL_INFO'].strip()
-            if calorie_value:
-                calorie_text = f'<div class="calorie">칼로리: {calorie_value}</div>'
+        if parsed["calorie"]:
+            calorie_text = f'<div class="calorie">칼로리: {parsed["calorie"]}</div>'
         
         meal_cards += f"""
             <div class="meal-day-container">
@@ -1085,51 +128,23 @@ def generate_meal_html(meals, school_name):
             </div>
         """
 
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="ko">
-    <head>
-        <meta charset="UTF-8">
-        <title>{school_name} 주간 식단표</title>
-        <style>{css_style}</style>
-        <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;700;900&display=swap" rel="stylesheet">
-    </head>
-    <body>
-        <header class="page-header">
-            <div class="header-left">
-                <div class="header-main-title">주간 식단표</div>
-            </div>
-            <div class="header-right">
-                <div class="weather">날씨 정보를 불러오는 중...</div>
-                <div class="date-time" id="date-time"></div>
-                <div class="school-name">{school_name}</div>
-            </div>
-        </header>
-        
-        <div class="meal-container">
-            {meal_cards}
-        </div>
-
-        <div class="notice-text">
-            위 식단은 학교 사정 및 기타 등에 따라 변경될 수 있습니다.<br>
-            알레르기 유발 식품에 대한 정보는 각 메뉴 옆의 숫자로 표시됩니다.<br>
-            (1)난류, (2)우유, (3)메밀, (4)땅콩, (5)대두, (6)밀, (7)고등어, (8)게, (9)새우, (10)돼지고기, (11)복숭아, (12)토마토, (13)아황산류, (14)호두, (15)닭고기, (16)쇠고기, (17)오징어, (18)조개류(굴, 전복, 홍합 포함), (19)잣
-        </div>
-
-        <script>{js_code}</script>
-    </body>
-    </html>
+    return render_page(
+        "meal.html",
+        school_name,
+        page_title=f"{school_name} 주간 식단표",
+        header_title="주간 식단표",
+        meal_cards=meal_cards,
+        dataset="meals",
+        school=school
+    )
+
+def get_target_week(today=None):
     """
-    return html_content
-
-def main():
-    # API 설정
-    API_KEY = os.getenv("NEIS_API_KEY", "dafe93db7c0d4c6eb8ba9a8f5aaee96b")  # 환경변수에서 가져오거나 기본값 사용
-    SCHOOL_CODE = "7681015"  # 율곡중학교
-    SCHOOL_NAME = "율곡중학교"
-    
-    # 날짜 설정
-    today = datetime.now()
+    급식 정보를 가져올 주의 월요일과 금요일을 계산합니다.
+    토요일, 일요일에는 다음 주, 그 외에는 해당 주를 반환합니다.
+    """
+    if today is None:
+        today = datetime.now()
     current_weekday = today.weekday()  # 월요일=0, 일요일=6
     
     # 토요일(5) 또는 일요일(6)이면 다음 주, 그 외에는 해당 주
@@ -1137,36 +152,108 @@ def main():
         # 다음 주 월요일 찾기
         days_until_next_monday = 7 - current_weekday  # 토요일이면 2일, 일요일이면 1일
         monday = today + timedelta(days=days_until_next_monday)
-        print("주말이므로 다음 주 급식 정보를 가져옵니다.")
     else:  # 월요일(0) ~ 금요일(4)
         # 이번 주 월요일 찾기
         days_since_monday = current_weekday
         monday = today - timedelta(days=days_since_monday)
-        print("평일이므로 이번 주 급식 정보를 가져옵니다.")
     
     friday = monday + timedelta(days=4)  # 월요일 + 4일 = 금요일
+    return monday, friday
+
+def _fetch_meals(school, start_date, end_date, skip_unchanged, raise_errors=False):
+    school = school or SCHOOL
+    return get_meal_info(API_KEY, school["school_code"], start_date, end_date, skip_unchanged,
+                         atpt_code=school["atpt_code"], source=source_key(school, "meals"),
+                         raise_errors=raise_errors)
+
+def fetch_week_meals(today=None, skip_unchanged=False, school=None):
+    """
+    이번 주(주말에는 다음 주) 급식 정보를 가져옵니다.
+    skip_unchanged가 True이고 급식 정보가 바뀌지 않았으면 None을 반환합니다.
+    school이 없으면 기본 학교의 급식을 가져옵니다.
+    """
+    monday, friday = get_target_week(today)
     
     # YYYYMMDD 형식으로 변환
     start_date_str = monday.strftime("%Y%m%d")
     end_date_str = friday.strftime("%Y%m%d")
     
     print(f"이번 주 급식 정보 가져오기: {start_date_str} ~ {end_date_str}")
+    return _fetch_meals(school, start_date_str, end_date_str, skip_unchanged)
+
+def fetch_semester_meals(today=None, skip_unchanged=False, school=None, raise_errors=False):
+    """
+    이번 학기 전체 급식 정보를 한 번에 가져와 저장소에 넣습니다.
+    학기 경계의 주말에도 화면에 표시할 주가 포함되도록 대상 주까지 기간을 넓힙니다.
+    skip_unchanged가 True이고 급식 정보가 바뀌지 않았으면 None을 반환합니다.
+    raise_errors가 True이면 실패할 때 빈 목록 대신 예외를 냅니다.
+    """
+    start, end = _semester_meal_range(today)
+    print(f"학기 급식 정보 가져오기: {start} ~ {end}")
+    return _fetch_meals(school, start, end, skip_unchanged, raise_errors)
+
+def fetch_office_semester_meals(schools, today=None):
+    """
+    같은 교육청 학교들의 이번 학기 급식 정보를 교육청 단위로 한 번에 가져옵니다.
+    일괄 조회가 이득이 아니거나 실패하면 None을 반환합니다. (학교별로 fetch_semester_meals 사용)
+    """
+    start, end = _semester_meal_range(today)
+    return get_office_meal_info(API_KEY, schools[0]["atpt_code"], schools, start, end)
+
+def _semester_meal_range(today=None):
+    # 학기 경계의 주말에도 화면에 표시할 주가 포함되도록 대상 주까지 넓힌 학기 기간 (YYYYMMDD)
+    start, end = neis_client.semester_range(today)
+    monday, friday = get_target_week(today)
+    start, end = min(start, monday.date()), max(end, friday.date())
+    return start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
+
+def load_week_meals(today=None, fallback=None, school=None):
+    """
+    이번 주(주말에는 다음 주) 급식 정보를 저장소에서 날짜순으로 읽습니다.
+    저장소에 없으면 fallback(가져온 급식 목록)에서 해당 주만 골라 반환합니다.
+    """
+    monday, friday = get_target_week(today)
+    meals = content_store.query_items(source_key(school or SCHOOL, "meals"), monday.strftime("%Y-%m-%d"), friday.strftime("%Y-%m-%d"),
+                                      newest_first=False)
+    if meals or not fallback:
+        return meals
+    week = (monday.strftime("%Y%m%d"), friday.strftime("%Y%m%d"))
+    return [meal for meal in fallback if week[0] <= meal['MLSV_YMD'] <= week[1]]
+
+def save_meal_html(meals, school=None):
+    """
+    급식 정보 HTML 파일과 주간 JSON 문서(api/meals/<YYYY-Www>.json)를 학교의 출력 디렉터리에 저장합니다.
+    """
+    school = school or SCHOOL
+    path = os.path.join(school["output_path"], "meal_info.html")
+
+    def render():
+        if write_if_changed(path, generate_meal_html(meals, school["name"], school)):
+            print("급식 정보 HTML 파일이 생성되었습니다.")
+
+    # 빌드 그래프: 이번 주 급식, 템플릿, 학교 설정이 그대로면 페이지를 다시 만들지 않음
+    build_graph.build(f"{school['id']}/meal_info.html", [meals, template_fingerprint("meal.html"), school],
+                      [path], render)
+    data_api.publish_meals(school, meals)
+
+def main():
+    if datetime.now().weekday() >= 5:
+        print("주말이므로 다음 주 급식 정보를 가져옵니다.")
+    else:
+        print("평일이므로 이번 주 급식 정보를 가져옵니다.")
     
-    # 급식 정보 가져오기
-    meals = get_meal_info(API_KEY, SCHOOL_CODE, start_date_str, end_date_str)
-    # meals = get_meal_info(API_KEY, SCHOOL_CODE, 20250707, 20250711)
+    # 급식 정보 가져오기 (NEIS 캐시가 유효하면 요청 없음)
+    # 주가 바뀌면 응답이 같아도 페이지를 다시 만들어야 하므로 항상 저장소에서 읽어 생성 (내용이 같으면 저장 생략)
+    meals = fetch_week_meals()
     if not meals:
         print("급식 정보를 가져오는데 실패했습니다.")
+        report_changes()
         return
     
-    # HTML 생성
-    html_content = generate_meal_html(meals, SCHOOL_NAME)
-    
-    # HTML 파일 저장
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    with open(os.path.join(parent_dir, "meal_info.html"), "w", encoding="utf-8") as f:
-        f.write(html_content)
-    print("급식 정보 HTML 파일이 생성되었습니다.")
+    # HTML 생성 및 저장 (내용이 바뀐 경우만, 저장소에 쓰지 못했으면 받은 결과 사용)
+    save_meal_html(load_week_meals(fallback=meals))
+    finalize_assets()
+    report_changes()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+급식 메뉴 파서
+NEIS 급식(mealServiceDietInfo) 행의 DDISH_NM을 미리 컴파일한 정규식 하나로 한 번에 훑어
+메뉴(요리 이름 + 알레르기 번호 집합)로 나누고, ORPLC_INFO에서 원산지 정보를 읽는 모듈입니다.
+
+- "(5.6)", "(1.2.5.6)"처럼 여러 번호가 묶인 표시와 "떡볶이5.6."처럼 괄호 없는 표시를 모두 처리합니다.
+- 알레르기 번호(1~19)가 아닌 괄호 내용은 메뉴 이름에 그대로 남깁니다.
+- 파싱 결과는 급식 날짜(MLSV_YMD)와 식사 코드, 원문 단위로 캐시하므로 같은 주를 다시 그려도 다시 파싱하지 않습니다.
+"""
+
+import re
+from functools import lru_cache
+
+# NEIS 알레르기 유발 식품 번호
+ALLERGENS = {
+    1: "난류", 2: "우유", 3: "메밀", 4: "땅콩", 5: "대두", 6: "밀", 7: "고등어", 8: "게", 9: "새우",
+    10: "돼지고기", 11: "복숭아", 12: "토마토", 13: "아황산류", 14: "호두", 15: "닭고기", 16: "쇠고기",
+    17: "오징어", 18: "조개류", 19: "잣"
+}
+
+# DDISH_NM 토큰: 줄바꿈(<br/>), 괄호 알레르기 표시 "(1.2.5.6)", 줄 끝의 괄호 없는 표시 "5.6.", 나머지 글자
+MENU_TOKEN_PATTERN = re.compile(
+    r'(?P<br><br\s*/?>)'
+    r'|\(\s*(?P<codes>\d{1,2}(?:\s*[.,]\s*\d{1,2})*)\s*\.?\s*\)'
+    r'|(?P<bare>\d{1,2}(?:\.\d{1,2})*\.)(?=\s*(?:<br\s*/?>|$))'
+    r'|(?P<text>[^<(\d]+|[\s\S])',
+    re.IGNORECASE
+)
+CODE_SPLIT_PATTERN = re.compile(r'\s*[.,]\s*')
+
+# ORPLC_INFO 항목 (예: "쌀 : 국내산<br/>김치류 : 국내산")
+ORIGIN_PATTERN = re.compile(r'\s*([^:<]+?)\s*:\s*([^<]*?)\s*(?:<br\s*/?>|$)', re.IGNORECASE)
+
+# 파싱 결과 캐시 크기 (학교 수 x 학기 급식 수 정도)
+MEAL_CACHE_SIZE = 4096
+
+
+def _allergen_codes(text):
+    """ "1.2.5.6" 형식을 알레르기 번호 목록으로 바꿉니다. 범위 밖 번호가 있으면 None"""
+    codes = [int(code) for code in CODE_SPLIT_PATTERN.split(text.strip('.')) if code]
+    if not codes or any(code not in ALLERGENS for code in codes):
+        return None
+    return codes
+
+
+def parse_menu(ddish_nm):
+    """
+    DDISH_NM을 메뉴 목록으로 나눕니다.
+
+    Args:
+        ddish_nm (str): NEIS 요리명 (예: "쌀밥<br/>쇠고기미역국 (5.6.16)<br/>")
+
+    Returns:
+        tuple: ({"name": 메뉴 이름, "allergens": 알레르기 번호 tuple (오름차순)}, ...)
+    """
+    dishes = []
+    name_parts = []
+    allergens = set()
+
+    def flush():
+        name = " ".join("".join(name_parts).split())
+        if name:
+            dishes.append({"name": name, "allergens": tuple(sorted(allergens))})
+        name_parts.clear()
+        allergens.clear()
+
+    for match in MENU_TOKEN_PATTERN.finditer(ddish_nm or ""):
+        kind = match.lastgroup
+        if kind == "br":
+            flush()
+            continue
+        if kind in ("codes", "bare"):
+            codes = _allergen_codes(match.group(kind))
+            if codes is not None:
+                allergens.update(codes)
+                continue
+        name_parts.append(match.group(0))
+    flush()
+    return tuple(dishes)
+
+
+def parse_origins(orplc_info):
+    """
+    ORPLC_INFO를 (식재료, 원산지) 목록으로 나눕니다.
+
+    Returns:
+        tuple: (("쌀", "국내산"), ...)
+    """
+    return tuple((food, origin) for food, origin in ORIGIN_PATTERN.findall(orplc_info or "") if food)
+
+
+@lru_cache(maxsize=MEAL_CACHE_SIZE)
+def _parse_meal(ymd, meal_code, ddish_nm, orplc_info, cal_info):
+    dishes = parse_menu(ddish_nm)
+    return {
+        "date": ymd,
+        "meal_code": meal_code,
+        "dishes": dishes,
+        "allergens": tuple(sorted({code for dish in dishes for code in dish["allergens"]})),
+        "origins": parse_origins(orplc_info),
+        "calorie": (cal_info or "").strip()
+    }
+
+
+def parse_meal(meal):
+    """
+    급식 행 하나를 구조화된 급식 정보로 바꿉니다. (같은 날짜/식사/원문이면 캐시된 결과 반환)
+    캐시된 결과를 함께 쓰므로 반환값을 수정하지 마세요.
+
+    Args:
+        meal (dict): NEIS 급식 행 (MLSV_YMD, MMEAL_SC_CODE, DDISH_NM, ORPLC_INFO, CAL_INFO)
+
+    Returns:
+        dict: {"date", "meal_code", "dishes", "allergens": 모든 메뉴의 알레르기 번호 합집합,
+               "origins": (식재료, 원산지) 목록, "calorie": 칼로리 문자열}
+    """
+    return _parse_meal(meal.get("MLSV_YMD", ""), meal.get("MMEAL_SC_CODE", ""), meal.get("DDISH_NM", ""),
+                       meal.get("ORPLC_INFO", ""), meal.get("CAL_INFO", ""))
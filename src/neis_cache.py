@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+NEIS 응답 캐시 (기간별 유효 시간)
+급식(mealServiceDietInfo)과 학사일정(SchoolSchedule) 행을 학교 코드와 월 단위로
+data/neis_cache/에 저장하고, 날짜가 오늘에서 얼마나 떨어져 있는지에 따라 유효 시간을 다르게 둡니다.
+
+- 지난 달(오늘로부터 IMMUTABLE_AFTER_DAYS일 이전에 끝난 달)은 바뀌지 않으므로 다시 요청하지 않습니다.
+- 가까운 날짜일수록 자주, 먼 미래일수록 드물게 다시 요청합니다. (TTL_RULES)
+- 유효 시간이 지난 달이 이어져 있으면 한 기간으로 묶어 요청합니다.
+neis_client.fetch_range()가 이 캐시를 거치므로 대부분의 실행은 NEIS를 요청하지 않습니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from http_cache import FORCE_REFRESH, SECRET_PARAMS
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'neis_cache')
+
+# 이 일수보다 전에 끝난 달은 확정된 것으로 보고 다시 요청하지 않음 (늦은 정정 반영 기간)
+IMMUTABLE_AFTER_DAYS = 7
+
+# (오늘부터 달의 시작일까지 일수 상한, 유효 시간) - 위에서부터 처음 맞는 규칙 사용
+TTL_RULES = (
+    (14, timedelta(hours=6)),     # 이번 달/2주 안: 6시간마다 (매시 실행 중 하루 네 번)
+    (60, timedelta(days=1)),      # 두 달 안: 하루 한 번
+    (None, timedelta(days=3)),    # 그 이후: 사흘에 한 번
+)
+
+# 서비스별 행의 날짜 필드
+DATE_FIELDS = {
+    "mealServiceDietInfo": "MLSV_YMD",
+    "SchoolSchedule": "AA_YMD",
+}
+
+# 캐시 키에서 제외할 파라미터 (기간과 응답 형식)
+IGNORED_PARAMS = frozenset(["Type", "pIndex", "pSize"])
+
+_cache_lock = threading.Lock()
+
+
+def _cache_path(service, params):
+    public = sorted((k, str(v)) for k, v in params.items() if k not in SECRET_PARAMS and k not in IGNORED_PARAMS)
+    school = params.get("SD_SCHUL_CODE") or params.get("ATPT_OFCDC_SC_CODE") or "all"
+    digest = hashlib.sha1(json.dumps([service, public]).encode('utf-8')).hexdigest()[:10]
+    return os.path.join(CACHE_DIR, f"{service}_{school}_{digest}.json")
+
+
+def _load(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(path, data):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def month_buckets(start, end):
+    """
+    기간이 걸친 달 목록을 만듭니다. 캐시는 항상 달 전체 단위로 저장합니다.
+
+    Returns:
+        list: (달 키 "YYYY-MM", 달의 첫날, 달의 마지막 날) 목록
+    """
+    buckets = []
+    current = start.replace(day=1)
+    while current <= end:
+        next_month = (current + timedelta(days=32)).replace(day=1)
+        buckets.append((current.strftime("%Y-%m"), current, next_month - timedelta(days=1)))
+        current = next_month
+    return buckets
+
+
+def ttl_for(bucket_start, bucket_end, today):
+    """
+    달 하나의 유효 시간을 반환합니다.
+
+    Returns:
+        timedelta: 유효 시간, 지난 달이라 다시 요청할 필요가 없으면 None
+    """
+    if bucket_end < today - timedelta(days=IMMUTABLE_AFTER_DAYS):
+        return None
+    distance = max(0, (bucket_start - today).days)
+    for max_days, ttl in TTL_RULES:
+        if max_days is None or distance <= max_days:
+            return ttl
+    return TTL_RULES[-1][1]
+
+
+def _is_fresh(entry, bucket_start, bucket_end, now):
+    if not entry or FORCE_REFRESH:
+        return False
+    ttl = ttl_for(bucket_start, bucket_end, now.date())
+    if ttl is None:
+        return True
+    return now - datetime.fromisoformat(entry["fetched_at"]) < ttl
+
+
+def _merge_stale(stale):
+    """이어진 달들을 한 요청 기간으로 묶습니다."""
+    ranges = []
+    for _, bucket_start, bucket_end in stale:
+        if ranges and ranges[-1][1] + timedelta(days=1) == bucket_start:
+            ranges[-1][1] = bucket_end
+        else:
+            ranges.append([bucket_start, bucket_end])
+    return ranges
+
+
+def is_cached(service, params, start, end, now=None):
+    """
+    기간의 모든 달이 캐시에 있고 유효 시간 안인지 확인합니다. (요청 없이 fetch_cached가 끝나는지)
+
+    Args:
+        service (str): 서비스 이름 (DATE_FIELDS의 키)
+        params (dict): 기간을 제외한 요청 파라미터
+        start (date): 시작일
+        end (date): 종료일 (포함)
+        now (datetime, optional): 기준 시각, 없으면 현재 시각
+
+    Returns:
+        bool: 다시 받을 달이 없으면 True
+    """
+    now = now or datetime.now()
+    with _cache_lock:
+        months = _load(_cache_path(service, params)).get("months", {})
+    return all(_is_fresh(months.get(key), bucket_start, bucket_end, now)
+               for key, bucket_start, bucket_end in month_buckets(start, end))
+
+
+def fetch_cached(service, params, start, end, fetcher, now=None):
+    """
+    캐시를 먼저 확인하고, 유효 시간이 지난 달만 fetcher로 가져옵니다.
+    요청 기간이 달의 일부여도 달 전체를 받아 저장하고, 결과는 요청 기간으로 잘라 반환합니다.
+
+    Args:
+        service (str): 서비스 이름 (DATE_FIELDS의 키)
+        params (dict): 기간을 제외한 요청 파라미터
+        start (date): 시작일
+        end (date): 종료일 (포함)
+        fetcher (callable): fetcher(시작일, 종료일) -> {"rows", "changed", "requests"}
+        now (datetime, optional): 기준 시각, 없으면 현재 시각
+
+    Returns:
+        dict: {"rows": 기간 전체 행 목록 (날짜순), "changed": 다시 받은 달의 내용이 바뀌었는지 여부,
+               "requests": 실제 요청한 페이지 수}
+
+    Raises:
+        fetcher가 던지는 예외 (요청 실패 시 캐시는 갱신하지 않음)
+    """
+    now = now or datetime.now()
+    date_field = DATE_FIELDS[service]
+    path = _cache_path(service, params)
+
+    with _cache_lock:
+        cache = _load(path)
+    months = cache.setdefault("months", {})
+    buckets = month_buckets(start, end)
+    stale = [bucket for bucket in buckets if not _is_fresh(months.get(bucket[0]), bucket[1], bucket[2], now)]
+
+    changed = False
+    requests = 0
+    for range_start, range_end in _merge_stale(stale):
+        result = fetcher(range_start, range_end)
+        requests += result["requests"]
+        # 받은 행을 달별로 나누어 저장
+        by_month = {}
+        for row in result["rows"]:
+            ymd = str(row.get(date_field, ""))
+            by_month.setdefault(f"{ymd[:4]}-{ymd[4:6]}", []).append(row)
+        for key, bucket_start, bucket_end in buckets:
+            if not (range_start <= bucket_start and bucket_end <= range_end):
+                continue
+            rows = by_month.get(key, [])
+            previous = months.get(key)
+            if previous is None or previous.get("rows") != rows:
+                changed = True
+            months[key] = {"fetched_at": now.isoformat(timespec="seconds"), "rows": rows}
+
+    if stale:
+        with _cache_lock:
+            _save(path, cache)
+        logging.info(f"{service} 캐시 갱신: {len(stale)}/{len(buckets)}개월, 요청 {requests}회")
+    else:
+        logging.info(f"{service} 캐시 사용: {len(buckets)}개월 모두 유효, 요청 없음")
+
+    low, high = start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
+    rows = []
+    for key, _, _ in buckets:
+        rows.extend(row for row in months[key]["rows"] if low <= str(row.get(date_field, "")) <= high)
+    return {"rows": rows, "changed": changed, "requests": requests}
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+NEIS OpenAPI 기간 조회 클라이언트
+급식(mealServiceDietInfo), 학사일정(SchoolSchedule)을 임의의 기간으로 한 번에 가져오는 모듈입니다.
+
+- 기간을 한 요청에 최대 페이지 크기(1000행)가 담기도록 나누어 요청합니다.
+- 첫 페이지의 list_total_count를 보고 나머지 페이지(pIndex)를 동시에 요청하므로
+  행이 페이지 크기보다 많아도 빠지는 항목이 없습니다.
+- 모든 요청은 http_cache를 거치므로 이전 실행과 같은 응답이면 changed가 False입니다.
+- fetch_range()는 neis_cache를 먼저 확인하고 유효 시간이 지난 달만 요청합니다.
+- fetch_office_range()는 학교 코드 없이 교육청 전체를 조회한 뒤 학교별로 나누므로,
+  같은 교육청 학교가 많을 때 학교마다 요청하지 않아도 됩니다.
+"""
+
+import json
+import math
+import http_cache
+import neis_cache
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+NEIS_BASE_URL = "https://open.neis.go.kr/hub"
+
+# NEIS가 허용하는 최대 페이지 크기
+MAX_PAGE_SIZE = 1000
+
+# 동시에 요청할 최대 페이지 수 (전체 동시 요청 수는 http_client가 제한)
+MAX_PAGE_WORKERS = 4
+
+# 서비스별 기간 파라미터와 하루 최대 행 수 (요청 하나의 기간을 정하는 데 사용)
+SERVICES = {
+    "mealServiceDietInfo": {"from": "MLSV_FROM_YMD", "to": "MLSV_TO_YMD", "rows_per_day": 3},  # 조식/중식/석식
+    "SchoolSchedule": {"from": "AA_FROM_YMD", "to": "AA_TO_YMD", "rows_per_day": 3},
+}
+
+# 교육청 전체 조회에서 요청 하나의 최대 일수 (학교 수를 알 수 없으므로 한 달 단위, 넘치면 페이지로 나눔)
+OFFICE_CHUNK_DAYS = 31
+
+# 조회 결과 없음 (정상)
+NO_DATA_CODE = "INFO-200"
+
+
+def _to_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y%m%d").date()
+
+
+def split_range(start, end, max_days):
+    """
+    기간을 최대 max_days일씩 나눕니다.
+
+    Args:
+        start (str|date): 시작일 (YYYYMMDD 또는 date)
+        end (str|date): 종료일 (포함)
+        max_days (int): 구간 하나의 최대 일수
+
+    Returns:
+        list: (시작일, 종료일) YYYYMMDD 문자열 쌍 목록
+    """
+    start, end = _to_date(start), _to_date(end)
+    chunks = []
+    while start <= end:
+        chunk_end = min(end, start + timedelta(days=max_days - 1))
+        chunks.append((start.strftime("%Y%m%d"), chunk_end.strftime("%Y%m%d")))
+        start = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def fetch_page(service, params, page_index, page_size=MAX_PAGE_SIZE):
+    """
+    NEIS API 페이지 하나를 가져옵니다.
+
+    Args:
+        service (str): 서비스 이름 (예: "mealServiceDietInfo")
+        params (dict): 요청 파라미터 (KEY, 교육청/학교 코드, 기간 등)
+        page_index (int): 페이지 번호 (1부터)
+        page_size (int): 페이지 크기
+
+    Returns:
+        dict: {"total": list_total_count, "rows": 행 목록, "changed": 이전 응답과 달라졌는지 여부}
+
+    Raises:
+        requests.RequestException: 요청 실패 또는 오류 응답
+        ValueError: NEIS 오류 응답 (인증키 오류, 호출 제한 초과 등)
+    """
+    page_params = dict(params, Type="json", pIndex=page_index, pSize=page_size)
+    response = http_cache.conditional_get(f"{NEIS_BASE_URL}/{service}", params=page_params)
+    data = json.loads(response["content"])
+
+    if service not in data:
+        result = data.get("RESULT", {})
+        if result.get("CODE") == NO_DATA_CODE:
+            return {"total": 0, "rows": [], "changed": response["changed"]}
+        raise ValueError(f"NEIS {service} 오류 {result.get('CODE')}: {result.get('MESSAGE')}")
+
+    head = data[service][0]["head"]
+    total = int(head[0].get("list_total_count", 0))
+    return {"total": total, "rows": data[service][1].get("row", []), "changed": response["changed"]}
+
+
+def _fetch_pages(service, requests_list):
+    """(파라미터, 페이지 번호) 목록을 동시에 요청하고 순서대로 결과를 반환합니다."""
+    if not requests_list:
+        return []
+    workers = min(MAX_PAGE_WORKERS, len(requests_list))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="neis") as executor:
+        return list(executor.map(lambda request: fetch_page(service, *request), requests_list))
+
+
+def _fetch_uncached(service, params, start, end, page_size=MAX_PAGE_SIZE, max_days=None, row_filter=None):
+    """
+    기간 전체의 행을 NEIS에서 빠짐없이 가져옵니다. (캐시 없이)
+    기간을 요청 단위로 나누어 첫 페이지를 동시에 요청한 뒤, list_total_count가
+    페이지 크기보다 큰 구간의 나머지 페이지를 동시에 요청합니다.
+    row_filter가 있으면 조건에 맞는 행만 남깁니다.
+    """
+    config = SERVICES[service]
+    page_size = min(page_size, MAX_PAGE_SIZE)
+    max_days = max_days or max(1, page_size // config["rows_per_day"])
+    chunk_params = [dict(params, **{config["from"]: chunk_start, config["to"]: chunk_end})
+                    for chunk_start, chunk_end in split_range(start, end, max_days)]
+
+    first_pages = _fetch_pages(service, [(p, 1, page_size) for p in chunk_params])
+    # list_total_count가 페이지 크기를 넘는 구간의 나머지 페이지
+    rest_requests = [(p, page_index, page_size)
+                     for p, first in zip(chunk_params, first_pages)
+                     for page_index in range(2, math.ceil(first["total"] / page_size) + 1)]
+    rest_pages = _fetch_pages(service, rest_requests)
+
+    rows = []
+    rest = iter(rest_pages)
+    for first in first_pages:
+        rows.extend(first["rows"])
+        for _ in range(2, math.ceil(first["total"] / page_size) + 1):
+            rows.extend(next(rest)["rows"])
+
+    if row_filter is not None:
+        rows = [row for row in rows if row_filter(row)]
+
+    pages = first_pages + rest_pages
+    return {
+        "rows": rows,
+        "changed": any(page["changed"] for page in pages),
+        "requests": len(pages)
+    }
+
+
+def fetch_range(service, params, start, end, page_size=MAX_PAGE_SIZE, use_cache=True):
+    """
+    기간 전체의 행을 빠짐없이 가져옵니다.
+    use_cache가 True이면 neis_cache에서 유효한 달은 요청하지 않고, 나머지 달만
+    요청 단위로 나누어 모든 페이지를 동시에 요청합니다.
+
+    Args:
+        service (str): 서비스 이름 (SERVICES의 키)
+        params (dict): 기간을 제외한 요청 파라미터 (KEY, ATPT_OFCDC_SC_CODE, SD_SCHUL_CODE 등)
+        start (str|date): 시작일 (YYYYMMDD 또는 date)
+        end (str|date): 종료일 (포함)
+        page_size (int): 페이지 크기 (최대 1000)
+        use_cache (bool): 기간별 유효 시간 캐시 사용 여부
+
+    Returns:
+        dict: {"rows": 기간 전체 행 목록 (날짜순), "changed": 응답 중 하나라도 달라졌는지 여부,
+               "requests": 실제 요청한 페이지 수}
+
+    Raises:
+        requests.RequestException: 요청 실패 또는 오류 응답 (페이지 하나라도 실패하면)
+        ValueError: NEIS 오류 응답
+    """
+    if not use_cache:
+        return _fetch_uncached(service, params, start, end, page_size)
+    return neis_cache.fetch_cached(
+        service, params, _to_date(start), _to_date(end),
+        lambda range_start, range_end: _fetch_uncached(service, params, range_start, range_end, page_size)
+    )
+
+
+def count_rows(service, params, start, end):
+    """
+    기간의 전체 행 수(list_total_count)만 확인합니다. (1행짜리 페이지 하나 요청)
+
+    Returns:
+        int: 전체 행 수
+    """
+    config = SERVICES[service]
+    start, end = _to_date(start), _to_date(end)
+    range_params = dict(params, **{config["from"]: start.strftime("%Y%m%d"), config["to"]: end.strftime("%Y%m%d")})
+    return fetch_page(service, range_params, 1, page_size=1)["total"]
+
+
+def _office_cache_params(params, school_codes):
+    # 학교 목록이 바뀌면 다른 캐시를 사용
+    return dict(params, SCHOOLS=",".join(sorted(school_codes)))
+
+
+def office_range_cached(service, params, school_codes, start, end):
+    """
+    교육청 일괄 조회 결과가 기간 전체에 대해 캐시에 있고 유효한지 확인합니다.
+    유효하면 fetch_office_range가 요청 없이 끝나므로 행 수 확인(count_rows)도 필요 없습니다.
+    """
+    return neis_cache.is_cached(service, _office_cache_params(params, school_codes), _to_date(start), _to_date(end))
+
+
+def fetch_office_range(service, params, school_codes, start, end, use_cache=True):
+    """
+    학교 코드 없이 교육청 전체를 조회하고, 행을 학교 코드별로 나눕니다.
+    캐시에는 지정한 학교의 행만 저장합니다.
+
+    Args:
+        service (str): 서비스 이름 (SERVICES의 키)
+        params (dict): KEY, ATPT_OFCDC_SC_CODE (SD_SCHUL_CODE 없이)
+        school_codes (iterable): 결과를 받을 학교 코드 목록
+        start (str|date): 시작일 (YYYYMMDD 또는 date)
+        end (str|date): 종료일 (포함)
+        use_cache (bool): 기간별 유효 시간 캐시 사용 여부
+
+    Returns:
+        dict: {"rows_by_school": 학교 코드 -> 행 목록, "changed": 응답이 달라졌는지 여부,
+               "requests": 실제 요청한 페이지 수}
+
+    Raises:
+        requests.RequestException: 요청 실패 또는 오류 응답
+        ValueError: NEIS 오류 응답
+    """
+    codes = frozenset(school_codes)
+
+    def fetch(range_start, range_end):
+        return _fetch_uncached(service, params, range_start, range_end, max_days=OFFICE_CHUNK_DAYS,
+                               row_filter=lambda row: row.get("SD_SCHUL_CODE") in codes)
+
+    if use_cache:
+        result = neis_cache.fetch_cached(service, _office_cache_params(params, codes), _to_date(start), _to_date(end),
+                                         fetch)
+    else:
+        result = fetch(start, end)
+
+    rows_by_school = {code: [] for code in codes}
+    for row in result["rows"]:
+        rows_by_school[row["SD_SCHUL_CODE"]].append(row)
+    return {"rows_by_school": rows_by_school, "changed": result["changed"], "requests": result["requests"]}
+
+
+def semester_range(today=None):
+    """
+    오늘이 속한 학기의 기간을 반환합니다. (1학기 3/1~8/31, 2학기 9/1~다음 해 2월 말)
+
+    Returns:
+        tuple: (시작일, 종료일) date
+    """
+    today = _to_date(today or date.today())
+    if 3 <= today.month <= 8:
+        return date(today.year, 3, 1), date(today.year, 8, 31)
+    year = today.year if today.month >= 9 else today.year - 1
+    return date(year, 9, 1), date(year + 1, 3, 1) - timedelta(days=1)
+
+
+def school_year_range(today=None):
+    """
+    오늘이 속한 학년도의 기간을 반환합니다. (3/1~다음 해 2월 말)
+
+    Returns:
+        tuple: (시작일, 종료일) date
+    """
+    today = _to_date(today or date.today())
+    year = today.year if today.month >= 3 else today.year - 1
+    return date(year, 3, 1), date(year + 1, 3, 1) - timedelta(days=1)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+생성 파일 출력 모듈
+메모리에서 만든 결과물을 디스크의 파일과 비교하여 내용이 다를 때만
+임시 파일 + 이름 변경 방식으로 원자적으로 저장하고, 실제로 바뀐 파일 목록을 기록합니다.
+"""
+
+import hashlib
+import os
+import threading
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_changed = []
+# 바뀌어도 그것만으로는 배포하지 않는 파일 (화면이 주기적으로 다시 읽는 날씨 스냅샷 등)
+_background = set()
+_changed_lock = threading.Lock()
+
+
+def _digest_file(path):
+    """디스크에 있는 파일의 SHA-256 해시를 계산합니다. 파일이 없으면 None을 반환합니다."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def write_if_changed(path, content, encoding='utf-8', background=False):
+    """
+    내용이 디스크의 파일과 다를 때만 파일을 원자적으로 저장합니다.
+
+    Args:
+        path (str): 저장할 파일 경로
+        content (str | bytes): 저장할 내용
+        encoding (str): content가 문자열일 때 사용할 인코딩
+        background (bool): 이 파일만 바뀐 경우에는 배포하지 않음 (report_changes의 changed=false)
+
+    Returns:
+        bool: 파일이 새로 저장되었는지 여부
+    """
+    data = content.encode(encoding) if isinstance(content, str) else content
+    if _digest_file(path) == hashlib.sha256(data).hexdigest():
+        return False
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    with _changed_lock:
+        if path not in _changed:
+            _changed.append(path)
+        if background:
+            _background.add(path)
+    return True
+
+
+def changed_artifacts():
+    """이번 실행에서 실제로 바뀐 파일 목록을 반환합니다."""
+    with _changed_lock:
+        return list(_changed)
+
+
+def reset_changes():
+    """
+    지금까지 바뀐 파일 목록을 반환하고 비웁니다.
+    한 프로세스에서 여러 번 수집하는 데몬이 주기마다 바뀐 파일을 따로 확인할 때 사용합니다.
+
+    Returns:
+        list: 바뀐 파일 목록
+    """
+    with _changed_lock:
+        changed = list(_changed)
+        _changed.clear()
+        _background.clear()
+    return changed
+
+
+def display_path(path):
+    """바뀐 파일을 저장소 루트 기준 경로로 표시합니다. (학교가 여러 곳이면 파일 이름이 겹침)"""
+    return os.path.relpath(os.path.abspath(path), ROOT_DIR).replace(os.sep, '/')
+
+
+def report_changes():
+    """
+    바뀐 파일 목록을 출력하고, GitHub Actions에서 실행 중이면
+    changed / changed_files 출력값을 기록합니다.
+    changed는 배포할 파일(background가 아닌 파일)이 바뀐 경우에만 true입니다.
+
+    Returns:
+        list: 바뀐 파일 목록
+    """
+    changed = changed_artifacts()
+    with _changed_lock:
+        deploy = [path for path in changed if path not in _background]
+    if changed:
+        print(f"변경된 파일 {len(changed)}개:")
+        for path in changed:
+            print(f"  - {display_path(path)}")
+    else:
+        print("변경된 파일이 없습니다.")
+
+    github_output = os.getenv("GITHUB_OUTPUT")
+    if github_output:
+        with open(github_output, 'a', encoding='utf-8') as f:
+            f.write(f"changed={'true' if deploy else 'false'}\n")
+            f.write(f"changed_files={' '.join(display_path(p) for p in changed)}\n")
+    return changed
@@ -4,6 +4,7 @@
 """
 공지사항 RSS 피드 생성기
 크롤링된 공지사항 데이터를 RSS 피드로 변환하는 모듈입니다.
+게시글은 수집 데이터 저장소(content_store)에서 읽거나 JSON 파일에서 읽습니다.
 """
 
 import json
@@ -12,6 +13,10 @@ import logging
 from datetime import datetime, timezone
 from feedgen.feed import FeedGenerator
 import re
+import build_graph
+import content_store
+import date_utils
+from school_registry import load_schools, source_key
 
 # 로깅 설정
 logging.basicConfig(
@@ -21,22 +26,56 @@ logging.basicConfig(
     filemode='a'
 )
 
-def generate_rss_feed(json_file, output_file=None, feed_url=None):
+# 저장소 피드에 담을 최대 게시글 수
+FEED_ITEM_COUNT = 30
+
+# 저장소 소스 이름 -> 피드 제목에 쓸 게시판 이름
+STORE_FEEDS = {
+    "notices": "공지사항",
+    "letters": "가정통신문",
+}
+
+def load_store_feed_data(source, site_name, site_url, limit=FEED_ITEM_COUNT):
+    """
+    저장소에서 최신 게시글을 읽어 generate_rss_feed()에 넘길 데이터를 만듭니다.
+    
+    Args:
+        source (str): 저장소 소스 이름 (예: "notices")
+        site_name (str): 사이트 이름
+        site_url (str): 학교 홈페이지 주소
+        limit (int): 최대 게시글 수
+    
+    Returns:
+        dict: 크롤링 JSON과 같은 형식의 데이터 (meta, notices 키)
+    """
+    return {
+        "meta": {
+            "source": site_name,
+            "url": site_url,
+            "last_updated": datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        },
+        "notices": content_store.query_items(source, limit=limit)
+    }
+
+def generate_rss_feed(json_file=None, output_file=None, feed_url=None, data=None, feed_title='공지사항'):
     """
-    크롤링된 JSON 파일을 RSS 피드로 변환합니다.
+    크롤링된 JSON 파일이나 저장소 데이터를 RSS 피드로 변환합니다.
     
     Args:
-        json_file (str): 크롤링된 공지사항 JSON 파일 경로
+        json_file (str, optional): 크롤링된 공지사항 JSON 파일 경로
         output_file (str, optional): 출력할 RSS 파일 경로, 없으면 기본 이름 사용
         feed_url (str, optional): 피드 URL, 없으면 기본값 사용
+        data (dict, optional): 이미 읽은 데이터 (load_store_feed_data() 결과), 있으면 json_file 대신 사용
+        feed_title (str): 피드 제목에 쓸 게시판 이름
     
     Returns:
         str: 생성된 RSS 파일 경로
     """
     try:
         # JSON 파일 로드
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if data is None:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         # 사이트 정보 추출
         site_name = data['meta']['source']
@@ -51,8 +90,8 @@ def generate_rss_feed(json_file, output_file=None, feed_url=None):
         
         # 피드 기본 정보 설정
         fg.id(site_url)
-        fg.title(f'{site_name} 공지사항')
-        fg.subtitle(f'{site_name} 공지사항 자동 피드')
+        fg.title(f'{site_name} {feed_title}')
+        fg.subtitle(f'{site_name} {feed_title} 자동 피드')
         fg.link(href=site_url, rel='alternate')
         
         # 피드 URL이 제공된 경우 self 링크 추가
@@ -81,7 +120,8 @@ def generate_rss_feed(json_file, output_file=None, feed_url=None):
                 fe.id(notice['url'])
             else:
                 # 제목과 번호로 가상 ID 생성
-                notice_id = f"{site_url}/notice/{notice.get('number', '')}-{re.sub(r'[^\w]', '-', notice.get('title', ''))}"
+                title_slug = re.sub(r'[^\w]', '-', notice.get('title', ''))
+                notice_id = f"{site_url}/notice/{notice.get('number', '')}-{title_slug}"
                 fe.id(notice_id)
             
             # 제목 설정
@@ -108,44 +148,16 @@ def generate_rss_feed(json_file, output_file=None, feed_url=None):
             # 요약
             fe.summary(f"{notice.get('title', '제목 없음')} - {notice.get('date', '')}")
             
-            # 날짜 변환 시도
-            try:
-                # 다양한 날짜 형식 처리
-                date_str = notice.get('date', '')
-                date_formats = [
-                    '%Y-%m-%d',              # 2023-01-15
-                    '%Y.%m.%d',              # 2023.01.15
-                    '%Y/%m/%d',              # 2023/01/15
-                    '%Y-%m-%d %H:%M',        # 2023-01-15 14:30
-                    '%Y.%m.%d %H:%M',        # 2023.01.15 14:30
-                    '%Y/%m/%d %H:%M',        # 2023/01/15 14:30
-                    '%Y-%m-%d %H:%M:%S',     # 2023-01-15 14:30:45
-                ]
-                
-                parsed_date = None
-                for fmt in date_formats:
-                    try:
-                        parsed_date = datetime.strptime(date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                
-                if parsed_date:
-                    # 타임존 정보 추가
-                    parsed_date = parsed_date.replace(tzinfo=timezone.utc)
-                    fe.published(parsed_date)
-                    fe.updated(parsed_date)
-                else:
-                    # 날짜 파싱 실패시 현재 시간 사용 (타임존 정보 추가)
-                    now = datetime.now(timezone.utc)
-                    fe.published(now)
-                    fe.updated(now)
-            except Exception as e:
-                logging.warning(f"날짜 변환 실패: {e}")
-                # 현재 시간 사용 (타임존 정보 추가)
-                now = datetime.now(timezone.utc)
-                fe.published(now)
-                fe.updated(now)
+            # 날짜 변환 (피드별로 형식을 기억, 시간대가 없으면 KST로 간주)
+            parsed_date = date_utils.parse_date(notice.get('published') or notice.get('date', ''), source=site_url)
+            if parsed_date:
+                parsed_date = date_utils.ensure_aware(parsed_date)
+            else:
+                # 날짜 파싱 실패시 현재 시간 사용
+                logging.warning(f"날짜 변환 실패: {notice.get('date', '')}")
+                parsed_date = datetime.now(timezone.utc)
+            fe.published(parsed_date)
+            fe.updated(parsed_date)
             
             # 작성자 정보
             if notice.get('author'):
@@ -162,7 +174,29 @@ def generate_rss_feed(json_file, output_file=None, feed_url=None):
         return None
 
 if __name__ == "__main__":
-    # JSON 파일 목록 찾기
+    # 저장소에 모인 학교별, 게시판별 피드 생성
+    for school in load_schools():
+        for source, feed_title in STORE_FEEDS.items():
+            data = load_store_feed_data(source_key(school, source), school["name"], school["site_url"])
+            if not data["notices"]:
+                print(f"저장소에 {school['name']} {feed_title} 게시글이 없습니다.")
+                continue
+            output_file = f"{school['id']}_{source}_feed.xml"
+            results = []
+            # 빌드 그래프: 게시글과 학교 설정이 그대로면 피드를 다시 만들지 않음
+            rebuilt = build_graph.build(
+                f"{school['id']}/{output_file}", [data["notices"], feed_title, school], [os.path.abspath(output_file)],
+                lambda: results.append(generate_rss_feed(output_file=output_file, data=data, feed_title=feed_title))
+            )
+            if not rebuilt:
+                print(f"RSS 피드 변경 없음: {output_file}")
+            elif results[0]:
+                print(f"RSS 피드 생성 완료: {output_file}")
+            else:
+                print(f"RSS 피드 생성 실패: {school['id']} {source}")
+    build_graph.save_graph()
+
+    # 이전 방식의 JSON 파일 목록 찾기
     json_files = [f for f in os.listdir('.') if f.endswith('_notices_api.json')]
     
     for json_file in json_files:
@@ -171,4 +205,4 @@ if __name__ == "__main__":
         if output_file:
             print(f"RSS 피드 생성 완료: {output_file}")
         else:
-            print(f"RSS 피드 생성 실패: {json_file}") 
\ No newline at end of file
+            print(f"RSS 피드 생성 실패: {json_file}")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+학교 목록(레지스트리)
+schools.json에 등록된 학교의 이름, 홈페이지, NEIS 코드, 출력 디렉터리, 날씨 위치를 읽는 모듈입니다.
+크롤러와 페이지 생성기는 상수 대신 이 모듈이 돌려주는 학교 정보(dict)를 사용합니다.
+
+schools.json 형식:
+    {
+      "defaults": {"atpt_code": "J10", "output_dir": "sites/{id}", ...},
+      "schools": [{"id": "yulgok-m", "name": "율곡중학교", "site_url": "...",
+                   "school_code": "7681015", "weather": {"lat": ..., "lon": ..., "air_station": "..."}}]
+    }
+
+- 기본 학교(DEFAULT_SCHOOL 환경변수, 없으면 첫 번째 학교)는 상태/저장소 키에 접두어를 붙이지 않아
+  학교가 하나일 때와 같은 키를 사용합니다. 다른 학교는 "<id>/notices"처럼 학교 id를 붙입니다.
+- 출력 디렉터리가 루트가 아닌 학교의 페이지는 <base href>로 공용 assets/, images/, font/를 참조합니다.
+"""
+
+import json
+import os
+from functools import lru_cache
+from board_crawler import BOARDS, board_rss_url
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REGISTRY_PATH = os.getenv("SCHOOLS_FILE", os.path.join(ROOT_DIR, 'schools.json'))
+DEFAULT_SCHOOL_ID = os.getenv("DEFAULT_SCHOOL", "")
+
+# 학교 설정에 필요한 값
+REQUIRED_FIELDS = ("id", "name", "site_url", "atpt_code", "school_code")
+
+
+def _expand(school, defaults):
+    school = dict(defaults, **school)
+    missing = [field for field in REQUIRED_FIELDS if not school.get(field)]
+    if missing:
+        raise ValueError(f"schools.json: {school.get('id', '?')} 학교에 {', '.join(missing)} 값이 없습니다.")
+    for key in ("output_dir", "school_image"):
+        school[key] = school[key].format(**school)
+
+    school["output_path"] = os.path.normpath(os.path.join(ROOT_DIR, school["output_dir"]))
+    depth = os.path.relpath(school["output_path"], ROOT_DIR)
+    # 루트가 아닌 출력 디렉터리에서 공용 자산을 찾기 위한 기준 경로
+    school["base_href"] = "" if depth == "." else "../" * len(depth.split(os.sep))
+    school["notice_url"] = board_rss_url(school["site_url"], BOARDS["notice"])
+    school["letter_url"] = board_rss_url(school["site_url"], BOARDS["letter"])  # 가정통신문 RSS 피드
+    school["weather_path"] = os.path.join(school["output_path"], 'api', 'weather.json')
+    # 페이지 기준(base_href 적용 후) 날씨 스냅샷 경로
+    school["weather_url"] = os.path.relpath(school["weather_path"], ROOT_DIR).replace(os.sep, '/')
+    return school
+
+
+@lru_cache(maxsize=None)
+def _load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        registry = json.load(f)
+    defaults = registry.get("defaults", {})
+    schools = [_expand(school, defaults) for school in registry.get("schools", [])]
+    if not schools:
+        raise ValueError(f"{path}에 등록된 학교가 없습니다.")
+
+    default_id = DEFAULT_SCHOOL_ID or schools[0]["id"]
+    for school in schools:
+        school["key_prefix"] = "" if school["id"] == default_id else f"{school['id']}/"
+    return tuple(schools)
+
+
+def load_schools(path=None):
+    """
+    등록된 모든 학교 정보를 읽습니다. (같은 파일은 한 번만 읽음)
+
+    Returns:
+        list: 학교 정보 목록 (notice_url, letter_url, output_path, weather_path 등 계산된 값 포함)
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+        ValueError: 필수 값이 없거나 학교가 하나도 없는 경우
+    """
+    return list(_load(path or REGISTRY_PATH))
+
+
+def get_school(school_id=None, path=None):
+    """
+    학교 정보를 반환합니다. school_id가 없으면 기본 학교를 반환합니다.
+
+    Raises:
+        KeyError: 등록되지 않은 학교 id
+    """
+    schools = load_schools(path)
+    if school_id is None:
+        return next((s for s in schools if not s["key_prefix"]), schools[0])
+    for school in schools:
+        if school["id"] == school_id:
+            return school
+    raise KeyError(f"등록되지 않은 학교: {school_id}")
+
+
+def source_key(school, name):
+    """
+    학교별 크롤링 상태/저장소 키를 만듭니다. (예: "notices", "dongsan-m/notices")
+    """
+    return f"{school['key_prefix']}{name}"
@@ -0,0 +1,417 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+사이니지 정적/데이터 서버 (asyncio)
+교내 서버 한 대에서 생성된 HTML, api/ JSON 문서, CSS/JS 자산, 폰트, 이미지를 교실 화면 여러 대에 제공하는 서버입니다.
+GitHub Pages와 달리 캐시 헤더를 직접 정하므로 화면이 같은 파일을 다시 받지 않습니다.
+
+- 강한 ETag(내용 SHA-256)를 붙이고 If-None-Match가 같으면 304로 응답합니다.
+- 파일 이름에 내용 해시가 붙은 자산(assets/site.<해시>.css, 폰트 서브셋)은 1년 immutable로 캐시하고,
+  나머지(HTML, JSON, fonts.css)는 매번 ETag로 재검증합니다. (no-cache)
+- Accept-Encoding에 따라 brotli/gzip 본문을 보냅니다. data_api가 만든 .br/.gz 파일이 있으면 그대로 쓰고,
+  없으면 처음 요청할 때 한 번 압축해 메모리에 캐시합니다. (파일이 바뀌면 다시 압축)
+- 공개 디렉터리와 확장자만 제공하므로 .env, data/, src/는 노출되지 않습니다.
+- /events는 Server-Sent Events 채널입니다. 크롤러 데몬(daemon.py --serve)이 페이지를 다시 만들면
+  {"school", "dataset", "hash", "path"} 형식의 change 이벤트를 보내고, 페이지는 바뀐 영역만 다시 받습니다.
+
+사용법:
+    cd src
+    python signage_server.py                     # 0.0.0.0:8080
+    python signage_server.py --port 8000
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import deque
+from email.utils import formatdate
+from urllib.parse import unquote, urlsplit
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVER_HOST = os.getenv("SIGNAGE_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SIGNAGE_PORT", "8080"))
+
+# 연결 유지 시간 (초) - 화면은 몇 분마다 요청하므로 짧게
+KEEPALIVE_TIMEOUT = 15
+
+# 요청 헤더 최대 크기 (바이트)
+MAX_HEADER_SIZE = 16384
+
+# 압축할 최소 크기 (바이트)
+MIN_COMPRESS_SIZE = 512
+
+# 제공할 확장자 -> Content-Type
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+    ".json": "application/json; charset=utf-8",
+    ".xml": "application/rss+xml; charset=utf-8",
+    ".woff2": "font/woff2",
+    ".woff": "font/woff",
+    ".ttf": "font/ttf",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".svg": "image/svg+xml",
+    ".ico": "image/x-icon",
+}
+
+# 압축해서 보낼 형식 (이미지, woff2는 이미 압축됨)
+COMPRESSIBLE = frozenset([".html", ".css", ".js", ".json", ".xml", ".svg", ".ttf"])
+
+# 루트 아래에서 제공하지 않는 최상위 디렉터리
+PRIVATE_DIRS = frozenset(["data", "src", "node_modules"])
+
+# 내용 해시가 붙은 파일 (static_assets 번들, font_subset 서브셋)
+FINGERPRINTED_PATTERN = re.compile(r'\.[0-9a-f]{10}\.(?:css|js|woff2?|ttf)$')
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+# 압축 형식 -> (미리 만든 파일 확장자, 압축 함수), 선호 순서대로
+ENCODINGS = [("br", ".br", lambda data: brotli.compress(data, quality=11))] if brotli is not None else []
+ENCODINGS.append(("gzip", ".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0)))
+
+# Server-Sent Events 경로, 연결 유지용 주석 간격 (초), 다시 연결한 화면에 보낼 최근 이벤트 수
+EVENTS_PATH = "/events"
+EVENT_PING_INTERVAL = 25
+EVENT_HISTORY = 50
+
+# 생성 파일 이름 -> 이벤트 데이터셋 이름 (페이지의 SIGNAGE_CONFIG.dataset과 같음)
+DATASET_FILES = {
+    "digital_signage.html": "notices",
+    "family_letters.html": "letters",
+    "meal_info.html": "meals",
+    "school_schedule.html": "schedule",
+    "weather.json": "weather",
+}
+
+STATUS_TEXT = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+# 이벤트 채널 상태 (서버 이벤트 루프에서만 변경)
+_event_loop = None
+_subscribers = set()
+_event_history = deque(maxlen=EVENT_HISTORY)
+_event_id = 0
+
+# 경로 -> 파일 내용 캐시 {"stamp": (mtime_ns, size), "etag", "bodies": {인코딩: 본문}}
+_entries = {}
+_entries_lock = threading.Lock()
+
+
+def resolve_path(url_path, root_dir=ROOT_DIR):
+    """
+    요청 경로를 제공할 파일 경로로 바꿉니다.
+
+    Returns:
+        str: 파일 경로, 제공하지 않는 경로면 None
+    """
+    path = unquote(url_path)
+    if path.endswith("/"):
+        path += "index.html"
+    parts = [part for part in path.split("/") if part]
+    if not parts or any(part.startswith(".") or part == ".." for part in parts) or parts[0] in PRIVATE_DIRS:
+        return None
+    if os.path.splitext(parts[-1])[1].lower() not in CONTENT_TYPES:
+        return None
+    full_path = os.path.join(root_dir, *parts)
+    if not os.path.realpath(full_path).startswith(os.path.realpath(root_dir) + os.sep):
+        return None
+    return full_path if os.path.isfile(full_path) else None
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def load_entry(path):
+    """
+    파일 내용과 ETag를 캐시에서 읽습니다. 파일이 바뀌었으면(mtime/크기) 다시 읽습니다.
+
+    Returns:
+        dict: {"stamp", "etag", "bodies": {"identity": 원본}}
+    """
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _entries_lock:
+        entry = _entries.get(path)
+    if entry and entry["stamp"] == stamp:
+        return entry
+    data = _read(path)
+    entry = {"stamp": stamp, "etag": hashlib.sha256(data).hexdigest()[:32], "bodies": {"identity": data}}
+    with _entries_lock:
+        _entries[path] = entry
+    return entry
+
+
+def encoded_body(path, entry, encoding):
+    """
+    압축 본문을 반환합니다. 원본보다 새로운 미리 만든 파일(.br/.gz)이 있으면 그것을, 없으면 압축해 캐시합니다.
+    """
+    bodies = entry["bodies"]
+    if encoding in bodies:
+        return bodies[encoding]
+    suffix, compress = next((suffix, compress) for name, suffix, compress in ENCODINGS if name == encoding)
+    prebuilt = path + suffix
+    try:
+        use_prebuilt = os.stat(prebuilt).st_mtime_ns >= entry["stamp"][0]
+    except OSError:
+        use_prebuilt = False
+    body = _read(prebuilt) if use_prebuilt else compress(bodies["identity"])
+    with _entries_lock:
+        bodies[encoding] = body
+    return body
+
+
+def choose_encoding(accept_encoding, extension, size):
+    """Accept-Encoding과 파일 형식으로 보낼 압축 형식을 고릅니다. (압축하지 않으면 "identity")"""
+    if extension not in COMPRESSIBLE or size < MIN_COMPRESS_SIZE:
+        return "identity"
+    accepted = {token.split(";")[0].strip().lower() for token in accept_encoding.split(",")}
+    for name, _, _ in ENCODINGS:
+        if name in accepted:
+            return name
+    return "identity"
+
+
+def _etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # 압축 형식별 ETag("<해시>-br")와 약한 비교(W/)도 같은 내용으로 봄
+    tags = {tag.strip().removeprefix("W/").strip('"') for tag in if_none_match.split(",")}
+    return any(tag.split("-")[0] == etag for tag in tags)
+
+
+def build_response(method, url_path, headers, root_dir=ROOT_DIR):
+    """
+    요청 하나에 대한 응답을 만듭니다.
+
+    Returns:
+        tuple: (상태 코드, 응답 헤더 dict, 본문 bytes)
+    """
+    if method not in ("GET", "HEAD"):
+        return 405, {"Allow": "GET, HEAD"}, b""
+    path = resolve_path(urlsplit(url_path).path, root_dir)
+    if path is None:
+        return 404, {"Content-Type": "text/plain; charset=utf-8", "Cache-Control": REVALIDATE_CACHE}, b"Not Found"
+
+    entry = load_entry(path)
+    extension = os.path.splitext(path)[1].lower()
+    encoding = choose_encoding(headers.get("accept-encoding", ""), extension, len(entry["bodies"]["identity"]))
+    # 압축 형식마다 본문이 다르므로 강한 ETag에 형식을 붙임
+    etag = f'"{entry["etag"]}"' if encoding == "identity" else f'"{entry["etag"]}-{encoding}"'
+    response_headers = {
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE_CACHE if FINGERPRINTED_PATTERN.search(path) else REVALIDATE_CACHE,
+        "Last-Modified": formatdate(entry["stamp"][0] / 1e9, usegmt=True),
+    }
+    if extension in COMPRESSIBLE:
+        response_headers["Vary"] = "Accept-Encoding"
+    if _etag_matches(headers.get("if-none-match"), entry["etag"]):
+        return 304, response_headers, b""
+
+    body = entry["bodies"]["identity"] if encoding == "identity" else encoded_body(path, entry, encoding)
+    response_headers["Content-Type"] = CONTENT_TYPES[extension]
+    if encoding != "identity":
+        response_headers["Content-Encoding"] = encoding
+    return 200, response_headers, body
+
+
+async def _read_request(reader):
+    """요청 줄과 헤더를 읽습니다. 연결이 끝났으면 None을 반환합니다."""
+    try:
+        raw = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+    except (asyncio.IncompleteReadError, asyncio.TimeoutError, asyncio.LimitOverrunError, ConnectionError):
+        return None
+    lines = raw.decode('latin-1').split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ", 2)
+    except ValueError:
+        return None
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    return method.upper(), target, version, headers
+
+
+def _format_event(event_id, data):
+    return f"id: {event_id}\nevent: change\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode('utf-8')
+
+
+def _broadcast(data):
+    global _event_id
+    _event_id += 1
+    message = (_event_id, data)
+    _event_history.append(message)
+    for queue in list(_subscribers):
+        queue.put_nowait(message)
+
+
+def publish_event(data):
+    """
+    모든 /events 연결에 change 이벤트를 보냅니다. (다른 스레드에서 호출해도 됨)
+    서버가 실행 중이 아니면 아무것도 하지 않습니다.
+    """
+    if _event_loop is not None:
+        _event_loop.call_soon_threadsafe(_broadcast, data)
+
+
+def change_events(paths, schools, root_dir=ROOT_DIR):
+    """
+    바뀐 파일 목록을 (학교, 데이터셋)별 이벤트로 바꿉니다. 페이지/스냅샷이 아닌 파일은 무시합니다.
+
+    Args:
+        paths (list): 바뀐 파일 경로 (output_writer.reset_changes() 결과)
+        schools (list): school_registry의 학교 정보 목록
+
+    Returns:
+        list: {"school", "dataset", "hash", "path"} 이벤트 목록
+    """
+    school_dirs = {os.path.normpath(school["output_path"]): school["id"] for school in schools}
+    events = {}
+    for path in paths:
+        dataset = DATASET_FILES.get(os.path.basename(path))
+        if dataset is None:
+            continue
+        directory = os.path.dirname(os.path.normpath(path))
+        if dataset == "weather":
+            directory = os.path.dirname(directory)  # <출력 디렉터리>/api/weather.json
+        school_id = school_dirs.get(directory)
+        if school_id is None:
+            continue
+        try:
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()[:32]
+        except OSError:
+            continue
+        events[(school_id, dataset)] = {
+            "school": school_id,
+            "dataset": dataset,
+            "hash": digest,
+            "path": os.path.relpath(path, root_dir).replace(os.sep, '/')
+        }
+    return list(events.values())
+
+
+async def _stream_events(writer, headers):
+    """/events 연결에 이벤트를 계속 보냅니다. (연결이 끊길 때까지)"""
+    writer.write(("HTTP/1.1 200 OK\r\n"
+                  "Content-Type: text/event-stream; charset=utf-8\r\n"
+                  "Cache-Control: no-cache\r\n"
+                  "Connection: keep-alive\r\n\r\n"
+                  f"retry: {EVENT_PING_INTERVAL * 1000}\n\n").encode('utf-8'))
+    queue = asyncio.Queue()
+    # 다시 연결한 화면에는 놓친 이벤트를 먼저 보냄
+    last_id = headers.get("last-event-id", "")
+    if last_id.isdigit():
+        for event_id, data in _event_history:
+            if event_id > int(last_id):
+                writer.write(_format_event(event_id, data))
+    _subscribers.add(queue)
+    try:
+        await writer.drain()
+        while True:
+            try:
+                event_id, data = await asyncio.wait_for(queue.get(), EVENT_PING_INTERVAL)
+                writer.write(_format_event(event_id, data))
+            except asyncio.TimeoutError:
+                # 프록시/브라우저가 유휴 연결을 끊지 않도록 주석 전송
+                writer.write(b": ping\n\n")
+            await writer.drain()
+    finally:
+        _subscribers.discard(queue)
+
+
+async def handle_connection(reader, writer, root_dir=ROOT_DIR):
+    """연결 하나에서 keep-alive로 여러 요청을 처리합니다."""
+    try:
+        while True:
+            request = await _read_request(reader)
+            if request is None:
+                break
+            method, target, version, headers = request
+            if method == "GET" and urlsplit(target).path == EVENTS_PATH:
+                await _stream_events(writer, headers)
+                break
+            loop = asyncio.get_running_loop()
+            # 파일 읽기와 압축은 스레드에서 실행 (이벤트 루프를 막지 않음)
+            status, response_headers, body = await loop.run_in_executor(
+                None, build_response, method, target, headers, root_dir)
+            keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+            head = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+                    f"Date: {formatdate(usegmt=True)}",
+                    f"Content-Length: {len(body)}",
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+            head.extend(f"{name}: {value}" for name, value in response_headers.items())
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1'))
+            if method != "HEAD":
+                writer.write(body)
+            await writer.drain()
+            logging.debug(f"{method} {target} {status}")
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host=SERVER_HOST, port=SERVER_PORT, root_dir=ROOT_DIR):
+    """서버를 시작하고 종료될 때까지 요청을 처리합니다."""
+    global _event_loop
+    _event_loop = asyncio.get_running_loop()
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(reader, writer, root_dir), host, port, limit=MAX_HEADER_SIZE)
+    print(f"사이니지 서버 시작: http://{host}:{port}/ (루트: {root_dir})")
+    async with server:
+        await server.serve_forever()
+
+
+def start_in_thread(host=SERVER_HOST, port=SERVER_PORT, root_dir=ROOT_DIR):
+    """
+    서버를 백그라운드 스레드에서 시작합니다. (크롤러 데몬과 한 프로세스에서 실행할 때 사용)
+
+    Returns:
+        threading.Thread: 서버 스레드 (데몬 스레드이므로 프로세스가 끝나면 함께 종료)
+    """
+    thread = threading.Thread(target=lambda: asyncio.run(serve(host, port, root_dir)),
+                              name="signage-server", daemon=True)
+    thread.start()
+    return thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사이니지 정적/데이터 서버")
+    parser.add_argument("--host", default=SERVER_HOST, help="주소 (기본: 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help="포트 (기본: 8080)")
+    parser.add_argument("--root", default=ROOT_DIR, help="제공할 디렉터리 (기본: 저장소 루트)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, os.path.abspath(args.root)))
+    except KeyboardInterrupt:
+        print("사이니지 서버를 종료합니다.")
+
+
+if __name__ == "__main__":
+    main()
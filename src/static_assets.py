@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+정적 자산 빌드 모듈
+템플릿 디렉터리의 CSS/JS를 압축하고 내용 해시를 붙인 파일명(예: site.3f2a9c1b0d.css)으로
+assets/에 저장하는 모듈입니다. 파일명이 내용에 따라 바뀌므로 브라우저가 영구히 캐시할 수 있습니다.
+"""
+
+import glob
+import hashlib
+import os
+import re
+from functools import lru_cache
+import build_graph
+import font_subset
+from font_subset import SITES_DIR, update_font_subset
+from output_writer import write_if_changed
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+ASSET_DIR = os.path.join(ROOT_DIR, 'assets')
+
+# 번들 이름 -> 원본 파일 목록 (src/templates 기준)
+BUNDLES = {
+    "site.css": ("base.css",),
+    "signage.js": ("header.js",),
+    "board.css": ("board.css",),
+    "board.js": ("board.js",),
+    "meal.css": ("meal.css",),
+    "meal.js": ("meal.js",),
+    "schedule.css": ("schedule.css",),
+}
+
+HASH_LENGTH = 10
+
+CSS_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.S)
+CSS_PUNCT_PATTERN = re.compile(r'\s*([{};,>])\s*')
+CSS_COLON_PATTERN = re.compile(r':\s+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+JS_LINE_COMMENT_PATTERN = re.compile(r'^\s*//.*$', re.M)
+HASHED_NAME_PATTERN = re.compile(r'^(?P<stem>[\w-]+)\.[0-9a-f]{%d}\.(?P<ext>css|js)$' % HASH_LENGTH)
+ASSET_REF_PATTERN = re.compile(r'assets/([\w.-]+)')
+
+
+def minify_css(source):
+    """CSS에서 주석과 불필요한 공백을 제거합니다."""
+    css = CSS_COMMENT_PATTERN.sub('', source)
+    css = WHITESPACE_PATTERN.sub(' ', css)
+    css = CSS_PUNCT_PATTERN.sub(r'\1', css)
+    css = CSS_COLON_PATTERN.sub(':', css)
+    return css.replace(';}', '}').strip() + "\n"
+
+
+def minify_js(source):
+    """
+    JS에서 한 줄 주석, 들여쓰기, 빈 줄을 제거합니다.
+    문자열 안의 내용을 건드리지 않도록 줄 단위로만 처리합니다.
+    """
+    js = JS_LINE_COMMENT_PATTERN.sub('', source)
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line) + "\n"
+
+
+def _read_source(name):
+    with open(os.path.join(TEMPLATE_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def build_bundle(bundle_name):
+    """
+    번들을 압축하고 해시를 붙인 파일로 저장합니다.
+
+    Args:
+        bundle_name (str): BUNDLES의 번들 이름 (예: "site.css")
+
+    Returns:
+        str: 페이지에서 참조할 상대 경로 (예: "assets/site.3f2a9c1b0d.css")
+    """
+    stem, ext = bundle_name.rsplit('.', 1)
+    source = "\n".join(_read_source(name) for name in BUNDLES[bundle_name])
+    content = minify_css(source) if ext == "css" else minify_js(source)
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+    filename = f"{stem}.{digest}.{ext}"
+    write_if_changed(os.path.join(ASSET_DIR, filename), content)
+    return f"assets/{filename}"
+
+
+@lru_cache(maxsize=None)
+def bundle_urls():
+    """
+    모든 번들을 빌드하고 템플릿 값으로 쓸 경로를 반환합니다. (실행당 한 번)
+
+    Returns:
+        dict: 템플릿 값 이름 -> 경로 (예: {"site_css": "assets/site.3f2a9c1b0d.css", ...})
+    """
+    return {name.replace('.', '_'): build_bundle(name) for name in BUNDLES}
+
+
+def prune_assets(root_dir=ROOT_DIR):
+    """
+    현재 번들도 아니고 어떤 페이지에서도 참조하지 않는 이전 자산 파일을 삭제합니다.
+    아직 다시 생성되지 않은 페이지가 참조하는 이전 자산은 남겨 둡니다.
+
+    Returns:
+        list: 삭제한 파일 이름 목록
+    """
+    current = {os.path.basename(url) for url in bundle_urls().values()}
+    referenced = set()
+    pages = glob.glob(os.path.join(root_dir, '*.html')) + glob.glob(os.path.join(root_dir, SITES_DIR, '*', '*.html'))
+    for page in pages:
+        with open(page, 'r', encoding='utf-8') as f:
+            referenced.update(ASSET_REF_PATTERN.findall(f.read()))
+
+    removed = []
+    for path in glob.glob(os.path.join(ASSET_DIR, '*')):
+        name = os.path.basename(path)
+        if HASHED_NAME_PATTERN.match(name) and name not in current and name not in referenced:
+            os.remove(path)
+            removed.append(name)
+    return removed
+
+
+def finalize_assets(root_dir=ROOT_DIR):
+    """
+    페이지 생성이 끝난 뒤 호출합니다.
+    페이지에 쓰인 글자로 폰트 서브셋을 갱신하고 사용하지 않는 이전 자산을 정리한 뒤 빌드 그래프를 저장합니다.
+    페이지 노드와 스크립트 문구가 이전 실행과 같으면 글자 수집과 서브셋 생성을 건너뜁니다.
+
+    Returns:
+        list: 삭제한 자산 파일 이름 목록
+    """
+    scripts = hashlib.sha256()
+    for script in sorted(glob.glob(os.path.join(TEMPLATE_DIR, '*.js'))):
+        with open(script, 'rb') as f:
+            scripts.update(f.read())
+    build_graph.build(
+        "fonts.css",
+        [build_graph.node_keys(suffix=".html"), scripts.hexdigest(), font_subset.SUBSET_FLAVOR,
+         font_subset.subset is not None],
+        [font_subset.FONT_CSS_PATH],
+        lambda: update_font_subset(root_dir)
+    )
+    pruned = prune_assets(root_dir)
+    build_graph.save_graph()
+    return pruned
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+페이지 템플릿 엔진
+src/templates의 템플릿을 한 번만 컴파일하여 캐시하고, 렌더링 시에는 데이터에 따라
+바뀌는 부분만 채워 넣는 모듈입니다.
+
+템플릿 문법:
+    {{ name }}                   렌더링 시 채울 값
+    {% include "file" %}         컴파일 시 다른 파일(CSS, JS 등) 내용 삽입
+    {% extends "file" %}         공통 레이아웃 사용 (템플릿 첫 줄)
+    {% block name %}...{% endblock %}  레이아웃의 같은 이름 블록을 대체
+"""
+
+import hashlib
+import json
+import os
+import re
+import static_assets
+from functools import lru_cache
+from weather_collector import SNAPSHOT_URL
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+INCLUDE_PATTERN = re.compile(r'\{%\s*include\s+"([^"]+)"\s*%\}')
+EXTENDS_PATTERN = re.compile(r'^\s*\{%\s*extends\s+"([^"]+)"\s*%\}\s*\n?')
+BLOCK_PATTERN = re.compile(r'\{%\s*block\s+(\w+)\s*%\}(.*?)\{%\s*endblock\s*%\}', re.S)
+
+
+class Template:
+    """
+    컴파일된 템플릿
+    고정 문자열 조각과 값 이름 목록으로 나누어 두고, 렌더링 시 조각 사이에 값만 채웁니다.
+    """
+
+    def __init__(self, source):
+        parts = PLACEHOLDER_PATTERN.split(source)
+        self.literals = parts[0::2]
+        self.names = parts[1::2]
+
+    def render(self, **context):
+        """
+        템플릿에 값을 채워 문자열을 만듭니다.
+
+        Args:
+            **context: 템플릿 값 이름 -> 값
+
+        Returns:
+            str: 렌더링된 문자열
+
+        Raises:
+            KeyError: 템플릿에 필요한 값이 context에 없는 경우
+        """
+        out = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            out.append(str(context[name]))
+            out.append(literal)
+        return "".join(out)
+
+
+@lru_cache(maxsize=None)
+def load_source(name):
+    """템플릿 디렉터리의 파일 내용을 읽습니다. (캐시)"""
+    with open(os.path.join(TEMPLATE_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _resolve_includes(source):
+    # 포함된 파일 안의 include도 처리
+    while INCLUDE_PATTERN.search(source):
+        source = INCLUDE_PATTERN.sub(lambda m: load_source(m.group(1)), source)
+    return source
+
+
+def _resolve_extends(source):
+    match = EXTENDS_PATTERN.match(source)
+    if not match:
+        return source
+    blocks = {m.group(1): m.group(2) for m in BLOCK_PATTERN.finditer(source)}
+    layout = _resolve_extends(load_source(match.group(1)))
+    # 페이지에 없는 블록은 레이아웃의 기본 내용을 사용
+    return BLOCK_PATTERN.sub(lambda m: blocks.get(m.group(1), m.group(2)), layout)
+
+
+@lru_cache(maxsize=None)
+def get_template(name):
+    """
+    템플릿을 컴파일하여 반환합니다. 같은 템플릿은 한 번만 컴파일합니다.
+
+    Args:
+        name (str): src/templates 안의 템플릿 파일 이름
+
+    Returns:
+        Template: 컴파일된 템플릿
+    """
+    source = _resolve_includes(_resolve_extends(load_source(name)))
+    return Template(source)
+
+
+@lru_cache(maxsize=None)
+def template_fingerprint(name):
+    """
+    템플릿과 extends/include로 참조하는 모든 파일, 자산 번들 URL(내용 해시 포함)의 해시를 반환합니다.
+    빌드 그래프에서 페이지 노드의 입력으로 사용합니다.
+
+    Returns:
+        str: SHA-256 16진 문자열
+    """
+    digest = hashlib.sha256()
+    seen = set()
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        source = load_source(current)
+        digest.update(f"{current}\n{source}\n".encode('utf-8'))
+        extends = EXTENDS_PATTERN.match(source)
+        if extends:
+            pending.append(extends.group(1))
+        pending.extend(INCLUDE_PATTERN.findall(source))
+    digest.update(json.dumps(static_assets.bundle_urls(), sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def render(name, **context):
+    """
+    템플릿을 렌더링합니다.
+
+    Args:
+        name (str): src/templates 안의 템플릿 파일 이름
+        **context: 템플릿 값
+
+    Returns:
+        str: 렌더링된 문자열
+    """
+    return get_template(name).render(**context)
+
+
+def render_page(name, school_name, school=None, **context):
+    """
+    공통 레이아웃(헤더, 시계, 날씨)을 사용하는 사이니지 페이지를 렌더링합니다.
+    공통/페이지별 CSS, JS는 해시가 붙은 assets/ 파일로 참조하고,
+    날씨는 weather_collector가 만드는 스냅샷(api/weather.json)을 읽습니다.
+    페이지는 교내 서버의 /events 채널에서 자기 학교/데이터셋(dataset)의 change 이벤트를 받으면 본문만 다시 받습니다.
+
+    Args:
+        name (str): 페이지 템플릿 파일 이름
+        school_name (str): 학교 이름
+        school (dict, optional): school_registry의 학교 정보
+            출력 디렉터리가 루트가 아니면 <base href>를 넣고 학교별 날씨 스냅샷을 참조
+        **context: 페이지별 템플릿 값 (dataset: 페이지가 보여주는 데이터셋 이름, 예: "meals")
+
+    Returns:
+        str: 렌더링된 HTML
+    """
+    base_href = ""
+    if school is not None:
+        base_href = school["base_href"]
+        context.setdefault("weather_url", school["weather_url"])
+        context.setdefault("school_id", school["id"])
+    context.setdefault("school_id", "")
+    context.setdefault("dataset", "")
+    context.setdefault("weather_url", SNAPSHOT_URL)
+    context.setdefault("base_tag", f'\n    <base href="{base_href}">' if base_href else "")
+    for key, url in static_assets.bundle_urls().items():
+        context.setdefault(key, url)
+    return render(name, school_name=school_name, **context)
@@ -0,0 +1,44 @@
+// 계절별 이미지 슬라이드 기능
+// 학교 이미지 경로 (페이지에 처음 지정된 학교별 이미지)
+const SCHOOL_IMAGES = [document.querySelector('.school-img')?.getAttribute('src')].filter(Boolean);
+
+function getSeasonalImages() {
+    return SCHOOL_IMAGES;
+}
+
+let currentImageIndex = 0;
+let seasonalImages = [];
+
+function updateSchoolImage() {
+    const imgElement = document.querySelector('.school-img');
+    if (!imgElement) return;
+
+    // 현재 계절의 이미지 목록 가져오기
+    seasonalImages = getSeasonalImages();
+
+    // 페이드 아웃 효과
+    imgElement.classList.add('fade-out');
+
+    setTimeout(() => {
+        // 이미지 변경
+        imgElement.src = seasonalImages[currentImageIndex];
+
+        // 다음 이미지 인덱스로 이동
+        currentImageIndex = (currentImageIndex + 1) % seasonalImages.length;
+
+        // 페이드 인 효과
+        imgElement.classList.remove('fade-out');
+    }, 500);
+}
+
+// 페이지 로드 시 현재 계절에 맞는 초기 이미지 설정
+window.addEventListener('load', function() {
+    const seasonalImages = getSeasonalImages();
+    const imgElement = document.querySelector('.school-img');
+    if (imgElement && seasonalImages.length > 0) {
+        imgElement.src = seasonalImages[0];
+    }
+});
+
+// 10초마다 학교 이미지 슬라이드
+setInterval(updateSchoolImage, 10 * 1000);
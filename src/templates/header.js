@@ -0,0 +1,325 @@
+// 날씨 캐시 설정
+// 날씨는 서버에서 수집한 스냅샷(SIGNAGE_CONFIG.weatherUrl)을 읽으므로 외부 API를 직접 호출하지 않음
+const WEATHER_CACHE_KEY = 'headerWeatherData_v3';
+const WEATHER_TIMESTAMP_KEY = 'headerWeatherTimestamp_v3';
+const WEATHER_UPDATE_INTERVAL = 10 * 60 * 1000; // 10분 (밀리초)
+
+function updateDateTime() {
+    const now = new Date();
+    const year = now.getFullYear();
+    const month = String(now.getMonth() + 1).padStart(2, '0');
+    const day = String(now.getDate()).padStart(2, '0');
+    const weekDays = ['일', '월', '화', '수', '목', '금', '토'];
+    const weekDay = weekDays[now.getDay()];
+
+    let hours = now.getHours();
+    const ampm = hours >= 12 ? '오후' : '오전';
+    hours = hours % 12;
+    hours = hours ? hours : 12; 
+    const displayHours = String(hours).padStart(2, '0');
+    const minutes = String(now.getMinutes()).padStart(2, '0');
+
+    const dateString = `${year}.${month}.${day} ${weekDay}요일`;
+    const timeString = `${ampm} ${displayHours}:${minutes}`;
+
+    document.getElementById('date-time').innerHTML = `${dateString}<br>${timeString}`;
+}
+
+// 캐시에서 날씨 데이터 가져오기
+function getCachedWeatherData() {
+    try {
+        const cachedData = localStorage.getItem(WEATHER_CACHE_KEY);
+        const timestamp = localStorage.getItem(WEATHER_TIMESTAMP_KEY);
+
+        if (cachedData && timestamp) {
+            const data = JSON.parse(cachedData);
+            const lastUpdate = parseInt(timestamp);
+            const now = Date.now();
+
+            // 10분이 지나지 않았다면 캐시된 데이터 사용
+            if (now - lastUpdate < WEATHER_UPDATE_INTERVAL) {
+                console.log('캐시된 헤더 날씨 데이터 사용 중...');
+                return data;
+            }
+        }
+    } catch (error) {
+        console.error('날씨 캐시 데이터 읽기 실패:', error);
+    }
+    return null;
+}
+
+// 날씨 데이터를 캐시에 저장하기
+function saveWeatherDataToCache(data) {
+    try {
+        localStorage.setItem(WEATHER_CACHE_KEY, JSON.stringify(data));
+        localStorage.setItem(WEATHER_TIMESTAMP_KEY, Date.now().toString());
+        console.log('헤더 날씨 데이터가 캐시에 저장되었습니다.');
+    } catch (error) {
+        console.error('날씨 캐시 저장 실패:', error);
+    }
+}
+
+// 날씨 데이터를 화면에 표시하는 함수
+function displayWeatherData(weatherData) {
+    const temp = Math.round(weatherData.main.temp);
+    const weatherInfo = getWeatherInfo(
+        weatherData.weather[0].main,
+        weatherData.weather[0].id,
+        weatherData.isDay
+    );
+    document.querySelector('.weather').innerHTML =
+        `<img class='weather-icon' src='images/${weatherInfo.icon}' alt='날씨아이콘'>
+         <div class='weather-content'>
+            <div>${weatherInfo.text}</div>
+            <div class='weather-temp'>${temp}℃</div>
+         </div>`;
+}
+
+// OpenWeatherMap API 2.5와 커스텀 날씨 아이콘 매핑
+// (설명 문구는 한국어로 수집되므로 세부 상태는 날씨 코드로 구분)
+function getWeatherInfo(weatherMain, weatherId, isDay = true) {
+    // 메인 날씨 조건별 매핑
+    const mainWeatherMap = {
+        'Clear': { 
+            text: '맑음', 
+            icon: 'weather/1.png' // 태양 아이콘
+        },
+        'Clouds': {
+            text: '구름',
+            icon: getCloudIcon(weatherId) // 구름 정도에 따라 다른 아이콘
+        },
+        'Rain': {
+            text: '비',
+            icon: getRainIcon(weatherId) // 비의 강도에 따라 다른 아이콘
+        },
+        'Drizzle': {
+            text: '이슬비',
+            icon: 'weather/14.png' // 물방울 아이콘
+        },
+        'Thunderstorm': {
+            text: '뇌우',
+            icon: 'weather/7.png' // 번개 아이콘
+        },
+        'Snow': {
+            text: '눈',
+            icon: 'weather/5.png' // 눈송이 아이콘
+        },
+        'Mist': {
+            text: '안개',
+            icon: 'weather/16.png' // 안개 아이콘
+        },
+        'Fog': {
+            text: '짙은 안개',
+            icon: 'weather/16.png' // 안개 아이콘
+        },
+        'Smoke': {
+            text: '연기',
+            icon: 'weather/16.png' // 안개 아이콘 (비슷한 시야 제한)
+        },
+        'Haze': {
+            text: '실안개',
+            icon: 'weather/16.png' // 안개 아이콘
+        },
+        'Dust': {
+            text: '먼지',
+            icon: 'weather/11.png' // 바람 아이콘
+        },
+        'Sand': {
+            text: '모래바람',
+            icon: 'weather/11.png' // 바람 아이콘
+        },
+        'Ash': {
+            text: '화산재',
+            icon: 'weather/16.png' // 안개 아이콘
+        },
+        'Squall': {
+            text: '돌풍',
+            icon: 'weather/11.png' // 바람 아이콘
+        },
+        'Tornado': {
+            text: '토네이도',
+            icon: 'weather/11.png' // 바람 아이콘
+        }
+    };
+
+    // 구름 상태에 따른 아이콘 선택
+    function getCloudIcon(id) {
+        if (id === 801) {
+            return 'weather/3.png'; // 부분적으로 구름 낀 맑은 날씨 (few clouds)
+        } else if (id === 802 || id === 803) {
+            return 'weather/2.png'; // 구름 많음 (scattered/broken clouds)
+        } else if (id === 804) {
+            return 'weather/8.png'; // 완전히 흐림
+        }
+        return 'weather/2.png'; // 기본 구름 아이콘
+    }
+
+    // 비의 강도에 따른 아이콘 선택
+    function getRainIcon(id) {
+        if (id === 500 || id === 520) {
+            return 'weather/14.png'; // 가벼운 비 (물방울)
+        } else if (id >= 502 && id <= 504) {
+            return 'weather/6.png'; // 폭우 (heavy/extreme rain)
+        }
+        return 'weather/4.png'; // 기본 비 아이콘
+    }
+
+    // 야간 모드 처리 (달 아이콘 사용)
+    function getNightIcon(weatherMain) {
+        if (weatherMain === 'Clear') {
+            return 'weather/15.png'; // 달과 별 아이콘
+        }
+        // 다른 날씨는 동일한 아이콘 사용
+        return mainWeatherMap[weatherMain]?.icon || 'weather/1.png';
+    }
+
+    // 메인 날씨 정보 가져오기
+    let weatherInfo = mainWeatherMap[weatherMain] || { 
+        text: weatherMain, 
+        icon: 'weather/1.png' 
+    };
+
+    // 야간인 경우 아이콘 변경
+    if (!isDay && weatherMain === 'Clear') {
+        weatherInfo.icon = getNightIcon(weatherMain);
+    }
+
+    return weatherInfo;
+}
+
+// 초기 날씨 데이터 로드 함수
+async function loadInitialWeather() {
+    // 먼저 캐시에서 데이터 확인
+    const cachedData = getCachedWeatherData();
+    if (cachedData) {
+        console.log('캐시된 헤더 날씨 데이터로 초기 로드 중...');
+        displayWeatherData(cachedData);
+        return;
+    }
+
+    // 캐시에 데이터가 없거나 만료된 경우에만 스냅샷 요청
+    console.log('헤더 날씨 데이터 초기 로드 중...');
+    await fetchWeather();
+}
+
+// 날씨 정보 업데이트 함수 (10분마다)
+async function updateWeatherIfNeeded() {
+    // 먼저 캐시에서 데이터 확인
+    const cachedData = getCachedWeatherData();
+    if (cachedData) {
+        // 캐시가 유효하면 표시 함수 호출하지 않음 (이미 표시되어 있음)
+        console.log('캐시된 헤더 날씨 데이터가 유효합니다.');
+        return;
+    }
+
+    // 캐시에 데이터가 없거나 만료된 경우에만 스냅샷 요청
+    console.log('헤더 날씨 정보 업데이트 중...');
+    await fetchWeather();
+}
+
+async function fetchWeather() {
+    try {
+        // 서버 스냅샷은 바뀐 경우에만 새로 받도록 재검증 요청
+        const res = await fetch(SIGNAGE_CONFIG.weatherUrl, { cache: 'no-cache' });
+        const snapshot = await res.json();
+        const data = snapshot.current;
+
+        if (!data || !data.weather || !data.weather[0]) throw new Error('Invalid weather data');
+
+        // 현재 시간을 기준으로 낮/밤 판단
+        const now = new Date();
+        const currentHour = now.getHours();
+        const isDay = currentHour >= 6 && currentHour < 18; // 6시~18시는 낮
+
+        // isDay 정보를 데이터에 추가
+        data.isDay = isDay;
+
+        // 데이터를 화면에 표시
+        displayWeatherData(data);
+
+        // 성공적으로 데이터를 가져왔다면 캐시에 저장
+        saveWeatherDataToCache(data);
+
+    } catch (e) {
+        console.error("Weather fetch error: ", e);
+        document.querySelector('.weather').textContent = '날씨 정보를 불러올 수 없습니다';
+    }
+}
+
+// 교내 서버 변경 알림 (signage_server.py의 /events)
+// 연결되어 있으면 데이터가 바뀔 때만 해당 영역을 다시 받고, 날씨 주기 확인은 건너뜀
+let liveConnected = false;
+
+// 페이지를 다시 받아 헤더와 스크립트를 뺀 본문 영역만 교체
+async function refreshContent() {
+    try {
+        const res = await fetch(location.href, { cache: 'no-cache' });
+        if (!res.ok) throw new Error(`HTTP ${res.status}`);
+        const doc = new DOMParser().parseFromString(await res.text(), 'text/html');
+
+        // CSS/JS 번들이 바뀌었으면 본문만 바꿀 수 없으므로 전체 새로고침
+        const assetUrls = d => [...d.querySelectorAll('link[rel=stylesheet], script[src]')]
+            .map(el => el.getAttribute('href') || el.getAttribute('src')).join(' ');
+        if (assetUrls(doc) !== assetUrls(document)) {
+            location.reload();
+            return;
+        }
+
+        const isContent = el => el.tagName !== 'HEADER' && el.tagName !== 'SCRIPT';
+        [...document.body.children].filter(isContent).forEach(el => el.remove());
+        const firstScript = document.body.querySelector(':scope > script');
+        [...doc.body.children].filter(isContent).forEach(el => {
+            document.body.insertBefore(document.adoptNode(el), firstScript);
+        });
+        document.title = doc.title;
+        // 페이지 스크립트가 새 내용에 맞춰 글자 크기 등을 다시 계산하도록 알림
+        window.dispatchEvent(new Event('resize'));
+        console.log('바뀐 본문을 다시 불러왔습니다.');
+    } catch (error) {
+        console.error('본문 갱신 실패:', error);
+    }
+}
+
+function connectChangeEvents() {
+    if (!window.EventSource || !SIGNAGE_CONFIG.eventsUrl) return;
+
+    const source = new EventSource(SIGNAGE_CONFIG.eventsUrl);
+    source.addEventListener('open', () => { liveConnected = true; });
+    source.addEventListener('error', () => {
+        liveConnected = false;
+        // 이벤트 채널이 없는 서버(GitHub Pages 등)면 다시 연결하지 않음
+        if (source.readyState === EventSource.CLOSED) source.close();
+    });
+    source.addEventListener('change', event => {
+        const change = JSON.parse(event.data);
+        if (change.school !== SIGNAGE_CONFIG.school) return;
+        if (change.dataset === 'weather') {
+            fetchWeather();
+        } else if (change.dataset === SIGNAGE_CONFIG.dataset) {
+            refreshContent();
+        }
+    });
+}
+
+// 초기 로드 및 주기적 업데이트 설정
+setInterval(updateDateTime, 1000);
+updateDateTime();
+loadInitialWeather();
+connectChangeEvents();
+
+// 5분마다 날씨 업데이트 체크 (변경 알림을 받는 중이면 건너뜀)
+setInterval(() => {
+    if (!liveConnected) updateWeatherIfNeeded();
+}, 5 * 60 * 1000);
+
+// 페이지가 포커스를 받았을 때 업데이트 체크
+window.addEventListener('focus', function() {
+    updateWeatherIfNeeded();
+});
+
+// 페이지가 보이게 될 때 업데이트 체크 (탭 전환 시)
+document.addEventListener('visibilitychange', function() {
+    if (!document.hidden) {
+        updateWeatherIfNeeded();
+    }
+});
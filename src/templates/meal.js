@@ -0,0 +1,92 @@
+// 동적 글씨 크기 조절 함수
+function adjustFontSizeForScreen() {
+    const viewportHeight = window.innerHeight;
+    const viewportWidth = window.innerWidth;
+    const mealContainer = document.querySelector('.meal-container');
+    const pageHeader = document.querySelector('.page-header');
+
+    if (!mealContainer || !pageHeader) return;
+
+    // 화면 높이에 따른 동적 조절
+    if (viewportHeight < 600) {
+        // 매우 작은 화면
+        document.body.style.setProperty('--dynamic-font-scale', '0.8');
+        mealContainer.style.maxHeight = 'calc(100vh - 120px)';
+        mealContainer.style.overflowY = 'auto';
+    } else if (viewportHeight < 800) {
+        // 작은 화면
+        document.body.style.setProperty('--dynamic-font-scale', '0.9');
+        mealContainer.style.maxHeight = 'calc(100vh - 150px)';
+        mealContainer.style.overflowY = 'auto';
+    } else {
+        // 큰 화면
+        document.body.style.setProperty('--dynamic-font-scale', '1');
+        mealContainer.style.maxHeight = 'none';
+        mealContainer.style.overflowY = 'visible';
+    }
+
+    // 화면 너비가 75% 이하일 때 추가 조절
+    if (viewportWidth < window.screen.width * 0.75) {
+        const currentScale = getComputedStyle(document.body).getPropertyValue('--dynamic-font-scale');
+        const newScale = Math.min(parseFloat(currentScale) * 0.9, 0.8);
+        document.body.style.setProperty('--dynamic-font-scale', newScale.toString());
+    }
+}
+
+// CSS 변수를 활용한 동적 스타일 적용
+function applyDynamicStyles() {
+    const style = document.createElement('style');
+    style.textContent = `
+        :root {
+            --dynamic-font-scale: 1;
+        }
+
+        .meal-menu {
+            font-size: calc(1.7rem * var(--dynamic-font-scale)) !important;
+        }
+
+        .meal-date {
+            font-size: calc(1.7rem * var(--dynamic-font-scale)) !important;
+        }
+
+    .allergen {
+        font-size: calc(1.4rem * var(--dynamic-font-scale)) !important;
+    }
+
+    .calorie {
+        font-size: calc(1.4rem * var(--dynamic-font-scale)) !important;
+    }
+
+        .notice-text {
+            font-size: calc(1.6rem * var(--dynamic-font-scale)) !important;
+        }
+
+    .header-main-title {
+        font-size: calc(4.8rem * var(--dynamic-font-scale)) !important;
+    }
+
+    .page-header .weather, 
+    .page-header .date-time,
+    .page-header .school-name {
+        font-size: calc(1.9rem * var(--dynamic-font-scale)) !important;
+    }
+
+    .page-header .weather-temp {
+        font-size: calc(1.9rem * var(--dynamic-font-scale)) !important;
+    }
+    `;
+    document.head.appendChild(style);
+}
+
+applyDynamicStyles();
+adjustFontSizeForScreen();
+
+// 화면 크기 변경 시 동적 조절
+window.addEventListener('resize', function() {
+    adjustFontSizeForScreen();
+});
+
+// 페이지 로드 완료 후 추가 조절
+window.addEventListener('load', function() {
+    setTimeout(adjustFontSizeForScreen, 100);
+});
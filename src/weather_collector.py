@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+날씨/대기질 수집 모듈
+OpenWeatherMap 현재 날씨와 5일 예보, 에어코리아 측정소 대기질을 한 번에 수집하여
+api/weather.json 스냅샷 하나로 저장합니다.
+모든 페이지는 외부 API 대신 이 스냅샷을 읽으므로 화면 수와 관계없이 외부 호출은
+수집 주기마다 한 번씩만 발생하고, API 키도 페이지에 포함되지 않습니다.
+여러 학교를 수집할 때는 학교별 스냅샷(<출력 디렉터리>/api/weather.json)을 만들되,
+위치와 측정소가 같은 학교끼리는 한 번 수집한 값을 함께 씁니다.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+import http_client
+from concurrent_fetch import run_concurrently
+from dotenv import load_dotenv
+from output_writer import write_if_changed, report_changes
+from school_registry import load_schools
+
+# .env 파일 로드
+load_dotenv()
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SNAPSHOT_PATH = os.path.join(ROOT_DIR, 'api', 'weather.json')
+# 페이지에서 참조할 스냅샷 경로
+SNAPSHOT_URL = "api/weather.json"
+
+OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY", "")
+AIRKOREA_API_KEY = os.getenv("AIRKOREA_API_KEY", "")
+
+# 기본 날씨 위치 (율곡중학교)와 대기질 측정소 - 학교별 위치는 schools.json의 weather
+WEATHER_LAT = 37.7599
+WEATHER_LON = 126.7733
+AIR_STATION_NAME = "파주읍"
+
+OPENWEATHER_CURRENT_URL = "https://api.openweathermap.org/data/2.5/weather"
+OPENWEATHER_FORECAST_URL = "https://api.openweathermap.org/data/2.5/forecast"
+AIRKOREA_URL = "https://apis.data.go.kr/B552584/ArpltnInforInqireSvc/getMsrstnAcctoRltmMesureDnsty"
+
+# 스냅샷 갱신 주기 - 이보다 최근 스냅샷이 있으면 외부 API를 호출하지 않음
+REFRESH_INTERVAL = timedelta(minutes=int(os.getenv("WEATHER_REFRESH_MINUTES", "50")))
+
+# 위치별 마지막 수집 결과 (같은 위치의 학교끼리 공유) - (위도, 경도, 측정소) -> (수집 시각, 결과)
+_location_results = {}
+_location_locks = {}
+_location_lock = threading.Lock()
+
+# 측정값을 쓸 수 없는 대기질 상태
+AIR_INVALID_FLAGS = ("통신장애", "점검 및 교정")
+
+
+def _trim_condition(weather):
+    """OpenWeatherMap 날씨 상태에서 페이지가 쓰는 값만 남깁니다."""
+    return [{key: w.get(key) for key in ("id", "main", "description", "icon")} for w in weather]
+
+
+def fetch_current_weather(api_key=OPENWEATHER_API_KEY, lat=WEATHER_LAT, lon=WEATHER_LON):
+    """
+    현재 날씨를 가져옵니다.
+
+    Returns:
+        dict: 현재 날씨 (OpenWeatherMap 응답 형식 일부), 실패 시 None
+    """
+    params = {"lat": lat, "lon": lon, "appid": api_key, "units": "metric", "lang": "kr"}
+    try:
+        response = http_client.get(OPENWEATHER_CURRENT_URL, params=params)
+        response.raise_for_status()
+        data = response.json()
+        main = data["main"]
+        return {
+            "dt": data.get("dt"),
+            "main": {key: main.get(key) for key in ("temp", "feels_like", "humidity", "pressure")},
+            "weather": _trim_condition(data["weather"]),
+            "wind": {"speed": data.get("wind", {}).get("speed")}
+        }
+    except Exception as e:
+        logging.error(f"현재 날씨 수집 실패: {e}")
+        return None
+
+
+def fetch_forecast(api_key=OPENWEATHER_API_KEY, lat=WEATHER_LAT, lon=WEATHER_LON):
+    """
+    3시간 간격 5일 예보를 가져옵니다.
+
+    Returns:
+        dict: {"list": [{"dt", "main": {"temp"}, "weather"}, ...]}, 실패 시 None
+    """
+    params = {"lat": lat, "lon": lon, "appid": api_key, "units": "metric", "lang": "kr"}
+    try:
+        response = http_client.get(OPENWEATHER_FORECAST_URL, params=params)
+        response.raise_for_status()
+        data = response.json()
+        return {
+            "list": [
+                {
+                    "dt": item["dt"],
+                    "main": {"temp": item["main"]["temp"]},
+                    "weather": _trim_condition(item["weather"])
+                }
+                for item in data["list"]
+            ]
+        }
+    except Exception as e:
+        logging.error(f"날씨 예보 수집 실패: {e}")
+        return None
+
+
+def fetch_air_quality(api_key=AIRKOREA_API_KEY, station_name=AIR_STATION_NAME):
+    """
+    측정소의 가장 최근 유효한 대기질 측정값을 가져옵니다.
+
+    Returns:
+        dict: {"stationName", "dataTime", "pm10Value", "pm25Value"}, 실패 시 None
+    """
+    params = {
+        "serviceKey": api_key,
+        "returnType": "json",
+        "numOfRows": "10",
+        "pageNo": "1",
+        "stationName": station_name,
+        "dataTerm": "DAILY",
+        "ver": "1.0"
+    }
+    try:
+        response = http_client.get(AIRKOREA_URL, params=params)
+        response.raise_for_status()
+        # 인증 오류, 요청 한도 초과 등은 JSON이 아닌 XML로 응답함
+        if response.text.lstrip().startswith('<'):
+            raise ValueError(f"API 오류 응답: {response.text.strip()[:200]}")
+        items = json.loads(response.text)["response"]["body"]["items"]
+        if not items:
+            logging.warning("대기질 측정 데이터가 없습니다.")
+            return None
+        # 통신장애가 아니고 실제 측정값이 있는 가장 최근 데이터 (없으면 첫 번째 데이터)
+        latest = next((item for item in items
+                       if item.get("pm10Value") not in ("-", None)
+                       and item.get("pm10Flag") not in AIR_INVALID_FLAGS), items[0])
+        return {
+            "stationName": latest.get("stationName") or station_name,
+            "dataTime": latest.get("dataTime"),
+            "pm10Value": latest.get("pm10Value"),
+            "pm25Value": latest.get("pm25Value")
+        }
+    except Exception as e:
+        logging.error(f"대기질 수집 실패: {e}")
+        return None
+
+
+def load_snapshot(path=SNAPSHOT_PATH):
+    """저장된 스냅샷을 읽습니다. 없으면 None을 반환합니다."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_fresh(snapshot, now=None):
+    """스냅샷이 갱신 주기 안에 만들어졌는지 확인합니다."""
+    try:
+        updated_at = datetime.fromisoformat(snapshot["updated_at"])
+    except (TypeError, KeyError, ValueError):
+        return False
+    return (now or datetime.now()) - updated_at < REFRESH_INTERVAL
+
+
+def _school_location(school):
+    weather = (school or {}).get("weather", {})
+    return (weather.get("lat", WEATHER_LAT), weather.get("lon", WEATHER_LON),
+            weather.get("air_station", AIR_STATION_NAME))
+
+
+def _fetch_location(location, now):
+    """
+    위치 하나의 현재 날씨, 예보, 대기질을 동시에 수집합니다.
+    같은 위치를 갱신 주기 안에 이미 수집했으면 그 결과를 그대로 돌려줍니다.
+    모든 항목이 실패한 결과는 캐시하지 않으므로 다음 호출에서 바로 다시 수집합니다.
+    """
+    with _location_lock:
+        lock = _location_locks.setdefault(location, threading.Lock())
+    with lock:
+        cached = _location_results.get(location)
+        if cached and now - cached[0] < REFRESH_INTERVAL:
+            return cached[1]
+        lat, lon, station = location
+        results = run_concurrently({
+            "current": lambda: fetch_current_weather(lat=lat, lon=lon),
+            "forecast": lambda: fetch_forecast(lat=lat, lon=lon),
+            "air_quality": lambda: fetch_air_quality(station_name=station)
+        })
+        if any(value is not None for value in results.values()):
+            _location_results[location] = (now, results)
+        return results
+
+
+def collect_weather(force=False, now=None, school=None):
+    """
+    현재 날씨, 예보, 대기질을 동시에 수집하여 스냅샷을 만듭니다.
+    실패한 항목은 이전 스냅샷의 값을 그대로 사용합니다.
+
+    Args:
+        force (bool): 갱신 주기와 관계없이 수집할지 여부 (FORCE_REFRESH 환경변수로도 지정 가능)
+        now (datetime, optional): 기준 시각, 없으면 현재 시각
+        school (dict, optional): school_registry의 학교 정보, 없으면 기본 위치와 api/weather.json 사용
+
+    Returns:
+        dict: 새 스냅샷, 이전 스냅샷이 아직 유효하거나 모든 항목을 가져오지 못했으면 None (이전 스냅샷 유지)
+    """
+    now = now or datetime.now()
+    previous = load_snapshot(school["weather_path"] if school else SNAPSHOT_PATH) or {}
+    if not (force or os.getenv("FORCE_REFRESH")) and is_fresh(previous, now):
+        print("날씨 스냅샷이 최신이므로 수집을 생략합니다.")
+        return None
+
+    location = _school_location(school)
+    results = _fetch_location(location, now)
+    if all(value is None for value in results.values()):
+        logging.error("날씨 정보를 하나도 가져오지 못해 이전 스냅샷을 유지합니다.")
+        return None
+    snapshot = {
+        "updated_at": now.isoformat(timespec="seconds"),
+        "location": {"lat": location[0], "lon": location[1], "station": location[2]}
+    }
+    for key, value in results.items():
+        snapshot[key] = value if value is not None else previous.get(key)
+    return snapshot
+
+
+def publish_weather(snapshot, path=SNAPSHOT_PATH):
+    """
+    스냅샷을 api/weather.json으로 저장합니다.
+    수집된 항목이 하나도 없거나 수집 시각(updated_at)만 다르면 기존 파일을 그대로 둡니다.
+    날씨만 바뀐 경우에는 배포하지 않도록 background 파일로 저장합니다. (화면은 스냅샷을 주기적으로 다시 읽음)
+
+    Returns:
+        bool: 파일이 새로 저장되었는지 여부
+    """
+    if not any(snapshot.get(key) for key in ("current", "forecast", "air_quality")):
+        logging.error("날씨 정보를 하나도 가져오지 못했습니다.")
+        return False
+    previous = load_snapshot(path) or {}
+    if ({key: value for key, value in previous.items() if key != "updated_at"}
+            == {key: value for key, value in snapshot.items() if key != "updated_at"}):
+        return False
+    content = json.dumps(snapshot, ensure_ascii=False, separators=(',', ':'))
+    return write_if_changed(path, content + "\n", background=True)
+
+
+def update_weather(force=False):
+    """
+    등록된 모든 학교의 날씨 스냅샷을 수집하고 저장합니다.
+    갱신 주기 안인 스냅샷은 그대로 두고, 같은 위치의 학교는 한 번만 수집합니다.
+
+    Returns:
+        bool: 새로 저장된 스냅샷이 있는지 여부
+    """
+    schools = load_schools()
+    snapshots = run_concurrently({
+        school["id"]: (lambda school=school: collect_weather(force=force, school=school)) for school in schools
+    })
+    updated = False
+    for school in schools:
+        snapshot = snapshots[school["id"]]
+        if snapshot is not None and publish_weather(snapshot, school["weather_path"]):
+            updated = True
+    return updated
+
+
+def main():
+    update_weather()
+    report_changes()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
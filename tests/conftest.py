@@ -0,0 +1,5 @@
+import os
+import sys
+
+# src/의 모듈은 평면 import(import content_store)를 사용하므로 src를 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+import content_store
+import meal_crawler
+import neis_client
+import school_registry
+import school_schedule_crawler
+from school_registry import source_key
+
+MEAL_ROW = {"MLSV_YMD": "20250915", "MMEAL_SC_CODE": "2", "MMEAL_SC_NM": "중식",
+            "DDISH_NM": "쌀밥<br/>미역국 (5.6)", "ORPLC_INFO": "", "CAL_INFO": "700 Kcal"}
+SCHEDULE_ROW = {"AA_YMD": "20250917", "EVENT_NM": "체육대회", "SBTR_DD_SC_NM": "수업일"}
+
+
+@pytest.fixture
+def schools(tmp_path, monkeypatch):
+    registry = tmp_path / "schools.json"
+    registry.write_text(json.dumps({
+        "defaults": {"atpt_code": "J10", "output_dir": "sites/{id}", "school_image": "images/{name}.jpg"},
+        "schools": [
+            {"id": "yulgok-m", "name": "율곡중학교", "site_url": "https://yulgok-m.goepj.kr/yulgok-m",
+             "school_code": "7681015", "output_dir": "."},
+            {"id": "dongsan-m", "name": "동산중학교", "site_url": "https://dongsan-m.goepj.kr/dongsan-m",
+             "school_code": "7681016"},
+        ]
+    }), encoding='utf-8')
+    monkeypatch.setattr(content_store, "DB_PATH", str(tmp_path / "content.db"))
+    return school_registry.load_schools(str(registry))
+
+
+def _fake_fetch_range(row):
+    def fetch_range(service, params, start, end, **kwargs):
+        return {"rows": [dict(row, SD_SCHUL_CODE=params["SD_SCHUL_CODE"])], "changed": True}
+    return fetch_range
+
+
+def test_meals_are_stored_for_every_registry_school(schools, monkeypatch):
+    monkeypatch.setattr(neis_client, "fetch_range", _fake_fetch_range(MEAL_ROW))
+    for school in schools:
+        key = source_key(school, "meals")
+        rows = meal_crawler.get_meal_info("KEY", school["school_code"], "20250915", "20250919",
+                                          atpt_code=school["atpt_code"], source=key, raise_errors=True)
+        assert len(rows) == 1
+        stored = content_store.query_items(key, "2025-09-15", "2025-09-19")
+        assert [row["SD_SCHUL_CODE"] for row in stored] == [school["school_code"]]
+
+
+def test_schedules_are_stored_for_every_registry_school(schools, monkeypatch):
+    monkeypatch.setattr(neis_client, "fetch_range", _fake_fetch_range(SCHEDULE_ROW))
+    for school in schools:
+        key = source_key(school, "schedules")
+        rows = school_schedule_crawler.get_schedule_range("KEY", school["atpt_code"], school["school_code"],
+                                                          "20250901", "20250930", source=key, raise_errors=True)
+        assert len(rows) == 1
+        stored = content_store.query_items(key, "2025-09-01", "2025-09-30")
+        assert [row["EVENT_NM"] for row in stored] == ["체육대회"]